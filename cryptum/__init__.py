@@ -1,34 +1,5 @@
-# Crypto Hoisting
-from .crypto.aes import encrypt, decrypt
-from .crypto.Argon2id import hash as argon2id_hash, verify as argon2id_verify
-from .crypto.hmac import sign as hmac_sign, verify as hmac_verify
-from .crypto.Sha256 import hash as sha256_hash, verify as sha256_verify
-
-# Token Hoisting
-from .tokens.api_keys import generate as generate_api_key
-from .tokens.csrf_tokens import generate as generate_csrf_token
-from .tokens.email_verification import generate as generate_email_verification
-from .tokens.jwt_tokens import encode as encode_jwt, decode as decode_jwt
-from .tokens.magic_links import generate as generate_magic_link
-from .tokens.nonce import generate as generate_nonce
-from .tokens.password_reset import generate as generate_password_reset
-from .tokens.reauth_tokens import generate as generate_reauth_token
-from .tokens.refresh_tokens import generate as generate_refresh_token
-from .tokens.session_tokens import generate as generate_session_token
-from .tokens.sudo_session import generate as generate_sudo_session
-from .tokens.twofa_session import generate as generate_twofa_session
-from .tokens.webhook_secrets import generate as generate_webhook_secret
-
-# Key Hoisting
-from .keys.classification_keys import generate as generate_classification_key
-from .keys.confirmation_keys import generate as generate_confirmation_key
-from .keys.deduplication_keys import generate as generate_deduplication_key
-from .keys.failure_keys import generate as generate_failure_key
-from .keys.fingerprint_keys import generate as generate_fingerprint_key
-from .keys.idempotency_keys import generate as generate_idempotency_key
-from .keys.session_keys import generate as generate_session_key
-from .keys.time_keys import generate as generate_time_key
-from .keys.trace_keys import generate as generate_trace_key
+import importlib
+from typing import TYPE_CHECKING, Any
 
 # Core Hoisting (Entropy & Utils)
 from .core import (
@@ -36,32 +7,163 @@ from .core import (
     urlsafe_entropy,
     hex_entropy,
     random_string,
+    random_strings,
+    enable_entropy_pool,
+    disable_entropy_pool,
     with_prefix,
     timing_safe_equals,
+    HashedToken,
+    SignedToken,
+    EncryptedSecret,
 )
 
+# Everything else is resolved on first access (PEP 562), so `import cryptum`
+# does not load cryptography, argon2 or PyJWT until one of their users is touched.
+_LAZY_EXPORTS = {
+    # Crypto
+    "Cipher": (".crypto.aes", "Cipher"),
+    "encrypt": (".crypto.aes", "encrypt"),
+    "decrypt": (".crypto.aes", "decrypt"),
+    "encrypt_bytes": (".crypto.aes", "encrypt_bytes"),
+    "decrypt_bytes": (".crypto.aes", "decrypt_bytes"),
+    "decrypt_into": (".crypto.aes", "decrypt_into"),
+    "encrypt_many": (".crypto.aes", "encrypt_many"),
+    "decrypt_many": (".crypto.aes", "decrypt_many"),
+    "encrypt_stream": (".crypto.stream", "encrypt_stream"),
+    "decrypt_stream": (".crypto.stream", "decrypt_stream"),
+    "Argon2Profile": (".crypto.Argon2id", "Argon2Profile"),
+    "argon2id_hash": (".crypto.Argon2id", "hash"),
+    "argon2id_verify": (".crypto.Argon2id", "verify"),
+    "argon2id_verify_and_update": (".crypto.Argon2id", "verify_and_update"),
+    "KeyRing": (".crypto.keyring", "KeyRing"),
+    "Signer": (".crypto.hmac", "Signer"),
+    "hmac_sign": (".crypto.hmac", "sign"),
+    "hmac_verify": (".crypto.hmac", "verify"),
+    "sha256_hash": (".crypto.Sha256", "hash"),
+    "sha256_verify": (".crypto.Sha256", "verify"),
+
+    # Tokens
+    "generate_api_key": (".tokens.api_keys", "generate"),
+    "verify_api_key": (".tokens.api_keys", "verify"),
+    "generate_csrf_token": (".tokens.csrf_tokens", "generate"),
+    "generate_email_verification": (".tokens.email_verification", "generate"),
+    "JWTCodec": (".tokens.jwt_tokens", "JWTCodec"),
+    "encode_jwt": (".tokens.jwt_tokens", "encode"),
+    "decode_jwt": (".tokens.jwt_tokens", "decode"),
+    "generate_magic_link": (".tokens.magic_links", "generate"),
+    "generate_nonce": (".tokens.nonce", "generate"),
+    "ReplayGuard": (".tokens.nonce", "ReplayGuard"),
+    "generate_password_reset": (".tokens.password_reset", "generate"),
+    "generate_reauth_token": (".tokens.reauth_tokens", "generate"),
+    "generate_refresh_token": (".tokens.refresh_tokens", "generate"),
+    "generate_session_token": (".tokens.session_tokens", "generate"),
+    "TokenStore": (".tokens.store", "TokenStore"),
+    "generate_sudo_session": (".tokens.sudo_session", "generate"),
+    "generate_twofa_session": (".tokens.twofa_session", "generate"),
+    "generate_webhook_secret": (".tokens.webhook_secrets", "generate"),
+
+    # Keys
+    "generate_classification_key": (".keys.classification_keys", "generate"),
+    "generate_confirmation_key": (".keys.confirmation_keys", "generate"),
+    "generate_deduplication_key": (".keys.deduplication_keys", "generate"),
+    "generate_failure_key": (".keys.failure_keys", "generate"),
+    "generate_fingerprint_key": (".keys.fingerprint_keys", "generate"),
+    "generate_idempotency_key": (".keys.idempotency_keys", "generate"),
+    "generate_session_key": (".keys.session_keys", "generate"),
+    "generate_time_key": (".keys.time_keys", "generate"),
+    "generate_trace_key": (".keys.trace_keys", "generate"),
+}
+
+_SUBPACKAGES = ("aio", "core", "crypto", "instrumentation", "keys", "secrets", "tokens")
+
+if TYPE_CHECKING:
+    # Crypto Hoisting
+    from .crypto.aes import (
+        Cipher,
+        encrypt,
+        decrypt,
+        encrypt_bytes,
+        decrypt_bytes,
+        decrypt_into,
+        encrypt_many,
+        decrypt_many,
+    )
+    from .crypto.stream import encrypt_stream, decrypt_stream
+    from .crypto.Argon2id import (
+        Argon2Profile,
+        hash as argon2id_hash,
+        verify as argon2id_verify,
+        verify_and_update as argon2id_verify_and_update,
+    )
+    from .crypto.keyring import KeyRing
+    from .crypto.hmac import Signer, sign as hmac_sign, verify as hmac_verify
+    from .crypto.Sha256 import hash as sha256_hash, verify as sha256_verify
+
+    # Token Hoisting
+    from .tokens.api_keys import generate as generate_api_key, verify as verify_api_key
+    from .tokens.csrf_tokens import generate as generate_csrf_token
+    from .tokens.email_verification import generate as generate_email_verification
+    from .tokens.jwt_tokens import JWTCodec, encode as encode_jwt, decode as decode_jwt
+    from .tokens.magic_links import generate as generate_magic_link
+    from .tokens.nonce import ReplayGuard, generate as generate_nonce
+    from .tokens.password_reset import generate as generate_password_reset
+    from .tokens.reauth_tokens import generate as generate_reauth_token
+    from .tokens.refresh_tokens import generate as generate_refresh_token
+    from .tokens.session_tokens import generate as generate_session_token
+    from .tokens.store import TokenStore
+    from .tokens.sudo_session import generate as generate_sudo_session
+    from .tokens.twofa_session import generate as generate_twofa_session
+    from .tokens.webhook_secrets import generate as generate_webhook_secret
+
+    # Key Hoisting
+    from .keys.classification_keys import generate as generate_classification_key
+    from .keys.confirmation_keys import generate as generate_confirmation_key
+    from .keys.deduplication_keys import generate as generate_deduplication_key
+    from .keys.failure_keys import generate as generate_failure_key
+    from .keys.fingerprint_keys import generate as generate_fingerprint_key
+    from .keys.idempotency_keys import generate as generate_idempotency_key
+    from .keys.session_keys import generate as generate_session_key
+    from .keys.time_keys import generate as generate_time_key
+    from .keys.trace_keys import generate as generate_trace_key
+
 __all__ = [
     # Crypto
+    "Cipher",
     "encrypt",
     "decrypt",
+    "encrypt_bytes",
+    "decrypt_bytes",
+    "decrypt_into",
+    "encrypt_many",
+    "decrypt_many",
+    "encrypt_stream",
+    "decrypt_stream",
+    "Argon2Profile",
     "argon2id_hash",
     "argon2id_verify",
+    "argon2id_verify_and_update",
+    "Signer",
+    "KeyRing",
     "hmac_sign",
     "hmac_verify",
     "sha256_hash",
     "sha256_verify",
     # Tokens
     "generate_api_key",
+    "verify_api_key",
     "generate_csrf_token",
     "generate_email_verification",
     "encode_jwt",
     "decode_jwt",
+    "JWTCodec",
     "generate_magic_link",
     "generate_nonce",
+    "ReplayGuard",
     "generate_password_reset",
     "generate_reauth_token",
     "generate_refresh_token",
     "generate_session_token",
+    "TokenStore",
     "generate_sudo_session",
     "generate_twofa_session",
     "generate_webhook_secret",
@@ -80,6 +182,30 @@ __all__ = [
     "urlsafe_entropy",
     "hex_entropy",
     "random_string",
+    "random_strings",
+    "enable_entropy_pool",
+    "disable_entropy_pool",
     "with_prefix",
     "timing_safe_equals",
+    "HashedToken",
+    "SignedToken",
+    "EncryptedSecret",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_EXPORTS.get(name)
+    if target is not None:
+        value = getattr(importlib.import_module(target[0], __name__), target[1])
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the result so later lookups skip this hook entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__) | set(_SUBPACKAGES))
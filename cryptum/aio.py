@@ -0,0 +1,436 @@
+"""
+Asyncio versions of cryptum's CPU-heavy operations.
+
+Argon2 always runs on a thread pool that cryptum owns, so password checks
+never block the event loop, and is admitted through an `Argon2Scheduler`
+first, so a login storm queues (or fails with `Argon2Overloaded`) instead of
+allocating every call's memory cost at once. AES and JWT calls run inline
+when their payload is small and are offloaded above `inline_threshold`
+bytes. Every function also takes `offload=True/False` to override that
+choice.
+
+Cancelling the awaiting task drops work that has not started yet. Work
+already running on a thread finishes in the background and its result is
+discarded.
+
+Example:
+    from cryptum import aio
+
+    aio.configure(max_workers=8, scheduler=Argon2Scheduler(memory_budget_kib=512 * 1024))
+    ok = await aio.argon2id_verify(password, stored_hash)
+    blob = await aio.encrypt(document, secret_key)
+"""
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Iterable, Optional
+
+from cryptum.core._records import HashedToken
+from cryptum.crypto import Argon2id, aes
+from cryptum.crypto.Argon2id import Argon2Profile, Argon2Scheduler, _memory_cost_of
+from cryptum.crypto.keyring import KeyRing
+from cryptum.secrets import passwords
+from cryptum.tokens import jwt_tokens
+
+# Payloads smaller than this (in bytes, or characters for strings) run inline:
+# below it, the thread hand-off costs more than the work itself
+DEFAULT_INLINE_THRESHOLD = 16 * 1024
+
+
+def _default_workers() -> int:
+    return min(32, os.cpu_count() or 1)
+
+
+class _Config:
+    __slots__ = ("executor", "max_workers", "inline_threshold", "scheduler")
+
+    def __init__(self):
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.max_workers = _default_workers()
+        self.inline_threshold = DEFAULT_INLINE_THRESHOLD
+        self.scheduler = Argon2Scheduler()
+
+
+_config = _Config()
+_config_lock = threading.Lock()
+
+
+def _forget_executor() -> None:
+    # Worker threads do not survive a fork; the child builds its own pool on first use
+    _config.executor = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_executor)
+
+
+def configure(
+    max_workers: Optional[int] = None,
+    inline_threshold: Optional[int] = None,
+    scheduler: Optional[Argon2Scheduler] = None,
+) -> None:
+    """
+    Size the shared executor, set the offload threshold and the Argon2 scheduler.
+
+    Changing `max_workers` shuts the current pool down once its queued work
+    has finished; later calls use a new pool of the requested size.
+
+    Args:
+        max_workers: Number of worker threads. Defaults to the CPU count, at most 32.
+        inline_threshold: Payload size, in bytes, from which AES and JWT calls are offloaded.
+        scheduler: Admits every Argon2 call against its memory budget. Defaults
+            to an `Argon2Scheduler()` with a 1 GiB budget. Pass the scheduler
+            synchronous code uses too, so both share one budget.
+
+    Raises:
+        TypeError: If scheduler is not an Argon2Scheduler.
+        ValueError: If max_workers is not a positive integer or inline_threshold is negative.
+    """
+    if max_workers is not None and (not isinstance(max_workers, int) or max_workers <= 0):
+        raise ValueError("max_workers must be a positive integer")
+    if inline_threshold is not None and (not isinstance(inline_threshold, int) or inline_threshold < 0):
+        raise ValueError("inline_threshold must be a non-negative integer")
+    if scheduler is not None and not isinstance(scheduler, Argon2Scheduler):
+        raise TypeError("scheduler must be an Argon2Scheduler")
+
+    previous = None
+    with _config_lock:
+        if inline_threshold is not None:
+            _config.inline_threshold = inline_threshold
+        if scheduler is not None:
+            _config.scheduler = scheduler
+        if max_workers is not None and max_workers != _config.max_workers:
+            _config.max_workers = max_workers
+            previous, _config.executor = _config.executor, None
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def executor() -> ThreadPoolExecutor:
+    """
+    Return the shared executor, creating it on first use.
+    """
+    pool = _config.executor
+    if pool is None:
+        with _config_lock:
+            pool = _config.executor
+            if pool is None:
+                pool = _config.executor = ThreadPoolExecutor(
+                    max_workers=_config.max_workers,
+                    thread_name_prefix="cryptum-aio",
+                )
+    return pool
+
+
+def argon2_scheduler() -> Argon2Scheduler:
+    """
+    Return the scheduler Argon2 calls are admitted through, e.g. to read its `stats()`.
+    """
+    return _config.scheduler
+
+
+def shutdown(wait: bool = True) -> None:
+    """
+    Shut the shared executor down, e.g. from an application's shutdown hook.
+
+    A later call creates a fresh pool, so this is safe to call more than once.
+    """
+    with _config_lock:
+        pool, _config.executor = _config.executor, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run any blocking callable on the shared executor.
+
+    The caller's context variables are visible inside `fn`, as with
+    `asyncio.to_thread`.
+    """
+    loop = asyncio.get_running_loop()
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await loop.run_in_executor(executor(), call)
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    return 0
+
+
+def _worth_offloading(size: int, offload: Optional[bool]) -> bool:
+    if offload is None:
+        return size >= _config.inline_threshold
+    return offload
+
+
+async def _call(offload: bool, fn: Callable[..., Any], *args: Any) -> Any:
+    if not offload:
+        return fn(*args)
+    return await run(fn, *args)
+
+
+# --- Argon2id -----------------------------------------------------------------
+# Every call reserves its memory cost with the scheduler before it runs, and
+# raises Argon2Overloaded if the scheduler's queue is full or its wait times out.
+
+def _profile_cost(profile: Optional[Argon2Profile]) -> int:
+    return (profile or Argon2id.DEFAULT_PROFILE).memory_cost
+
+
+async def _admit(cost: int, offload: bool, fn: Callable[..., Any], *args: Any) -> Any:
+    return await _config.scheduler._arun(cost, None, functools.partial(fn, *args), offload)
+
+
+async def argon2id_hash(secret: str, profile: Optional[Argon2Profile] = None, offload: bool = True) -> str:
+    """
+    Asyncio variant of `Argon2id.hash`. Admitted by the scheduler, then runs on the shared executor.
+    """
+    return await _admit(_profile_cost(profile), offload, Argon2id.hash, secret, profile)
+
+
+async def argon2id_verify(secret: str, hash: str, offload: bool = True) -> bool:
+    """
+    Asyncio variant of `Argon2id.verify`. Admitted by the scheduler, then runs on the shared executor.
+
+    A malformed hash returns False without taking any budget.
+    """
+    cost = _memory_cost_of(hash)
+    if cost is None:
+        return False
+    return await _admit(cost, offload, Argon2id.verify, secret, hash)
+
+
+async def argon2id_verify_and_update(
+    secret: str,
+    hash: str,
+    profile: Optional[Argon2Profile] = None,
+    offload: bool = True,
+) -> tuple[bool, Optional[str]]:
+    """
+    Asyncio variant of `Argon2id.verify_and_update`. Admitted by the scheduler, then runs on the shared executor.
+    """
+    cost = _memory_cost_of(hash)
+    if cost is None:
+        return False, None
+    # Verifying and rehashing run one after the other: reserve the larger of the two
+    return await _admit(max(cost, _profile_cost(profile)), offload, Argon2id.verify_and_update, secret, hash, profile)
+
+
+# --- Passwords ----------------------------------------------------------------
+
+async def generate_password(profile: Optional[Argon2Profile] = None, offload: bool = True) -> HashedToken:
+    """
+    Asyncio variant of `passwords.generate`. Hashing is admitted by the scheduler, then runs on the shared executor.
+    """
+    return await _admit(_profile_cost(profile), offload, passwords.generate, profile)
+
+
+async def generate_passwords(count: int, profile: Optional[Argon2Profile] = None, offload: bool = True) -> dict[str, list[str]]:
+    """
+    Asyncio variant of `passwords.generate_many`. Hashing is admitted by the scheduler, then runs on the shared executor.
+
+    The batch reserves one hash's memory cost: the passwords are hashed one
+    after the other (or by an `Argon2Pool`, which bounds its own workers).
+    """
+    return await _admit(_profile_cost(profile), offload, passwords.generate_many, count, profile)
+
+
+async def verify_password(password: str, hash: str, offload: bool = True) -> bool:
+    """
+    Asyncio variant of `passwords.verify`. Admitted by the scheduler, then runs on the shared executor.
+    """
+    cost = _memory_cost_of(hash)
+    if cost is None:
+        return False
+    return await _admit(cost, offload, passwords.verify, password, hash)
+
+
+async def verify_and_update_password(
+    password: str,
+    hash: str,
+    profile: Optional[Argon2Profile] = None,
+    offload: bool = True,
+) -> tuple[bool, Optional[str]]:
+    """
+    Asyncio variant of `passwords.verify_and_update`. Admitted by the scheduler, then runs on the shared executor.
+    """
+    cost = _memory_cost_of(hash)
+    if cost is None:
+        return False, None
+    return await _admit(max(cost, _profile_cost(profile)), offload, passwords.verify_and_update, password, hash, profile)
+
+
+# --- AES-256-GCM --------------------------------------------------------------
+
+async def encrypt(
+    plaintext: str | bytes,
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+    offload: Optional[bool] = None,
+) -> str:
+    """
+    Asyncio variant of `aes.encrypt`. Offloaded from `inline_threshold` bytes unless `offload` is given.
+    """
+    return await _call(_worth_offloading(_size(plaintext), offload), aes.encrypt, plaintext, secret_key, context)
+
+
+async def decrypt(
+    ciphertext_b64: str,
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+    offload: Optional[bool] = None,
+) -> str:
+    """
+    Asyncio variant of `aes.decrypt`. Offloaded from `inline_threshold` bytes unless `offload` is given.
+    """
+    return await _call(_worth_offloading(_size(ciphertext_b64), offload), aes.decrypt, ciphertext_b64, secret_key, context)
+
+
+async def encrypt_bytes(
+    plaintext: bytes | bytearray | memoryview,
+    secret_key: str | bytes,
+    context: Optional[bytes] = None,
+    offload: Optional[bool] = None,
+) -> bytes:
+    """
+    Asyncio variant of `aes.encrypt_bytes`. Offloaded from `inline_threshold` bytes unless `offload` is given.
+    """
+    return await _call(_worth_offloading(_size(plaintext), offload), aes.encrypt_bytes, plaintext, secret_key, context)
+
+
+async def decrypt_bytes(
+    blob: bytes | bytearray | memoryview,
+    secret_key: str | bytes,
+    context: Optional[bytes] = None,
+    offload: Optional[bool] = None,
+) -> bytes:
+    """
+    Asyncio variant of `aes.decrypt_bytes`. Offloaded from `inline_threshold` bytes unless `offload` is given.
+    """
+    return await _call(_worth_offloading(_size(blob), offload), aes.decrypt_bytes, blob, secret_key, context)
+
+
+async def _run_batch(
+    operation: Callable,
+    items: Iterable,
+    context: Optional[str],
+    chunk_size: int,
+    offload: Optional[bool],
+) -> list:
+    """
+    Apply a Cipher method to every item, in chunks on the shared executor.
+
+    At most one chunk per worker is in flight, so a large batch neither
+    floods the executor's queue ahead of other callers nor holds every
+    result future at once. Cancelling the caller cancels the chunks that
+    have not started.
+    """
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+
+    items = list(items)
+    if not _worth_offloading(sum(map(_size, items)), offload):
+        return aes._run_chunk(operation, items, context)
+
+    loop = asyncio.get_running_loop()
+    pool = executor()
+    window = _config.max_workers
+    iterator = iter(items)
+    pending: deque[asyncio.Future] = deque()
+    results = []
+    try:
+        while True:
+            while len(pending) < window:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                pending.append(loop.run_in_executor(pool, aes._run_chunk, operation, chunk, context))
+            if not pending:
+                return results
+            results.extend(await pending.popleft())
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def encrypt_many(
+    plaintexts: Iterable[str | bytes],
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+    chunk_size: int = aes.BATCH_CHUNK_SIZE,
+    offload: Optional[bool] = None,
+) -> list[str | Exception]:
+    """
+    Asyncio variant of `aes.encrypt_many`.
+
+    The key is derived once. Chunks run on the shared executor unless the
+    whole batch is smaller than `inline_threshold`.
+
+    Returns:
+        For each input, in order, the Base64 encoded blob or the exception
+        raised while encrypting that value.
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer.
+    """
+    cipher = aes._cipher_for(secret_key)
+    return await _run_batch(cipher.encrypt, plaintexts, context, chunk_size, offload)
+
+
+async def decrypt_many(
+    ciphertexts: Iterable[str],
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+    chunk_size: int = aes.BATCH_CHUNK_SIZE,
+    offload: Optional[bool] = None,
+) -> list[str | ValueError]:
+    """
+    Asyncio variant of `aes.decrypt_many`.
+
+    Returns:
+        For each input, in order, the plaintext string or the ValueError
+        `decrypt` would have raised.
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer.
+    """
+    cipher = aes._cipher_for(secret_key)
+    return await _run_batch(cipher.decrypt, ciphertexts, context, chunk_size, offload)
+
+
+# --- JWT ----------------------------------------------------------------------
+
+async def encode_jwt(
+    payload: dict[str, Any],
+    secret: str | bytes | KeyRing,
+    expiry_seconds: int = 900,
+    offload: bool = False,
+) -> str:
+    """
+    Asyncio variant of `jwt_tokens.encode`.
+
+    Signing a typical payload takes microseconds, so this runs inline
+    unless `offload` is True (e.g. for very large claim sets).
+    """
+    return await _call(offload, jwt_tokens.encode, payload, secret, expiry_seconds)
+
+
+async def decode_jwt(
+    token: str,
+    secret: str | bytes | KeyRing,
+    cache: Optional["jwt_tokens.DecodeCache"] = None,
+    offload: Optional[bool] = None,
+) -> dict[str, Any]:
+    """
+    Asyncio variant of `jwt_tokens.decode`. Offloaded from `inline_threshold` bytes unless `offload` is given.
+    """
+    return await _call(_worth_offloading(_size(token), offload), jwt_tokens.decode, token, secret, cache)
@@ -0,0 +1,19 @@
+"""
+Benchmarks for every public cryptum primitive, with baseline regression checks.
+
+Usage:
+    python -m cryptum.bench --json results.json
+    python -m cryptum.bench --baseline results.json --threshold 0.15
+"""
+from .runner import CASES, Case, case, compare, measure, run, select, uncovered
+
+__all__ = [
+    "CASES",
+    "Case",
+    "case",
+    "compare",
+    "measure",
+    "run",
+    "select",
+    "uncovered",
+]
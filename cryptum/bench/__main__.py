@@ -0,0 +1,68 @@
+import argparse
+import json
+import sys
+from typing import Optional
+
+from .runner import compare, format_result, load, run, select, uncovered
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m cryptum.bench",
+        description="Benchmark cryptum and compare against a stored baseline.",
+    )
+    parser.add_argument("-k", "--filter", default=None, help="only run cases whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds spent timing each case (default: 0.5)")
+    parser.add_argument("--slow", action="store_true", help="include slow cases (e.g. process pools)")
+    parser.add_argument("--no-alloc", action="store_true", help="skip tracemalloc allocation measurements")
+    parser.add_argument("--json", metavar="PATH", default=None, help="write the report as JSON ('-' for stdout)")
+    parser.add_argument("--baseline", metavar="PATH", default=None, help="compare against a previous JSON report")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="flag cases whose ops/s fell by more than this fraction (default: 0.10)",
+    )
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    benches = select(args.filter, slow=args.slow)
+    quiet = args.json == "-"
+
+    if args.list:
+        for bench in benches:
+            print(bench.name)
+        missing = uncovered()
+        if missing:
+            print(f"Not covered by any case: {', '.join(missing)}", file=sys.stderr)
+        return 0
+
+    progress = None if quiet else (lambda result: print(format_result(result), flush=True))
+    report = run(benches, min_time=args.min_time, allocations=not args.no_alloc, progress=progress)
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    elif args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.baseline is None:
+        return 0
+
+    regressions = compare(report, load(args.baseline), args.threshold)
+    out = sys.stderr if quiet else sys.stdout
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}.", file=out)
+        return 0
+
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%} against {args.baseline}:", file=out)
+    for regression in regressions:
+        print(
+            f"    {regression['name']}: {regression['baseline_ops_per_sec']:,.0f} -> "
+            f"{regression['ops_per_sec']:,.0f} ops/s ({regression['change']:+.1%})",
+            file=out,
+        )
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,700 @@
+"""
+Built-in benchmark cases, one or more per public `cryptum` name.
+
+Names are stable: baselines are matched by name, so renaming a case
+silently drops it from regression checks.
+"""
+import functools
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+import cryptum
+from cryptum import instrumentation
+from cryptum.core import CuckooFilter, _entropy
+from cryptum.crypto import Argon2id, Sha256
+from cryptum.keys import deduplication_keys, trace_keys
+from cryptum.tokens import api_keys, jwt_tokens, nonce, refresh_tokens, session_tokens
+
+from .runner import case
+
+SECRET = "cryptum-bench-secret-0123456789abcdef"
+PAYLOAD_SIZES = {"64B": 64, "1KiB": 1024, "64KiB": 64 * 1024, "1MiB": 1024 * 1024}
+BATCH = 1000
+
+# Argon2 cases use the OWASP low-memory preset so a full run stays short;
+# "argon2.*[default]" cases measure the real default cost.
+FAST_PROFILE = Argon2id.PROFILE_LOW_MEMORY
+
+
+# --- AES-256-GCM --------------------------------------------------------------
+
+for _label, _size in PAYLOAD_SIZES.items():
+    def _encrypt_setup(size=_size):
+        data = "x" * size
+        return lambda: cryptum.encrypt(data, SECRET)
+
+    def _decrypt_setup(size=_size):
+        blob = cryptum.encrypt("x" * size, SECRET)
+        return lambda: cryptum.decrypt(blob, SECRET)
+
+    def _encrypt_bytes_setup(size=_size):
+        data = os.urandom(size)
+        return lambda: cryptum.encrypt_bytes(data, SECRET)
+
+    def _decrypt_bytes_setup(size=_size):
+        blob = cryptum.encrypt_bytes(os.urandom(size), SECRET)
+        return lambda: cryptum.decrypt_bytes(blob, SECRET)
+
+    def _decrypt_into_setup(size=_size):
+        blob = cryptum.encrypt_bytes(os.urandom(size), SECRET)
+        buffer = bytearray(size)
+        return lambda: cryptum.decrypt_into(blob, buffer, SECRET)
+
+    case(f"aes.encrypt[{_label}]", covers=("encrypt",))(_encrypt_setup)
+    case(f"aes.decrypt[{_label}]", covers=("decrypt",))(_decrypt_setup)
+    case(f"aes.encrypt_bytes[{_label}]", covers=("encrypt_bytes",))(_encrypt_bytes_setup)
+    case(f"aes.decrypt_bytes[{_label}]", covers=("decrypt_bytes",))(_decrypt_bytes_setup)
+    case(f"aes.decrypt_into[{_label}]", covers=("decrypt_into",))(_decrypt_into_setup)
+
+
+@case("aes.Cipher.encrypt[1KiB]", covers=("Cipher",))
+def _():
+    cipher = cryptum.Cipher(SECRET)
+    data = "x" * 1024
+    return lambda: cipher.encrypt(data)
+
+
+@case("aes.Cipher.decrypt_bytes[1KiB]", covers=("Cipher",))
+def _():
+    cipher = cryptum.Cipher(SECRET)
+    blob = cipher.encrypt_bytes(os.urandom(1024))
+    return lambda: cipher.decrypt_bytes(blob)
+
+
+@case(f"aes.encrypt_many[{BATCH}x1KiB]", covers=("encrypt_many",), items=BATCH)
+def _():
+    items = ["x" * 1024] * BATCH
+    return lambda: list(cryptum.encrypt_many(items, SECRET))
+
+
+@case(f"aes.decrypt_many[{BATCH}x1KiB]", covers=("decrypt_many",), items=BATCH)
+def _():
+    blobs = list(cryptum.encrypt_many(["x" * 1024] * BATCH, SECRET))
+    return lambda: list(cryptum.decrypt_many(blobs, SECRET))
+
+
+@case("aes.encrypt_stream[4MiB]", covers=("encrypt_stream",))
+def _():
+    data = os.urandom(4 * 1024 * 1024)
+    return lambda: sum(len(chunk) for chunk in cryptum.encrypt_stream(io.BytesIO(data), SECRET))
+
+
+@case("aes.decrypt_stream[4MiB]", covers=("decrypt_stream",))
+def _():
+    blob = b"".join(cryptum.encrypt_stream(io.BytesIO(os.urandom(4 * 1024 * 1024)), SECRET))
+    return lambda: sum(len(chunk) for chunk in cryptum.decrypt_stream(io.BytesIO(blob), SECRET))
+
+
+# --- Argon2id -----------------------------------------------------------------
+
+@case("argon2.hash[low-memory]", covers=("argon2id_hash", "Argon2Profile"))
+def _():
+    return lambda: cryptum.argon2id_hash("correct horse battery staple", FAST_PROFILE)
+
+
+@case("argon2.hash[default]", covers=("argon2id_hash",))
+def _():
+    return lambda: cryptum.argon2id_hash("correct horse battery staple")
+
+
+@case("argon2.verify[default]", covers=("argon2id_verify",))
+def _():
+    encoded = cryptum.argon2id_hash("correct horse battery staple")
+    return lambda: cryptum.argon2id_verify("correct horse battery staple", encoded)
+
+
+@case("argon2.verify_and_update[current]", covers=("argon2id_verify_and_update",))
+def _():
+    encoded = cryptum.argon2id_hash("correct horse battery staple")
+    return lambda: cryptum.argon2id_verify_and_update("correct horse battery staple", encoded)
+
+
+@case("argon2.Argon2Profile.hasher", covers=("Argon2Profile",))
+def _():
+    profile = cryptum.Argon2Profile(time_cost=2, memory_cost=19456, parallelism=1)
+    return lambda: profile.hasher
+
+
+@case("argon2.pool.hash_many[8,low-memory]", items=8, slow=True)
+def _():
+    from cryptum.crypto.argon2_pool import Argon2Pool
+
+    pool = Argon2Pool(profiles=(FAST_PROFILE,))
+    secrets = [f"password-{i}" for i in range(8)]
+    return (lambda: pool.hash_many(secrets, FAST_PROFILE)), pool.shutdown
+
+
+# Verification throughput against the worker count: compare items/s of the
+# p=N cases with the in-process baseline to see the scaling with cores
+POOL_VERIFY_BATCH = 16
+
+
+def _verify_pairs() -> list[tuple[str, str]]:
+    secrets = [f"password-{i}" for i in range(POOL_VERIFY_BATCH)]
+    return [(secret, Argon2id.hash(secret, FAST_PROFILE)) for secret in secrets]
+
+
+@case(f"argon2.verify_many[{POOL_VERIFY_BATCH},low-memory,in-process]", items=POOL_VERIFY_BATCH, slow=True)
+def _():
+    pairs = _verify_pairs()
+    return lambda: [Argon2id.verify(secret, encoded) for secret, encoded in pairs], None, {"processes": 0}
+
+
+for _label, _processes in (("1", 1), ("2", 2), ("4", 4), ("cpu", None)):
+    def _pool_verify_setup(processes=_processes):
+        from cryptum.crypto.argon2_pool import Argon2Pool
+
+        pairs = _verify_pairs()
+        pool = Argon2Pool(processes=processes, profiles=(FAST_PROFILE,), batch_size=1)
+        return (lambda: pool.verify_many(pairs)), pool.shutdown, {"processes": pool.processes}
+
+    case(
+        f"argon2.pool.verify_many[{POOL_VERIFY_BATCH},low-memory,p={_label}]",
+        items=POOL_VERIFY_BATCH,
+        slow=True,
+    )(_pool_verify_setup)
+
+
+# --- HMAC, key rings and SHA-256 ----------------------------------------------
+
+@case("hmac.sign[64B]", covers=("hmac_sign",))
+def _():
+    data = "x" * 64
+    return lambda: cryptum.hmac_sign(data, SECRET)
+
+
+@case("hmac.verify[64B]", covers=("hmac_verify",))
+def _():
+    data = "x" * 64
+    signature = cryptum.hmac_sign(data, SECRET)
+    return lambda: cryptum.hmac_verify(data, SECRET, signature)
+
+
+@case("hmac.Signer.sign[64B]", covers=("Signer",))
+def _():
+    signer = cryptum.Signer(SECRET)
+    data = "x" * 64
+    return lambda: signer.sign(data)
+
+
+@case("hmac.Signer.verify[64B]", covers=("Signer",))
+def _():
+    signer = cryptum.Signer(SECRET)
+    data = "x" * 64
+    signature = signer.sign(data)
+    return lambda: signer.verify(data, signature)
+
+
+@case("keyring.signer_lookup", covers=("KeyRing",))
+def _():
+    ring = cryptum.KeyRing({f"k{i}": f"{SECRET}-{i}" for i in range(16)}, active="k15")
+    return lambda: ring.signer("k7")
+
+
+@case("sha256.hash[64B]", covers=("sha256_hash",))
+def _():
+    data = "x" * 64
+    return lambda: cryptum.sha256_hash(data)
+
+
+@case("sha256.verify[64B]", covers=("sha256_verify",))
+def _():
+    data = "x" * 64
+    digest = cryptum.sha256_hash(data)
+    return lambda: cryptum.sha256_verify(data, digest)
+
+
+@case(f"sha256.hash_many[{BATCH}]", items=BATCH)
+def _():
+    values = refresh_tokens.generate_many(BATCH)["plaintext"]
+    return lambda: Sha256.hash_many(values)
+
+
+# --- API keys -----------------------------------------------------------------
+
+@case("api_keys.generate", covers=("generate_api_key",))
+def _():
+    return lambda: cryptum.generate_api_key(SECRET)
+
+
+@case("api_keys.generate[ring]", covers=("generate_api_key", "KeyRing"))
+def _():
+    ring = cryptum.KeyRing({"2024-01": SECRET})
+    return lambda: cryptum.generate_api_key(ring)
+
+
+@case("api_keys.verify", covers=("verify_api_key",))
+def _():
+    key = cryptum.generate_api_key(SECRET)
+    return lambda: cryptum.verify_api_key(key.plaintext, key.signature, SECRET)
+
+
+@case("api_keys.verify[ring]", covers=("verify_api_key", "KeyRing"))
+def _():
+    ring = cryptum.KeyRing({"2024-01": SECRET})
+    key = cryptum.generate_api_key(ring)
+    return lambda: cryptum.verify_api_key(key.plaintext, key.signature, ring)
+
+
+@case("api_keys.VerificationCache.verify[hit]")
+def _():
+    cache = api_keys.VerificationCache(SECRET)
+    key = cryptum.generate_api_key(SECRET)
+    return lambda: cache.verify(key.plaintext, key.signature)
+
+
+@case(f"api_keys.generate_many[{BATCH}]", items=BATCH)
+def _():
+    return lambda: api_keys.generate_many(BATCH, SECRET)
+
+
+# --- JWT ----------------------------------------------------------------------
+
+CLAIMS = {"sub": "user-123", "scope": "read write"}
+
+
+@case("jwt.encode", covers=("encode_jwt",))
+def _():
+    return lambda: cryptum.encode_jwt(CLAIMS, SECRET)
+
+
+@case("jwt.decode", covers=("decode_jwt",))
+def _():
+    token = cryptum.encode_jwt(CLAIMS, SECRET)
+    return lambda: cryptum.decode_jwt(token, SECRET)
+
+
+@case("jwt.decode[ring]", covers=("decode_jwt", "KeyRing"))
+def _():
+    ring = cryptum.KeyRing({"2024-01": SECRET})
+    token = cryptum.encode_jwt(CLAIMS, ring)
+    return lambda: cryptum.decode_jwt(token, ring)
+
+
+@case("jwt.decode[cache-hit]", covers=("decode_jwt",))
+def _():
+    cache = jwt_tokens.DecodeCache()
+    token = cryptum.encode_jwt(CLAIMS, SECRET)
+    return lambda: cryptum.decode_jwt(token, SECRET, cache=cache)
+
+
+@case("jwt.JWTCodec.encode", covers=("JWTCodec",))
+def _():
+    codec = cryptum.JWTCodec(SECRET)
+    return lambda: codec.encode(CLAIMS)
+
+
+@case("jwt.JWTCodec.decode", covers=("JWTCodec",))
+def _():
+    codec = cryptum.JWTCodec(SECRET)
+    token = codec.encode(CLAIMS)
+    return lambda: codec.decode(token)
+
+
+# --- Token, key and secret generators -----------------------------------------
+
+for _name in (
+    "generate_csrf_token",
+    "generate_email_verification",
+    "generate_magic_link",
+    "generate_nonce",
+    "generate_password_reset",
+    "generate_reauth_token",
+    "generate_refresh_token",
+    "generate_session_token",
+    "generate_sudo_session",
+    "generate_twofa_session",
+    "generate_classification_key",
+    "generate_confirmation_key",
+    "generate_deduplication_key",
+    "generate_failure_key",
+    "generate_fingerprint_key",
+    "generate_idempotency_key",
+    "generate_session_key",
+    "generate_time_key",
+    "generate_trace_key",
+):
+    def _generator_setup(name=_name):
+        return getattr(cryptum, name)
+
+    case(f"generate.{_name[len('generate_'):]}", covers=(_name,))(_generator_setup)
+
+
+@case("generate.webhook_secret", covers=("generate_webhook_secret",))
+def _():
+    return lambda: cryptum.generate_webhook_secret(SECRET)
+
+
+@case(f"generate_many.refresh_token[{BATCH}]", items=BATCH)
+def _():
+    return lambda: refresh_tokens.generate_many(BATCH)
+
+
+@case(f"generate_many.trace_key[{BATCH}]", items=BATCH)
+def _():
+    return lambda: trace_keys.generate_many(BATCH)
+
+
+@case(f"generate_loop.refresh_token[{BATCH}]", items=BATCH)
+def _():
+    generate = refresh_tokens.generate
+    return lambda: [generate() for _ in range(BATCH)]
+
+
+# --- Token store --------------------------------------------------------------
+
+@case("store.TokenStore.get[hit,100k]", covers=("TokenStore",))
+def _():
+    store = cryptum.TokenStore(max_entries=100_000)
+    tokens = session_tokens.generate_many(100_000)
+    for token_hash in tokens["hash"]:
+        store.put(token_hash, 1, ttl=3600)
+    presented = tokens["plaintext"][12345]
+    return lambda: store.get(presented)
+
+
+@case("store.TokenStore.put+consume", covers=("TokenStore",))
+def _():
+    store = cryptum.TokenStore(max_entries=100_000)
+    token = session_tokens.generate()
+    token_hash = token.hash
+
+    def put_consume():
+        store.put(token_hash, 1, ttl=900)
+        return store.consume(token.plaintext)
+    return put_consume
+
+
+@case(f"store.TokenStore.put[{BATCH},full]", covers=("TokenStore",), items=BATCH)
+def _():
+    # Every put evicts, and the wheel ticks every call (resolution 1 ms)
+    store = cryptum.TokenStore(max_entries=BATCH, resolution=0.001)
+    hashes = session_tokens.generate_many(BATCH * 4)["hash"]
+    batches = [hashes[i:i + BATCH] for i in range(0, len(hashes), BATCH)]
+    state = {"turn": 0}
+
+    def fill():
+        state["turn"] += 1
+        for token_hash in batches[state["turn"] % len(batches)]:
+            store.put(token_hash, 1, ttl=0.05)
+    return fill
+
+
+# --- Replay detection ---------------------------------------------------------
+# Target: at least 100k checks/s (items/s) on a single thread
+
+@case(f"nonce.ReplayGuard.is_replay[{BATCH},new]", covers=("ReplayGuard",), items=BATCH)
+def _():
+    guard = cryptum.ReplayGuard(window=300, capacity=1_000_000)
+    values = [value.encode("ascii") for value in nonce.generate_many(BATCH)["plaintext"]]
+    turns = iter(range(10**12))
+
+    def check():
+        # A per-call tag keeps every nonce new without generating entropy in the timed loop
+        tag = b"%d." % next(turns)
+        now = time.time()
+        for value in values:
+            guard.is_replay(tag + value, now)
+    return check
+
+
+@case(f"nonce.ReplayGuard.is_replay[{BATCH},replayed]", covers=("ReplayGuard",), items=BATCH)
+def _():
+    guard = cryptum.ReplayGuard(window=300, capacity=1_000_000)
+    values = nonce.generate_many(BATCH)["plaintext"]
+    now = time.time()
+    for value in values:
+        guard.is_replay(value, now)
+
+    def check():
+        now = time.time()
+        for value in values:
+            guard.is_replay(value, now)
+    return check
+
+
+@case(f"nonce.ReplayGuard.seen[{BATCH}]", covers=("ReplayGuard",), items=BATCH)
+def _():
+    guard = cryptum.ReplayGuard(window=300, capacity=1_000_000)
+    values = nonce.generate_many(BATCH)["plaintext"]
+    for value in values:
+        guard.is_replay(value)
+    return lambda: [guard.seen(value) for value in values]
+
+
+# --- Deduplication filters ----------------------------------------------------
+# CuckooFilter against a plain set of the same hashes: compare items/s and the
+# bytes_per_item / false_positive_rate metrics
+
+FILTER_SIZE = 100_000
+
+
+@functools.lru_cache(maxsize=1)
+def _filter_hashes() -> tuple[list[str], list[str]]:
+    """
+    Return (hashes to insert, hashes never inserted), shared by the filter cases.
+    """
+    hashes = deduplication_keys.generate_many(2 * FILTER_SIZE)["hash"]
+    return hashes[:FILTER_SIZE], hashes[FILTER_SIZE:]
+
+
+def _cuckoo_metrics(cuckoo: CuckooFilter, absent: list[str]) -> dict[str, float]:
+    return {
+        "bytes_per_item": cuckoo.nbytes / len(cuckoo),
+        "false_positive_rate": sum(item in cuckoo for item in absent) / len(absent),
+    }
+
+
+def _set_metrics(items: set[str]) -> dict[str, float]:
+    size = sys.getsizeof(items) + sum(map(sys.getsizeof, items))
+    return {"bytes_per_item": size / len(items), "false_positive_rate": 0.0}
+
+
+@case(f"filters.CuckooFilter.contains[{BATCH}]", items=BATCH)
+def _():
+    present, absent = _filter_hashes()
+    cuckoo = CuckooFilter(FILTER_SIZE)
+    for item in present:
+        cuckoo.add(item)
+    values = present[:BATCH // 2] + absent[:BATCH // 2]
+    return lambda: [value in cuckoo for value in values], None, _cuckoo_metrics(cuckoo, absent)
+
+
+@case(f"filters.CuckooFilter.contains[{BATCH},mmap]", items=BATCH)
+def _():
+    present, absent = _filter_hashes()
+    cuckoo = CuckooFilter(FILTER_SIZE)
+    for item in present:
+        cuckoo.add(item)
+    directory = tempfile.TemporaryDirectory()
+    path = os.path.join(directory.name, "filter.ckf")
+    cuckoo.save(path)
+    shared = CuckooFilter.load(path)
+    values = present[:BATCH // 2] + absent[:BATCH // 2]
+
+    def cleanup():
+        shared.close()
+        directory.cleanup()
+    return lambda: [value in shared for value in values], cleanup, _cuckoo_metrics(shared, absent)
+
+
+@case(f"filters.CuckooFilter.add+remove[{BATCH}]", items=BATCH)
+def _():
+    present, absent = _filter_hashes()
+    cuckoo = CuckooFilter(FILTER_SIZE + BATCH)
+    for item in present:
+        cuckoo.add(item)
+    values = absent[:BATCH]
+
+    def churn():
+        for value in values:
+            cuckoo.add(value)
+        for value in values:
+            cuckoo.remove(value)
+    return churn
+
+
+@case(f"filters.set.contains[{BATCH}]", items=BATCH)
+def _():
+    present, absent = _filter_hashes()
+    items = set(present)
+    values = present[:BATCH // 2] + absent[:BATCH // 2]
+    return lambda: [value in items for value in values], None, _set_metrics(items)
+
+
+@case(f"filters.set.add+discard[{BATCH}]", items=BATCH)
+def _():
+    present, absent = _filter_hashes()
+    items = set(present)
+    values = absent[:BATCH]
+
+    def churn():
+        for value in values:
+            items.add(value)
+        for value in values:
+            items.discard(value)
+    return churn
+
+
+# --- Result records -----------------------------------------------------------
+# Compare allocations (alloc_peak_bytes / retained_bytes) of these pairs
+
+@case(f"records.HashedToken[{BATCH},lazy]", covers=("HashedToken",), items=BATCH)
+def _():
+    generate = session_tokens.generate
+    return lambda: [generate() for _ in range(BATCH)]
+
+
+@case(f"records.HashedToken[{BATCH},hashed]", covers=("HashedToken",), items=BATCH)
+def _():
+    generate = session_tokens.generate
+    return lambda: [token for token in (generate() for _ in range(BATCH)) if token.hash]
+
+
+@case(f"records.dict[{BATCH},hashed]", items=BATCH)
+def _():
+    generate = session_tokens.generate
+    return lambda: [dict(generate()) for _ in range(BATCH)]
+
+
+@case("records.SignedToken", covers=("SignedToken",))
+def _():
+    return lambda: cryptum.SignedToken("ak_x", "00" * 32)
+
+
+@case("records.EncryptedSecret", covers=("EncryptedSecret",))
+def _():
+    return lambda: cryptum.EncryptedSecret("whs_x", "blob")
+
+
+# --- Entropy and core helpers -------------------------------------------------
+
+def _urandom_calls(fn, calls: int = 1000) -> dict[str, float]:
+    """
+    Count OS CSPRNG reads (os.urandom, directly or through `secrets`) per call of fn.
+    """
+    count = 0
+    original = os.urandom
+
+    def counting(size):
+        nonlocal count
+        count += 1
+        return original(size)
+
+    # secrets reads through random's own reference to os.urandom
+    os.urandom = random._urandom = counting
+    try:
+        for _ in range(calls):
+            fn()
+    finally:
+        os.urandom = random._urandom = original
+    return {"urandom_calls_per_op": count / calls}
+
+
+def _with_syscalls(fn):
+    return fn, None, _urandom_calls(fn)
+
+
+for _size in (8, 16, 32, 64):
+    def _bytes_setup(size=_size):
+        return _with_syscalls(lambda: cryptum.bytes_entropy(size))
+
+    def _hex_setup(size=_size):
+        return _with_syscalls(lambda: cryptum.hex_entropy(size))
+
+    def _urlsafe_setup(size=_size):
+        return _with_syscalls(lambda: cryptum.urlsafe_entropy(size))
+
+    case(f"entropy.bytes[{_size}]", covers=("bytes_entropy",))(_bytes_setup)
+    case(f"entropy.hex[{_size}]", covers=("hex_entropy",))(_hex_setup)
+    case(f"entropy.urlsafe[{_size}]", covers=("urlsafe_entropy",))(_urlsafe_setup)
+
+
+def _with_pool(fn):
+    cryptum.enable_entropy_pool()
+    return fn, cryptum.disable_entropy_pool, _urandom_calls(fn)
+
+
+@case("entropy.urlsafe[32,pool]", covers=("enable_entropy_pool", "disable_entropy_pool"))
+def _():
+    # One os.urandom call per 4 KiB block (128 tokens) instead of one per token
+    return _with_pool(lambda: cryptum.urlsafe_entropy(32))
+
+
+@case("entropy.hex[8,pool]", covers=("enable_entropy_pool", "disable_entropy_pool"))
+def _():
+    return _with_pool(lambda: cryptum.hex_entropy(8))
+
+
+@case("entropy.pool.refill[4KiB]")
+def _():
+    state = _entropy._PoolState()
+    return lambda: state.refill(4096)
+
+
+@case("entropy.random_string[16,symbols]", covers=("random_string",))
+def _():
+    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
+    return lambda: cryptum.random_string(16, alphabet)
+
+
+@case("entropy.random_string[6,digits]", covers=("random_string",))
+def _():
+    return lambda: cryptum.random_string(6, "0123456789")
+
+
+@case(f"entropy.random_strings[{BATCH}x16]", covers=("random_strings",), items=BATCH)
+def _():
+    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789!@#$%^&*"
+    return lambda: cryptum.random_strings(BATCH, 16, alphabet)
+
+
+@case("core.with_prefix", covers=("with_prefix",))
+def _():
+    return lambda: cryptum.with_prefix("dk", "0123456789abcdef")
+
+
+@case("core.timing_safe_equals[64B]", covers=("timing_safe_equals",))
+def _():
+    a = deduplication_keys.generate().hash
+    b = a[:-1] + "0"
+    return lambda: cryptum.timing_safe_equals(a, b)
+
+
+# --- Instrumentation ----------------------------------------------------------
+# Compare "[raw]" (undecorated), "[disabled]" (no sink) and "[registry]"
+
+@case("instrumentation.hmac.Signer.sign[raw]")
+def _():
+    signer = cryptum.Signer(SECRET)
+    sign = cryptum.Signer.sign.__wrapped__
+    return lambda: sign(signer, "x" * 64)
+
+
+@case("instrumentation.hmac.Signer.sign[disabled]")
+def _():
+    signer = cryptum.Signer(SECRET)
+    return lambda: signer.sign("x" * 64)
+
+
+@case("instrumentation.hmac.Signer.sign[registry]")
+def _():
+    signer = cryptum.Signer(SECRET)
+    registry = instrumentation.MetricsRegistry()
+    instrumentation.add_sink(registry)
+    return (lambda: signer.sign("x" * 64)), (lambda: instrumentation.remove_sink(registry))
+
+
+@case("instrumentation.to_prometheus[20 ops]")
+def _():
+    registry = instrumentation.MetricsRegistry()
+    for index in range(20):
+        for seconds in (0.00002, 0.0003, 0.004):
+            registry.record(instrumentation.Measurement(f"op.{index}", seconds, 64, False, None))
+    return registry.to_prometheus
+
+
+# --- Import time --------------------------------------------------------------
+
+@case("import.cryptum[cold]")
+def _():
+    # A fresh interpreter per call, so this includes interpreter start-up (~10-20 ms)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(cryptum.__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    command = [sys.executable, "-c", "import cryptum"]
+    return lambda: subprocess.run(command, check=True, env=env)
@@ -0,0 +1,277 @@
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from importlib import metadata
+from typing import Any, Callable, Iterable, Optional
+
+# Registered cases, in definition order; see `case`
+CASES: list["Case"] = []
+
+
+class Case:
+    """
+    One benchmark: a setup function that returns the operation to time.
+
+    The setup runs once, outside the timed region, and returns either a
+    zero-argument callable, a (callable, cleanup) pair, or a
+    (callable, cleanup, metrics) triple whose metrics dictionary (e.g. a
+    measured false-positive rate) is reported alongside the timings.
+    Cleanup may be None.
+    """
+
+    __slots__ = ("name", "setup", "covers", "items", "slow")
+
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[], Any],
+        covers: Iterable[str] = (),
+        items: int = 1,
+        slow: bool = False,
+    ):
+        """
+        Args:
+            name: Unique, stable name used to match baselines (e.g. "aes.encrypt[1KiB]").
+            setup: Builds the operation to time.
+            covers: Public `cryptum` names this case exercises.
+            items: Items processed per call, for batch operations.
+            slow: Skip unless slow cases are requested (e.g. process pools).
+        """
+        self.name = name
+        self.setup = setup
+        self.covers = tuple(covers)
+        self.items = items
+        self.slow = slow
+
+
+def case(name: str, covers: Iterable[str] = (), items: int = 1, slow: bool = False):
+    """
+    Decorator registering a setup function as a benchmark case.
+
+    Example:
+        @case("sha256_hash[64B]", covers=("sha256_hash",))
+        def _():
+            data = "x" * 64
+            return lambda: cryptum.sha256_hash(data)
+    """
+    def register(setup: Callable[[], Any]) -> Callable[[], Any]:
+        if any(existing.name == name for existing in CASES):
+            raise ValueError(f"duplicate benchmark case: {name}")
+        CASES.append(Case(name, setup, covers, items, slow))
+        return setup
+    return register
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _allocations(fn: Callable[[], Any], calls: int) -> tuple[int, int]:
+    """
+    Return (peak transient bytes, retained bytes) per call, measured with tracemalloc.
+    """
+    results = []
+    tracemalloc.start()
+    try:
+        peak = 0
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(calls):
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            results.append(fn())
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - start)
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    # Results are kept alive above so their size counts as retained
+    del results
+    return peak, max(0, retained) // calls
+
+
+def measure(
+    bench: Case,
+    min_time: float = 0.5,
+    min_samples: int = 5,
+    max_samples: int = 100_000,
+    allocations: bool = True,
+) -> dict[str, Any]:
+    """
+    Time one case and return its statistics.
+
+    Every call is timed individually, so the latency percentiles are real
+    per-call figures. Sampling stops once `min_time` seconds and
+    `min_samples` calls have been spent, or at `max_samples` calls.
+
+    Returns:
+        A dictionary with 'name', 'ops_per_sec', 'items_per_sec', 'p50_us',
+        'p99_us', 'mean_us', 'samples' and, when requested,
+        'alloc_peak_bytes' and 'retained_bytes' per call, and 'metrics'
+        if the setup returned any.
+    """
+    prepared = bench.setup()
+    if not isinstance(prepared, tuple):
+        prepared = (prepared,)
+    fn, cleanup, metrics = prepared + (None,) * (3 - len(prepared))
+    try:
+        fn()  # warm-up: caches, lazy imports, key derivation
+
+        clock = time.perf_counter
+        samples = []
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            deadline = clock() + min_time
+            while len(samples) < max_samples:
+                started = clock()
+                fn()
+                finished = clock()
+                samples.append(finished - started)
+                if finished >= deadline and len(samples) >= min_samples:
+                    break
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        total = sum(samples)
+        ordered = sorted(samples)
+        result = {
+            "name": bench.name,
+            "ops_per_sec": len(samples) / total if total else float("inf"),
+            "items_per_sec": len(samples) * bench.items / total if total else float("inf"),
+            "p50_us": _percentile(ordered, 0.50) * 1e6,
+            "p99_us": _percentile(ordered, 0.99) * 1e6,
+            "mean_us": statistics.fmean(samples) * 1e6,
+            "samples": len(samples),
+        }
+        if allocations:
+            calls = max(1, min(len(samples), 20))
+            result["alloc_peak_bytes"], result["retained_bytes"] = _allocations(fn, calls)
+        if metrics:
+            result["metrics"] = metrics
+        return result
+    finally:
+        if cleanup is not None:
+            cleanup()
+
+
+def select(pattern: Optional[str] = None, slow: bool = False) -> list[Case]:
+    """
+    Return the registered cases whose name contains `pattern`, skipping slow ones unless asked.
+    """
+    from . import cases  # noqa: F401  (registers the built-in cases)
+
+    return [
+        bench for bench in CASES
+        if (pattern is None or pattern in bench.name) and (slow or not bench.slow)
+    ]
+
+
+def uncovered() -> list[str]:
+    """
+    Return the names in `cryptum.__all__` that no registered case exercises.
+    """
+    import cryptum
+    from . import cases  # noqa: F401
+
+    covered = {name for bench in CASES for name in bench.covers}
+    return [name for name in cryptum.__all__ if name not in covered]
+
+
+def _version() -> Optional[str]:
+    try:
+        return metadata.version("cryptum")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def run(
+    benches: Iterable[Case],
+    min_time: float = 0.5,
+    allocations: bool = True,
+    progress: Optional[Callable[[dict[str, Any]], None]] = None,
+) -> dict[str, Any]:
+    """
+    Run cases and return a JSON-serializable report.
+
+    Args:
+        benches: The cases to run, e.g. from `select`.
+        min_time: Minimum seconds spent timing each case.
+        allocations: Whether to measure allocations with tracemalloc.
+        progress: Called with each result as soon as it is available.
+
+    Returns:
+        A dictionary with an 'environment' section and a 'results' list.
+    """
+    results = []
+    for bench in benches:
+        result = measure(bench, min_time=min_time, allocations=allocations)
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    return {
+        "environment": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cryptum": _version(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], threshold: float = 0.10) -> list[dict[str, Any]]:
+    """
+    Compare a report with a baseline report and return the regressions.
+
+    A case regresses when its throughput falls by more than `threshold`
+    (a fraction, 0.10 = 10%). Cases missing from either side are ignored.
+
+    Returns:
+        One dictionary per regression with 'name', 'baseline_ops_per_sec',
+        'ops_per_sec' and 'change' (negative, as a fraction).
+    """
+    if not 0 < threshold < 1:
+        raise ValueError("threshold must be between 0 and 1")
+
+    previous = {result["name"]: result for result in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        before = previous.get(result["name"])
+        if before is None or not before.get("ops_per_sec"):
+            continue
+        change = result["ops_per_sec"] / before["ops_per_sec"] - 1
+        if change < -threshold:
+            regressions.append({
+                "name": result["name"],
+                "baseline_ops_per_sec": before["ops_per_sec"],
+                "ops_per_sec": result["ops_per_sec"],
+                "change": change,
+            })
+    return regressions
+
+
+def load(path: str) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def format_result(result: dict[str, Any]) -> str:
+    line = (
+        f"{result['name']:<44} {result['ops_per_sec']:>14,.0f} ops/s"
+        f"  p50 {result['p50_us']:>10.1f} us  p99 {result['p99_us']:>10.1f} us"
+    )
+    if result["items_per_sec"] != result["ops_per_sec"]:
+        line += f"  {result['items_per_sec']:>12,.0f} items/s"
+    if "alloc_peak_bytes" in result:
+        line += f"  alloc {result['alloc_peak_bytes']:>9,} B"
+    for key, value in result.get("metrics", {}).items():
+        line += f"  {key} {value:.4g}" if isinstance(value, float) else f"  {key} {value}"
+    return line
@@ -0,0 +1,133 @@
+"""
+Benchmark this host and recommend Argon2id parameters.
+
+Usage:
+    python -m cryptum.calibrate --target-ms 250 --max-memory-mib 64
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from typing import Optional
+
+from cryptum.crypto.Argon2id import Argon2Profile
+
+# Never recommend less memory than the OWASP minimum for Argon2id
+MIN_MEMORY_KIB = 19456
+
+
+def _measure(profile: Argon2Profile, samples: int) -> float:
+    """
+    Return the median wall-clock time of one hash under `profile`, in milliseconds.
+    """
+    hasher = profile.hasher
+    hasher.hash("cryptum-calibration")  # warm-up
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("cryptum-calibration")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(
+    target_ms: float = 250.0,
+    max_memory_kib: int = 65536,
+    parallelism: Optional[int] = None,
+    samples: int = 3,
+) -> tuple[Argon2Profile, float]:
+    """
+    Find the strongest Argon2id profile that hashes within a target latency.
+
+    Memory is maximised first, within `max_memory_kib`, and then the time cost
+    is raised while the median hash time stays within `target_ms`.
+
+    Args:
+        target_ms: Latency budget for a single hash, in milliseconds.
+        max_memory_kib: Memory ceiling per hash, in KiB.
+        parallelism: Lanes per hash. Defaults to the CPU count, capped at 4.
+        samples: Timed runs per candidate; the median is used.
+
+    Returns:
+        A tuple (profile, measured_ms). If even the smallest memory setting
+        misses the target, that setting is returned with its measured time.
+
+    Raises:
+        ValueError: If an argument is out of range.
+    """
+    if target_ms <= 0:
+        raise ValueError("target_ms must be positive")
+    if not isinstance(max_memory_kib, int) or max_memory_kib < MIN_MEMORY_KIB:
+        raise ValueError(f"max_memory_kib must be an integer of at least {MIN_MEMORY_KIB}")
+    if not isinstance(samples, int) or samples <= 0:
+        raise ValueError("samples must be a positive integer")
+
+    lanes = parallelism or min(os.cpu_count() or 1, 4)
+
+    # Halve the memory until a single iteration fits the budget
+    memory = max_memory_kib
+    while True:
+        profile = Argon2Profile(time_cost=1, memory_cost=memory, parallelism=lanes)
+        elapsed = _measure(profile, samples)
+        if elapsed <= target_ms or memory == MIN_MEMORY_KIB:
+            break
+        memory = max(memory // 2, MIN_MEMORY_KIB)
+
+    if elapsed > target_ms:
+        return profile, elapsed
+
+    # Time cost scales roughly linearly; extrapolate, then step down until it fits
+    time_cost = max(1, int(target_ms / elapsed))
+    while time_cost > 1:
+        candidate = Argon2Profile(time_cost=time_cost, memory_cost=memory, parallelism=lanes)
+        candidate_ms = _measure(candidate, samples)
+        if candidate_ms <= target_ms:
+            return candidate, candidate_ms
+        time_cost -= 1
+
+    return profile, elapsed
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m cryptum.calibrate",
+        description="Recommend Argon2id parameters for this host.",
+    )
+    parser.add_argument("--target-ms", type=float, default=250.0, help="latency budget per hash (default: 250)")
+    parser.add_argument("--max-memory-mib", type=int, default=64, help="memory ceiling per hash (default: 64)")
+    parser.add_argument("--parallelism", type=int, default=None, help="lanes per hash (default: CPU count, max 4)")
+    parser.add_argument("--samples", type=int, default=3, help="timed runs per candidate (default: 3)")
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    profile, elapsed = calibrate(
+        target_ms=args.target_ms,
+        max_memory_kib=args.max_memory_mib * 1024,
+        parallelism=args.parallelism,
+        samples=args.samples,
+    )
+    fits = elapsed <= args.target_ms
+
+    if args.json:
+        print(json.dumps({
+            "time_cost": profile.time_cost,
+            "memory_cost": profile.memory_cost,
+            "parallelism": profile.parallelism,
+            "measured_ms": round(elapsed, 1),
+            "fits_target": fits,
+        }))
+    else:
+        print(f"Measured {elapsed:.1f} ms per hash (target {args.target_ms:g} ms).")
+        if not fits:
+            print("Warning: even the minimum memory setting misses the target on this host.")
+        print("Recommended profile:")
+        print(
+            f"    Argon2Profile(time_cost={profile.time_cost}, "
+            f"memory_cost={profile.memory_cost}, parallelism={profile.parallelism})"
+        )
+    return 0 if fits else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,11 +1,36 @@
-from ._entropy import bytes_entropy, hex_entropy, random_string, urlsafe_entropy
-from ._utils import timing_safe_equals, with_prefix
+from ._entropy import (
+    bytes_entropy,
+    disable_entropy_pool,
+    enable_entropy_pool,
+    hex_entropy,
+    hex_entropy_many,
+    random_string,
+    random_strings,
+    urlsafe_entropy,
+    urlsafe_entropy_many,
+)
+from ._filters import BloomFilter, CuckooFilter
+from ._records import EncryptedSecret, HashedToken, SignedToken
+from ._utils import ITER_CHUNK_SIZE, iter_chunks, timing_safe_equals, with_prefix, with_prefix_many
 
 __all__ = [
     "bytes_entropy",
     "urlsafe_entropy",
     "hex_entropy",
+    "urlsafe_entropy_many",
+    "hex_entropy_many",
     "random_string",
+    "random_strings",
+    "enable_entropy_pool",
+    "disable_entropy_pool",
     "with_prefix",
+    "with_prefix_many",
+    "iter_chunks",
+    "ITER_CHUNK_SIZE",
     "timing_safe_equals",
+    "HashedToken",
+    "SignedToken",
+    "EncryptedSecret",
+    "BloomFilter",
+    "CuckooFilter",
 ]
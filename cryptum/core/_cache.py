@@ -0,0 +1,140 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    A thread-safe, size-bounded LRU cache with a deadline per entry.
+
+    Deadlines are expressed on the cache's clock (time.monotonic by
+    default). Expired entries are dropped when they are looked up or when
+    they reach the LRU end.
+    """
+
+    __slots__ = ("maxsize", "clock", "_data", "_lock", "hits", "misses", "evictions")
+
+    def __init__(self, maxsize: int, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            maxsize: Maximum number of entries.
+            clock: The clock deadlines are measured against.
+
+        Raises:
+            ValueError: If maxsize is not a positive integer.
+        """
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the live value for `key`, or `default` if absent or expired.
+        """
+        now = self.clock()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                self.misses += 1
+                return default
+            if item[0] <= now:
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: Any, expires_at: float) -> None:
+        """
+        Store `value` until `expires_at`, evicting the least recently used entries if full.
+        """
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove `key` and return its value (expired or not), or `default`.
+        """
+        with self._lock:
+            item = self._data.pop(key, _MISSING)
+        return default if item is _MISSING else item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ShardedTTLCache:
+    """
+    A TTLCache split into independently locked shards to reduce contention.
+
+    Keys must be bytes (typically a digest); the first byte selects the shard.
+    """
+
+    __slots__ = ("_shards", "_count")
+
+    def __init__(self, maxsize: int, shards: int = 16, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            maxsize: Maximum number of entries across all shards.
+            shards: Number of shards, between 1 and 256.
+            clock: The clock deadlines are measured against.
+
+        Raises:
+            ValueError: If maxsize or shards is out of range.
+        """
+        if not isinstance(shards, int) or not 0 < shards <= 256:
+            raise ValueError("shards must be an integer between 1 and 256")
+        if not isinstance(maxsize, int) or maxsize < shards:
+            raise ValueError("maxsize must be an integer of at least the shard count")
+
+        self._count = shards
+        self._shards = tuple(TTLCache(maxsize // shards, clock) for _ in range(shards))
+
+    def shard(self, key: bytes) -> TTLCache:
+        return self._shards[key[0] % self._count]
+
+    def get(self, key: bytes, default: Any = None) -> Any:
+        return self.shard(key).get(key, default)
+
+    def set(self, key: bytes, value: Any, expires_at: float) -> None:
+        self.shard(key).set(key, value, expires_at)
+
+    def pop(self, key: bytes, default: Any = None) -> Any:
+        return self.shard(key).pop(key, default)
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return hit, miss and eviction counts and the current size, summed over shards.
+        """
+        return {
+            "hits": sum(shard.hits for shard in self._shards),
+            "misses": sum(shard.misses for shard in self._shards),
+            "evictions": sum(shard.evictions for shard in self._shards),
+            "size": sum(len(shard) for shard in self._shards),
+        }
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
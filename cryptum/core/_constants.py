@@ -16,6 +16,9 @@ ENTROPY_SECRET = 32
 # Identifies an API Access Key at a glance for easier scanning and revocation
 PREFIX_ACCESS_KEY = "ak"
 
+# Marks API keys that embed the ID of their signing key (ak_v2.<key_id>.<random>)
+API_KEY_VERSION = "v2"
+
 # Clearly distinguishes Refresh Tokens from Access Tokens in storage/logs
 PREFIX_REFRESH_TOKEN = "rt"
 
@@ -1,4 +1,121 @@
+import base64
+import functools
+import os
 import secrets
+import threading
+from typing import Optional
+
+# Default size of each per-thread block drawn from the OS CSPRNG by the entropy pool
+POOL_BLOCK_SIZE = 4096
+
+# Largest single OS CSPRNG read made by the *_many functions; bigger batches are
+# drawn in blocks of this size, so only one block of raw bytes is held at a time
+BULK_READ_BYTES = 1 << 20
+
+# (block size, zero buffer of block size // 4 bytes), published together so a
+# reader never pairs one block size with another's zero buffer. Block size 0
+# means the pool is disabled.
+_pool_config: tuple[int, memoryview] = (0, memoryview(b""))
+_pool_lock = threading.Lock()
+_pool_generation = 0
+_pool_local = threading.local()
+
+
+def _bump_generation() -> None:
+    global _pool_generation
+    _pool_generation += 1
+
+
+# A forked child must never hand out bytes that the parent has (or will) also handed out
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_bump_generation)
+
+
+def enable_entropy_pool(block_size: int = POOL_BLOCK_SIZE) -> None:
+    """
+    Serve `bytes_entropy`, `hex_entropy` and `urlsafe_entropy` from per-thread buffers.
+
+    Each thread reads `block_size` bytes from the OS CSPRNG at a time and
+    slices its output from that block, so minting many small tokens costs
+    one syscall per block instead of one per token. Bytes are zeroed in the
+    buffer as soon as they are handed out. Requests larger than a quarter of
+    the block bypass the pool. After a fork, the child discards inherited
+    buffers and refills from the OS.
+
+    Args:
+        block_size: Bytes read from the OS per refill. Must be between 256 and 1 MiB.
+
+    Raises:
+        ValueError: If block_size is out of range.
+    """
+    global _pool_config
+    if not isinstance(block_size, int) or not 256 <= block_size <= 1 << 20:
+        raise ValueError("block_size must be an integer between 256 and 1048576")
+
+    with _pool_lock:
+        _bump_generation()
+        _pool_config = (block_size, memoryview(bytes(block_size // 4)))
+
+
+def disable_entropy_pool() -> None:
+    """
+    Go back to one OS CSPRNG read per call and discard this thread's buffered bytes.
+
+    Buffers held by other threads are invalidated immediately and wiped the
+    next time those threads draw from the pool.
+    """
+    global _pool_config
+    with _pool_lock:
+        _pool_config = (0, memoryview(b""))
+        _bump_generation()
+    state = getattr(_pool_local, "state", None)
+    if state is not None:
+        state.wipe()
+        _pool_local.state = None
+
+
+class _PoolState:
+    __slots__ = ("view", "offset", "generation")
+
+    def __init__(self):
+        self.view: Optional[memoryview] = None
+        self.offset = 0
+        self.generation = -1
+
+    def wipe(self) -> None:
+        if self.view is not None:
+            self.view[:] = bytes(len(self.view))
+            self.view = None
+
+    def refill(self, block_size: int) -> memoryview:
+        self.wipe()
+        # Record the generation before reading, so a fork in between forces another refill
+        self.generation = _pool_generation
+        self.view = memoryview(bytearray(os.urandom(block_size)))
+        self.offset = 0
+        return self.view
+
+
+def _token_bytes(num_bytes: int) -> bytes:
+    block_size, zeros = _pool_config
+    if not block_size or num_bytes > block_size // 4:
+        return secrets.token_bytes(num_bytes)
+
+    state = getattr(_pool_local, "state", None)
+    if state is None:
+        state = _pool_local.state = _PoolState()
+
+    view = state.view
+    offset = state.offset
+    end = offset + num_bytes
+    if view is None or state.generation != _pool_generation or len(view) != block_size or end > block_size:
+        view = state.refill(block_size)
+        offset, end = 0, num_bytes
+
+    chunk = view[offset:end].tobytes()
+    view[offset:end] = zeros[:num_bytes]
+    state.offset = end
+    return chunk
 
 
 def bytes_entropy(num_bytes: int) -> bytes:
@@ -17,7 +134,7 @@ def bytes_entropy(num_bytes: int) -> bytes:
     if not isinstance(num_bytes, int) or num_bytes <= 0:
         raise ValueError("num_bytes must be a positive integer")
 
-    return secrets.token_bytes(num_bytes)
+    return _token_bytes(num_bytes)
 
 
 def urlsafe_entropy(num_bytes: int) -> str:
@@ -40,7 +157,9 @@ def urlsafe_entropy(num_bytes: int) -> str:
     if not isinstance(num_bytes, int) or num_bytes <= 0:
         raise ValueError("num_bytes must be a positive integer")
 
-    return secrets.token_urlsafe(num_bytes)
+    if not _pool_config[0]:
+        return secrets.token_urlsafe(num_bytes)
+    return base64.urlsafe_b64encode(_token_bytes(num_bytes)).rstrip(b"=").decode("ascii")
 
 
 def hex_entropy(num_bytes: int) -> str:
@@ -62,13 +181,130 @@ def hex_entropy(num_bytes: int) -> str:
     if not isinstance(num_bytes, int) or num_bytes <= 0:
         raise ValueError("num_bytes must be a positive integer")
 
-    return secrets.token_hex(num_bytes)
+    if not _pool_config[0]:
+        return secrets.token_hex(num_bytes)
+    return _token_bytes(num_bytes).hex()
+
+
+def _check_many(count: int, num_bytes: int) -> None:
+    if not isinstance(count, int) or count <= 0:
+        raise ValueError("count must be a positive integer")
+    if not isinstance(num_bytes, int) or num_bytes <= 0:
+        raise ValueError("num_bytes must be a positive integer")
+
+
+def _blocks(count: int, item_bytes: int) -> list[int]:
+    """
+    Return the item counts of successive bulk reads covering `count` items of `item_bytes` each.
+    """
+    per_read = max(1, BULK_READ_BYTES // item_bytes)
+    return [min(per_read, count - start) for start in range(0, count, per_read)]
+
+
+def hex_entropy_many(count: int, num_bytes: int) -> list[str]:
+    """
+    Generate many hexadecimal strings from bulk entropy reads.
+
+    Each string is exactly what `hex_entropy(num_bytes)` would return.
+    Entropy is read in blocks of at most `BULK_READ_BYTES`.
+
+    Args:
+        count: The number of strings to generate.
+        num_bytes: The number of entropy bytes behind each string.
+
+    Returns:
+        A list of `count` hexadecimal strings.
+
+    Raises:
+        ValueError: If count or num_bytes is not a positive integer.
+    """
+    _check_many(count, num_bytes)
+
+    width = 2 * num_bytes
+    strings = []
+    for items in _blocks(count, num_bytes):
+        text = _token_bytes(items * num_bytes).hex()
+        strings += [text[start:start + width] for start in range(0, len(text), width)]
+    return strings
+
+
+def urlsafe_entropy_many(count: int, num_bytes: int) -> list[str]:
+    """
+    Generate many URL-safe base64 strings from bulk entropy reads.
+
+    Each string is exactly what `urlsafe_entropy(num_bytes)` would return.
+    Entropy is read in blocks of at most `BULK_READ_BYTES`.
+
+    Args:
+        count: The number of strings to generate.
+        num_bytes: The number of entropy bytes behind each string.
+
+    Returns:
+        A list of `count` URL-safe base64 strings with padding stripped.
+
+    Raises:
+        ValueError: If count or num_bytes is not a positive integer.
+    """
+    _check_many(count, num_bytes)
+
+    encode = base64.urlsafe_b64encode
+    strings = []
+    for items in _blocks(count, num_bytes):
+        view = memoryview(_token_bytes(items * num_bytes))
+        strings += [
+            encode(view[start:start + num_bytes]).rstrip(b"=").decode("ascii")
+            for start in range(0, len(view), num_bytes)
+        ]
+    return strings
+
+
+@functools.lru_cache(maxsize=64)
+def _alphabet_table(alphabet: str) -> Optional[tuple[bytes, bytes, float]]:
+    """
+    Return (translate table, rejected bytes, acceptance rate) for an ASCII alphabet of at most 256 characters.
+
+    Byte b maps to alphabet[b % n]. Bytes at or above the largest multiple
+    of n are deleted, so every character is equally likely.
+    """
+    size = len(alphabet)
+    if size > 256 or not alphabet.isascii():
+        return None
+    limit = 256 - 256 % size
+    table = bytes(ord(alphabet[byte % size]) for byte in range(256))
+    return table, bytes(range(limit, 256)), limit / 256
+
+
+def _sample(count: int, table: tuple[bytes, bytes, float]) -> bytes:
+    """
+    Draw `count` alphabet characters (as ASCII bytes) by rejection sampling bulk random bytes.
+    """
+    translation, rejected, acceptance = table
+    parts = []
+    needed = count
+    while needed > 0:
+        # Over-draw slightly so a second round is rarely needed
+        drawn = _token_bytes(int(needed / acceptance * 1.1) + 8).translate(translation, rejected)
+        parts.append(drawn[:needed])
+        needed -= len(parts[-1])
+    return b"".join(parts)
+
+
+def _check_string_args(length: int, alphabet: str) -> None:
+    if not isinstance(length, int) or length <= 0:
+        raise ValueError("length must be a positive integer")
+    if not alphabet:
+        raise ValueError("alphabet cannot be empty")
 
 
 def random_string(length: int, alphabet: str) -> str:
     """
     Generate a cryptographically secure random string from a given alphabet.
 
+    ASCII alphabets of up to 256 characters are sampled in bulk from random
+    bytes with unbiased rejection sampling; other alphabets fall back to
+    one `secrets.choice` per character. Repeated characters in the alphabet
+    are weighted accordingly in both cases.
+
     Args:
         length: The desired length of the string.
         alphabet: A string of characters to choose from.
@@ -79,9 +315,39 @@ def random_string(length: int, alphabet: str) -> str:
     Raises:
         ValueError: If length is not a positive integer or alphabet is empty.
     """
-    if not isinstance(length, int) or length <= 0:
-        raise ValueError("length must be a positive integer")
-    if not alphabet:
-        raise ValueError("alphabet cannot be empty")
+    _check_string_args(length, alphabet)
+
+    table = _alphabet_table(alphabet) if isinstance(alphabet, str) else None
+    if table is None:
+        return "".join(secrets.choice(alphabet) for _ in range(length))
+    return _sample(length, table).decode("ascii")
+
+
+def random_strings(count: int, length: int, alphabet: str) -> list[str]:
+    """
+    Generate many random strings from one alphabet in bulk draws.
+
+    Args:
+        count: The number of strings to generate.
+        length: The length of each string.
+        alphabet: A string of characters to choose from.
+
+    Returns:
+        A list of `count` random strings.
+
+    Raises:
+        ValueError: If count or length is not a positive integer or alphabet is empty.
+    """
+    if not isinstance(count, int) or count <= 0:
+        raise ValueError("count must be a positive integer")
+    _check_string_args(length, alphabet)
+
+    table = _alphabet_table(alphabet) if isinstance(alphabet, str) else None
+    if table is None:
+        return ["".join(secrets.choice(alphabet) for _ in range(length)) for _ in range(count)]
 
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    strings = []
+    for items in _blocks(count, length):
+        text = _sample(items * length, table).decode("ascii")
+        strings += [text[start:start + length] for start in range(0, len(text), length)]
+    return strings
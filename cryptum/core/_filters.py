@@ -0,0 +1,462 @@
+import functools
+import hashlib
+import math
+import mmap
+import operator
+import os
+import random
+import struct
+import sys
+import tempfile
+from typing import Optional
+
+from ._records import HashedToken
+
+# Blocked layout: all of an item's bits fall in one 32-byte block, so a lookup
+# is one slice and one big-int AND instead of a Python loop over k bit indexes
+_BLOCK_BYTES = 32
+_BLOCK_BITS = _BLOCK_BYTES * 8
+_BIT = tuple(1 << bit for bit in range(_BLOCK_BITS))
+
+# Each hash function is one byte of a BLAKE2b digest, after an 8-byte block index
+_MAX_HASHES = 64 - 8
+
+
+def _blocked_error_rate(bits_per_item: float, num_hashes: int) -> float:
+    """
+    False-positive rate of a blocked Bloom filter: items per block are Poisson distributed.
+    """
+    per_block = _BLOCK_BITS / bits_per_item
+    unset = 1 - 1 / _BLOCK_BITS
+    term = math.exp(-per_block)
+    rate = 0.0
+    for items in range(int(per_block * 6) + 40):
+        rate += term * (1 - unset ** (num_hashes * items)) ** num_hashes
+        term *= per_block / (items + 1)
+    return rate
+
+
+@functools.lru_cache(maxsize=32)
+def _sizing(capacity: int, error_rate: float) -> tuple[int, int]:
+    """
+    Return the (number of blocks, number of hash functions) meeting `error_rate` at `capacity`.
+    """
+    # Start from the classic Bloom filter size; blocking needs somewhat more
+    bits_per_item = -math.log(error_rate) / math.log(2) ** 2
+    while True:
+        num_hashes = min(
+            range(1, _MAX_HASHES + 1),
+            key=lambda hashes: _blocked_error_rate(bits_per_item, hashes),
+        )
+        if _blocked_error_rate(bits_per_item, num_hashes) <= error_rate:
+            return math.ceil(capacity * bits_per_item / _BLOCK_BITS), num_hashes
+        bits_per_item *= 1.05
+
+
+def _digest(item: str | bytes, size: int) -> bytes:
+    if isinstance(item, str):
+        item = item.encode("utf-8")
+    elif not isinstance(item, bytes):
+        raise TypeError("item must be a string or bytes")
+    return hashlib.blake2b(item, digest_size=size).digest()
+
+
+def _locate(digest: bytes, num_blocks: int) -> tuple[int, int]:
+    """
+    Map a digest to (byte offset of its block, mask of its bits within the block).
+    """
+    offset = int.from_bytes(digest[:8], "little") % num_blocks * _BLOCK_BYTES
+    return offset, functools.reduce(operator.or_, map(_BIT.__getitem__, digest[8:]))
+
+
+class BloomFilter:
+    """
+    A fixed-size, blocked Bloom filter over a flat bytearray.
+
+    Membership answers are "definitely not seen" or "probably seen": false
+    positives happen at about `error_rate` once `capacity` items have been
+    added (more beyond that), false negatives never. Memory is fixed at
+    construction, whatever is added later.
+
+    Reads take no lock. Writers must be serialized by the caller, because
+    adding an item rewrites its whole block.
+    """
+
+    __slots__ = ("capacity", "error_rate", "num_blocks", "num_hashes", "count", "_bits")
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: The number of items the filter is sized for.
+            error_rate: The false-positive rate at `capacity` items.
+
+        Raises:
+            ValueError: If capacity is not a positive integer or error_rate is not between 1e-15 and 1.
+        """
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        if not 1e-15 <= error_rate < 1:
+            raise ValueError("error_rate must be between 1e-15 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_blocks, self.num_hashes = _sizing(capacity, error_rate)
+        self.count = 0
+        self._bits = bytearray(self.num_blocks * _BLOCK_BYTES)
+
+    def _locate(self, item: str | bytes) -> tuple[int, int]:
+        return _locate(_digest(item, 8 + self.num_hashes), self.num_blocks)
+
+    def _contains(self, offset: int, mask: int) -> bool:
+        return int.from_bytes(self._bits[offset:offset + _BLOCK_BYTES], "little") & mask == mask
+
+    def _add(self, offset: int, mask: int) -> bool:
+        """
+        Set the bits of `mask` in a block; return True if any was unset (the item was new).
+        """
+        end = offset + _BLOCK_BYTES
+        block = int.from_bytes(self._bits[offset:end], "little")
+        if block & mask == mask:
+            return False
+        self._bits[offset:end] = (block | mask).to_bytes(_BLOCK_BYTES, "little")
+        self.count += 1
+        return True
+
+    def add(self, item: str | bytes) -> bool:
+        """
+        Add an item.
+
+        Returns:
+            True if the item was definitely new, False if it was probably present.
+
+        Raises:
+            TypeError: If item is not a string or bytes.
+        """
+        return self._add(*self._locate(item))
+
+    def __contains__(self, item: str | bytes) -> bool:
+        return self._contains(*self._locate(item))
+
+    def clear(self) -> None:
+        self._bits = bytearray(len(self._bits))
+        self.count = 0
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the bit array, in bytes.
+        """
+        return len(self._bits)
+
+
+# Cuckoo filter file layout: header, then the bucket table.
+#   magic (4) + fingerprint size (1) + slots per bucket (1) + byte order (1)
+#   + padding (1) + bucket count (8) + item count (8) + padding (8)
+# The table is written in the saving machine's native byte order (0 = little,
+# 1 = big), so it can be memory-mapped as is; `load` refuses a mismatch.
+_CUCKOO_MAGIC = b"CKF1"
+_CUCKOO_HEADER = struct.Struct("<4sBBBxQQ8x")
+_BYTE_ORDERS = ("little", "big")
+_SLOTS_PER_BUCKET = 4
+_FINGERPRINT_FORMATS = {1: "B", 2: "H", 4: "I"}
+_MAX_KICKS = 500
+_MAX_LOAD = 0.95
+
+
+def _hash_key(item: str | bytes | HashedToken) -> bytes:
+    """
+    Return at least 16 well-mixed bytes for an item.
+
+    The hashes cryptum's generators return (64 hex characters) and raw
+    SHA-256 digests are used as they are; anything else is hashed first.
+    """
+    if isinstance(item, HashedToken):
+        item = item.hash
+    if isinstance(item, str):
+        if len(item) == 64:
+            try:
+                return bytes.fromhex(item)
+            except ValueError:
+                pass
+        item = item.encode("utf-8")
+    elif not isinstance(item, bytes):
+        raise TypeError("item must be a string, bytes or a HashedToken")
+    elif len(item) == 32:
+        return item
+    return hashlib.blake2b(item, digest_size=16).digest()
+
+
+class CuckooFilter:
+    """
+    A compact set-membership filter with deletion, stored in one flat buffer.
+
+    Each item is reduced to a small fingerprint stored in one of two
+    candidate buckets, so tens of millions of keys fit in a few bytes each
+    instead of a Python object apiece. Lookups answer "definitely not
+    present" or "probably present" (false-positive rate about
+    2 * 4 / 2**(8 * fingerprint_size)); there are no false negatives.
+
+    Items may be the hashes returned by the generators (hex), raw SHA-256
+    digests, HashedToken records, or any string/bytes (hashed first).
+    Adding the same item twice stores it twice; check first for dedup.
+
+    A filter written with `save` can be opened with `load`: the file is
+    memory-mapped read-only, so any number of worker processes share one
+    copy in the page cache. Call `close` (or use the filter as a context
+    manager) to release the mapping. Files are only portable between
+    machines of the same byte order.
+
+    Example:
+        seen = CuckooFilter(capacity=50_000_000)
+        if event.hash not in seen:
+            seen.add(event.hash)
+            process(event)
+    """
+
+    __slots__ = (
+        "fingerprint_size", "num_buckets", "count", "readonly",
+        "_buffer", "_table", "_mask", "_fingerprint_mask", "_random", "_mapping",
+    )
+
+    def __init__(self, capacity: int, fingerprint_size: int = 2):
+        """
+        Args:
+            capacity: The number of items the filter must hold.
+            fingerprint_size: Bytes per fingerprint: 1, 2 or 4. Larger
+                fingerprints lower the false-positive rate (about 3e-2,
+                1.2e-4 and 2e-9) at a proportional memory cost.
+
+        Raises:
+            ValueError: If capacity is not a positive integer or fingerprint_size is not 1, 2 or 4.
+        """
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        if fingerprint_size not in _FINGERPRINT_FORMATS:
+            raise ValueError("fingerprint_size must be 1, 2 or 4")
+
+        # A power of two, so the alternate bucket is a XOR away and reversible
+        buckets = 1 << max(1, math.ceil(math.log2(capacity / (_SLOTS_PER_BUCKET * _MAX_LOAD))))
+        self._setup(bytearray(buckets * _SLOTS_PER_BUCKET * fingerprint_size), fingerprint_size, buckets, 0)
+
+    def _setup(
+        self,
+        buffer,
+        fingerprint_size: int,
+        buckets: int,
+        count: int,
+        readonly: bool = False,
+        mapping: Optional[mmap.mmap] = None,
+    ) -> None:
+        self.fingerprint_size = fingerprint_size
+        self.num_buckets = buckets
+        self.count = count
+        self.readonly = readonly
+        self._buffer = buffer
+        self._table = memoryview(buffer).cast(_FINGERPRINT_FORMATS[fingerprint_size])
+        self._mask = buckets - 1
+        self._fingerprint_mask = (1 << (8 * fingerprint_size)) - 1
+        self._random = random.Random()
+        self._mapping = mapping
+
+    def _locate(self, item: str | bytes | HashedToken) -> tuple[int, int, int]:
+        """
+        Return (fingerprint, first bucket, second bucket) for an item.
+        """
+        key = _hash_key(item)
+        fingerprint = int.from_bytes(key[8:12], "little") & self._fingerprint_mask or 1
+        first = int.from_bytes(key[:8], "little") & self._mask
+        return fingerprint, first, self._alternate(first, fingerprint)
+
+    def _alternate(self, bucket: int, fingerprint: int) -> int:
+        # Deterministic across processes (unlike hash()), so saved filters stay valid
+        return (bucket ^ (fingerprint * 0x5BD1E995 >> 7)) & self._mask
+
+    def _find(self, bucket: int, fingerprint: int) -> int:
+        start = bucket * _SLOTS_PER_BUCKET
+        table = self._table
+        for slot in range(start, start + _SLOTS_PER_BUCKET):
+            if table[slot] == fingerprint:
+                return slot
+        return -1
+
+    def __contains__(self, item: str | bytes | HashedToken) -> bool:
+        # The hot path: _locate inlined, and the second bucket only computed on a miss
+        key = _hash_key(item)
+        fingerprint = int.from_bytes(key[8:12], "little") & self._fingerprint_mask or 1
+        bucket = int.from_bytes(key[:8], "little") & self._mask
+        table = self._table
+        start = bucket * _SLOTS_PER_BUCKET
+        if fingerprint in table[start:start + _SLOTS_PER_BUCKET]:
+            return True
+        start = self._alternate(bucket, fingerprint) * _SLOTS_PER_BUCKET
+        return fingerprint in table[start:start + _SLOTS_PER_BUCKET]
+
+    def _check_writable(self) -> None:
+        if self.readonly:
+            raise ValueError("filter was loaded read-only")
+
+    def add(self, item: str | bytes | HashedToken) -> None:
+        """
+        Add an item.
+
+        Raises:
+            TypeError: If item is not a string, bytes or a HashedToken.
+            ValueError: If the filter is read-only, or full (the filter is
+                left unchanged; build a larger one).
+        """
+        self._check_writable()
+        fingerprint, first, second = self._locate(item)
+        for bucket in (first, second):
+            slot = self._find(bucket, 0)
+            if slot >= 0:
+                self._table[slot] = fingerprint
+                self.count += 1
+                return
+
+        # Both buckets are full: evict fingerprints along a random walk,
+        # remembering each swap so a failed walk can be undone
+        table = self._table
+        bucket = self._random.choice((first, second))
+        swaps = []
+        for _ in range(_MAX_KICKS):
+            slot = bucket * _SLOTS_PER_BUCKET + self._random.randrange(_SLOTS_PER_BUCKET)
+            fingerprint, table[slot] = table[slot], fingerprint
+            swaps.append(slot)
+            bucket = self._alternate(bucket, fingerprint)
+            free = self._find(bucket, 0)
+            if free >= 0:
+                table[free] = fingerprint
+                self.count += 1
+                return
+
+        for slot in reversed(swaps):
+            fingerprint, table[slot] = table[slot], fingerprint
+        raise ValueError("filter is full")
+
+    def remove(self, item: str | bytes | HashedToken) -> bool:
+        """
+        Remove one copy of an item.
+
+        Only remove items that were added: removing an absent item that
+        shares a fingerprint with a present one removes the wrong one.
+
+        Returns:
+            True if a matching fingerprint was removed.
+
+        Raises:
+            ValueError: If the filter is read-only.
+        """
+        self._check_writable()
+        fingerprint, first, second = self._locate(item)
+        for bucket in (first, second):
+            slot = self._find(bucket, fingerprint)
+            if slot >= 0:
+                self._table[slot] = 0
+                self.count -= 1
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Size of the bucket table, in bytes.
+        """
+        return self._table.nbytes
+
+    @property
+    def load_factor(self) -> float:
+        """
+        Fraction of slots in use. Inserts start failing around 0.95.
+        """
+        return self.count / (self.num_buckets * _SLOTS_PER_BUCKET)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Write the filter to a file, atomically, for `load`.
+        """
+        header = _CUCKOO_HEADER.pack(
+            _CUCKOO_MAGIC, self.fingerprint_size, _SLOTS_PER_BUCKET,
+            _BYTE_ORDERS.index(sys.byteorder), self.num_buckets, self.count,
+        )
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".cuckoo-")
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                handle.write(header)
+                handle.write(self._table.cast("B"))
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, writable: bool = False) -> "CuckooFilter":
+        """
+        Open a filter written by `save`.
+
+        Args:
+            path: The file to open.
+            writable: By default the file is memory-mapped read-only and
+                shared between processes; `add` and `remove` then raise.
+                Pass True to read a private, writable copy instead.
+
+        Raises:
+            ValueError: If the file is not a valid cuckoo filter, or was saved
+                on a machine of the other byte order.
+        """
+        mapped = None
+        with open(path, "rb") as handle:
+            if writable:
+                data = handle.read()
+                header, buffer = data[:_CUCKOO_HEADER.size], bytearray(data[_CUCKOO_HEADER.size:])
+            else:
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                header, buffer = mapped[:_CUCKOO_HEADER.size], memoryview(mapped)[_CUCKOO_HEADER.size:]
+
+        try:
+            if len(header) != _CUCKOO_HEADER.size:
+                raise ValueError("not a cuckoo filter file")
+            magic, fingerprint_size, slots, byte_order, buckets, count = _CUCKOO_HEADER.unpack(header)
+            if (
+                magic != _CUCKOO_MAGIC
+                or slots != _SLOTS_PER_BUCKET
+                or fingerprint_size not in _FINGERPRINT_FORMATS
+                or byte_order >= len(_BYTE_ORDERS)
+                or buckets & (buckets - 1)
+                or len(buffer) != buckets * slots * fingerprint_size
+            ):
+                raise ValueError("not a cuckoo filter file")
+            if fingerprint_size > 1 and _BYTE_ORDERS[byte_order] != sys.byteorder:
+                raise ValueError("cuckoo filter file was saved with a different byte order")
+        except ValueError:
+            if mapped is not None:
+                buffer.release()
+                mapped.close()
+            raise
+
+        cuckoo = cls.__new__(cls)
+        cuckoo._setup(buffer, fingerprint_size, buckets, count, readonly=not writable, mapping=mapped)
+        return cuckoo
+
+    def close(self) -> None:
+        """
+        Release the bucket table and, for a filter opened by `load`, its memory mapping.
+
+        The filter cannot be used afterwards. Calling this again does nothing.
+        """
+        self._table.release()
+        if isinstance(self._buffer, memoryview):
+            self._buffer.release()
+        if self._mapping is not None:
+            self._mapping.close()
+
+    def __enter__(self) -> "CuckooFilter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,147 @@
+from collections.abc import Mapping
+from typing import Any, Callable, Iterator, Optional
+
+
+class _Record(Mapping):
+    """
+    Base for small immutable result records that also read like the dicts they replace.
+
+    Fields are attributes (`token.plaintext`), but `token["plaintext"]`,
+    `dict(token)`, `token.get(...)` and comparison with a plain dict keep
+    working for code written against the old dict results.
+
+    Records are not dicts, though: `isinstance(token, dict)` is False,
+    `json.dumps` refuses them and they cannot be mutated. Call `to_dict()`
+    for a plain, JSON-serializable dict of the same shape.
+
+    Subclasses list their keys in `_FIELDS`, as a class attribute or a slot.
+    """
+
+    __slots__ = ()
+
+    _FIELDS: tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._FIELDS)
+
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the fields as a new plain dict, e.g. for `json.dumps` or to modify.
+        """
+        return {key: getattr(self, key) for key in self._FIELDS}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        # Never echo secrets into logs or tracebacks
+        return f"{type(self).__name__}({', '.join(self._FIELDS)})"
+
+
+class HashedToken(_Record):
+    """
+    A generated secret and its hash for storage.
+
+    When built with `hash_fn`, the hash is computed on first access and then
+    kept, so callers that only need the plaintext never pay for hashing.
+    """
+
+    __slots__ = ("plaintext", "_hash", "_hash_fn")
+
+    _FIELDS = ("plaintext", "hash")
+
+    def __init__(
+        self,
+        plaintext: str,
+        hash: Optional[str] = None,
+        hash_fn: Optional[Callable[[str], str]] = None,
+    ):
+        """
+        Args:
+            plaintext: The secret to hand to the user.
+            hash: The precomputed hash, if already known.
+            hash_fn: Computes the hash from the plaintext on first access.
+
+        Raises:
+            ValueError: If neither or both of hash and hash_fn are given.
+        """
+        if (hash is None) == (hash_fn is None):
+            raise ValueError("exactly one of hash and hash_fn must be given")
+
+        object.__setattr__(self, "plaintext", plaintext)
+        object.__setattr__(self, "_hash", hash)
+        object.__setattr__(self, "_hash_fn", hash_fn)
+
+    @property
+    def hash(self) -> str:
+        value = self._hash
+        if value is None:
+            value = self._hash_fn(self.plaintext)
+            object.__setattr__(self, "_hash", value)
+            object.__setattr__(self, "_hash_fn", None)
+        return value
+
+    def __reduce__(self):
+        return (HashedToken, (self.plaintext, self.hash))
+
+
+_SIGNED_FIELDS = ("plaintext", "signature")
+_SIGNED_FIELDS_WITH_KEY_ID = ("plaintext", "signature", "key_id")
+
+
+class SignedToken(_Record):
+    """
+    A generated secret and its HMAC signature, plus the signing key ID when a KeyRing was used.
+    """
+
+    # key_id only appears as a key when a KeyRing signed the token, so the
+    # field list is chosen per instance
+    __slots__ = ("plaintext", "signature", "key_id", "_FIELDS")
+
+    def __init__(self, plaintext: str, signature: str, key_id: Optional[str] = None):
+        """
+        Args:
+            plaintext: The secret to hand to the user.
+            signature: The hexadecimal signature to store.
+            key_id: The signing key ID, if any.
+        """
+        object.__setattr__(self, "plaintext", plaintext)
+        object.__setattr__(self, "signature", signature)
+        object.__setattr__(self, "key_id", key_id)
+        object.__setattr__(self, "_FIELDS", _SIGNED_FIELDS if key_id is None else _SIGNED_FIELDS_WITH_KEY_ID)
+
+    def __reduce__(self):
+        return (SignedToken, (self.plaintext, self.signature, self.key_id))
+
+
+class EncryptedSecret(_Record):
+    """
+    A generated secret and its encrypted form for storage.
+    """
+
+    __slots__ = ("plaintext", "encrypted")
+
+    _FIELDS = ("plaintext", "encrypted")
+
+    def __init__(self, plaintext: str, encrypted: str):
+        """
+        Args:
+            plaintext: The secret to hand to the user.
+            encrypted: The encrypted Base64 blob to store.
+        """
+        object.__setattr__(self, "plaintext", plaintext)
+        object.__setattr__(self, "encrypted", encrypted)
+
+    def __reduce__(self):
+        return (EncryptedSecret, (self.plaintext, self.encrypted))
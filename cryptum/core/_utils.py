@@ -1,4 +1,10 @@
 import hmac
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+# Default number of items per chunk yielded by the generators' iter_many
+ITER_CHUNK_SIZE = 10_000
+
+T = TypeVar("T")
 
 
 def with_prefix(prefix: str, value: str) -> str:
@@ -27,6 +33,28 @@ def with_prefix(prefix: str, value: str) -> str:
     return f"{stripped_prefix}_{stripped_value}"
 
 
+def with_prefix_many(prefix: str, values: Iterable[str]) -> list[str]:
+    """
+    Apply `with_prefix` to many values, validating the prefix once.
+
+    Args:
+        prefix: The prefix string. Must be non-empty.
+        values: The value strings.
+
+    Returns:
+        The prefixed strings, in input order.
+
+    Raises:
+        ValueError: If prefix is empty or exclusively underscores.
+    """
+    stripped_prefix = prefix.strip("_")
+    if not stripped_prefix:
+        raise ValueError("prefix must be a non-empty string")
+
+    head = stripped_prefix + "_"
+    return [head + value.lstrip("_") for value in values]
+
+
 def timing_safe_equals(a: str, b: str) -> bool:
     """
     Compare two strings in constant time to prevent timing attacks.
@@ -39,3 +67,37 @@ def timing_safe_equals(a: str, b: str) -> bool:
         True if the strings are equal, False otherwise.
     """
     return hmac.compare_digest(a, b)
+
+
+def iter_chunks(
+    generate_many: Callable[..., T],
+    count: int,
+    chunk_size: int = ITER_CHUNK_SIZE,
+    *args: Any,
+) -> Iterator[T]:
+    """
+    Call `generate_many(n, *args)` repeatedly until `count` items have been produced.
+
+    This backs every `iter_many` function. Chunks are generated only when
+    asked for, so as long as the caller drops each chunk before taking the
+    next (e.g. writing it to a file or a database COPY), memory stays
+    bounded by `chunk_size` however large `count` is. Arguments are checked
+    when this is called, not on the first `next()`.
+
+    Args:
+        generate_many: A bulk generator taking the item count first.
+        count: The total number of items.
+        chunk_size: The maximum number of items per chunk.
+        *args: Further arguments for `generate_many`, passed to every call.
+
+    Returns:
+        An iterator of `generate_many` results; the last one may be shorter.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    if not isinstance(count, int) or count <= 0:
+        raise ValueError("count must be a positive integer")
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    return (generate_many(min(chunk_size, count - start), *args) for start in range(0, count, chunk_size))
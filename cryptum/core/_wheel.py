@@ -0,0 +1,136 @@
+import math
+from typing import Hashable
+
+# 4 levels of 64 slots: level L holds deadlines up to 64**(L+1) ticks ahead.
+# Anything further out waits in an overflow slot until its range comes up.
+_BITS = 6
+_SLOTS = 1 << _BITS
+_MASK = _SLOTS - 1
+_LEVELS = 4
+
+# When the clock jumps further than this, one pass over every key is cheaper
+# than stepping through each skipped tick
+_REBUILD_GAP = _SLOTS * _SLOTS
+
+
+class TimingWheel:
+    """
+    A hierarchical timing wheel: O(1) schedule and cancel, amortized O(1) expiry.
+
+    Deadlines are rounded up to whole ticks of `resolution` seconds. A key is
+    first filed on the coarsest level whose range covers it, then moved to
+    finer levels as its tick approaches, so expiring never scans keys that
+    are not yet due. Not thread-safe; the owner serializes access.
+    """
+
+    __slots__ = ("resolution", "_tick", "_levels", "_overflow", "_where")
+
+    def __init__(self, resolution: float, now: float):
+        """
+        Args:
+            resolution: Seconds per tick.
+            now: The current time on the owner's clock.
+
+        Raises:
+            ValueError: If resolution is not positive.
+        """
+        if not resolution > 0:
+            raise ValueError("resolution must be positive")
+
+        self.resolution = resolution
+        self._tick = int(now // resolution)
+        self._levels = [[set() for _ in range(_SLOTS)] for _ in range(_LEVELS)]
+        self._overflow: set = set()
+        # key -> (deadline tick, the slot holding it)
+        self._where: dict[Hashable, tuple[int, set]] = {}
+
+    def _slot_for(self, deadline: int) -> set:
+        tick = self._tick
+        for level in range(_LEVELS):
+            shift = _BITS * (level + 1)
+            if deadline >> shift == tick >> shift:
+                return self._levels[level][(deadline >> (_BITS * level)) & _MASK]
+        return self._overflow
+
+    def _place(self, key: Hashable, deadline: int) -> None:
+        slot = self._slot_for(deadline)
+        slot.add(key)
+        self._where[key] = (deadline, slot)
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """
+        Expire `key` once the clock reaches `deadline`, replacing any earlier schedule.
+        """
+        self.cancel(key)
+        self._place(key, max(math.ceil(deadline / self.resolution), self._tick + 1))
+
+    def cancel(self, key: Hashable) -> None:
+        where = self._where.pop(key, None)
+        if where is not None:
+            where[1].discard(key)
+
+    def _cascade(self, slot: set) -> None:
+        keys = list(slot)
+        slot.clear()
+        for key in keys:
+            self._place(key, self._where[key][0])
+
+    def advance(self, now: float) -> list[Hashable]:
+        """
+        Move the wheel to `now` and return the keys whose deadline has passed.
+        """
+        target = int(now // self.resolution)
+        if target <= self._tick:
+            return []
+
+        if target - self._tick > _REBUILD_GAP:
+            return self._rebuild(target)
+
+        expired = []
+        levels = self._levels
+        where = self._where
+        while self._tick < target:
+            tick = self._tick = self._tick + 1
+            if tick & _MASK == 0:
+                # Coarsest first, so keys cascading out of a level land in a
+                # finer slot that is itself cascaded on this same tick
+                if tick & ((1 << (_BITS * _LEVELS)) - 1) == 0:
+                    self._cascade(self._overflow)
+                for level in range(_LEVELS - 1, 0, -1):
+                    if tick & ((1 << (_BITS * level)) - 1) == 0:
+                        self._cascade(levels[level][(tick >> (_BITS * level)) & _MASK])
+
+            slot = levels[0][tick & _MASK]
+            if slot:
+                for key in slot:
+                    del where[key]
+                expired.extend(slot)
+                slot.clear()
+        return expired
+
+    def _rebuild(self, target: int) -> list[Hashable]:
+        deadlines = {key: deadline for key, (deadline, _) in self._where.items()}
+        for level in self._levels:
+            for slot in level:
+                slot.clear()
+        self._overflow.clear()
+        self._where.clear()
+        self._tick = target
+
+        expired = []
+        for key, deadline in deadlines.items():
+            if deadline <= target:
+                expired.append(key)
+            else:
+                self._place(key, deadline)
+        return expired
+
+    def clear(self) -> None:
+        for level in self._levels:
+            for slot in level:
+                slot.clear()
+        self._overflow.clear()
+        self._where.clear()
+
+    def __len__(self) -> int:
+        return len(self._where)
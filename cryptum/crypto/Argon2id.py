@@ -1,21 +1,138 @@
-from argon2 import PasswordHasher, exceptions, Type
+import asyncio
+import builtins
+import contextvars
+import functools
+import operator
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+from argon2 import PasswordHasher, exceptions, extract_parameters, Type
 
+from cryptum.instrumentation import instrumented
 
-def hash(secret: str) -> str:
+
+@dataclass(frozen=True)
+class Argon2Profile:
+    """
+    An immutable set of Argon2id cost parameters.
+
+    Profiles are hashable, and the PasswordHasher for each profile is built
+    once and shared, so hashing never pays for hasher construction.
+
+    Attributes:
+        time_cost: Number of iterations.
+        memory_cost: Memory usage in KiB.
+        parallelism: Number of lanes (threads).
+        hash_len: Length of the raw hash in bytes.
+        salt_len: Length of the random salt in bytes.
+    """
+
+    time_cost: int = 3
+    memory_cost: int = 65536
+    parallelism: int = 2
+    hash_len: int = 32
+    salt_len: int = 16
+
+    def __post_init__(self):
+        for name in ("time_cost", "memory_cost", "parallelism", "hash_len", "salt_len"):
+            value = getattr(self, name)
+            if not isinstance(value, int) or value <= 0:
+                raise ValueError(f"{name} must be a positive integer")
+
+        # Argon2 requires at least 8 KiB of memory per lane
+        if self.memory_cost < 8 * self.parallelism:
+            raise ValueError("memory_cost must be at least 8 KiB per unit of parallelism")
+
+    def __hash__(self) -> int:
+        # Spelled out because this module's `hash` function shadows the builtin
+        # that the dataclass-generated __hash__ would look up.
+        return builtins.hash(
+            (self.time_cost, self.memory_cost, self.parallelism, self.hash_len, self.salt_len)
+        )
+
+    @property
+    def hasher(self) -> PasswordHasher:
+        """
+        The shared PasswordHasher configured with this profile.
+        """
+        return _hasher_for(self)
+
+
+@functools.lru_cache(maxsize=None)
+def _hasher_for(profile: Argon2Profile) -> PasswordHasher:
+    return PasswordHasher(
+        time_cost=profile.time_cost,
+        memory_cost=profile.memory_cost,
+        parallelism=profile.parallelism,
+        hash_len=profile.hash_len,
+        salt_len=profile.salt_len,
+        type=Type.ID,
+    )
+
+
+# Latency-sensitive logins: 3 iterations, 64 MiB, 2 lanes
+PROFILE_INTERACTIVE = Argon2Profile()
+
+# Rarely used, high-value secrets: 4 iterations, 256 MiB, 4 lanes
+PROFILE_SENSITIVE = Argon2Profile(time_cost=4, memory_cost=262144, parallelism=4)
+
+# Memory-constrained containers (OWASP minimum): 2 iterations, 19 MiB, 1 lane
+PROFILE_LOW_MEMORY = Argon2Profile(time_cost=2, memory_cost=19456, parallelism=1)
+
+DEFAULT_PROFILE = PROFILE_INTERACTIVE
+
+# Optional out-of-process backend (e.g. argon2_pool.Argon2Pool); see set_backend
+_backend = None
+
+
+def set_backend(backend) -> None:
+    """
+    Route `hash` and `verify` through an alternative backend.
+
+    The backend must provide `hash(secret, profile)` and `verify(secret, hash)`
+    with the same semantics as this module, such as `argon2_pool.Argon2Pool`.
+    A `hash_many(secrets, profile)` method, if present, is used by `hash_many`.
+    `secrets.passwords` follows automatically.
+
+    Args:
+        backend: The backend to use, or None to hash in-process again.
+    """
+    global _backend
+    _backend = backend
+
+
+def _hash_local(secret: str, profile: Optional[Argon2Profile] = None) -> str:
+    return (profile or DEFAULT_PROFILE).hasher.hash(secret)
+
+
+def _verify_local(secret: str, hash: str) -> bool:
+    try:
+        return DEFAULT_PROFILE.hasher.verify(hash, secret)
+    except exceptions.VerifyMismatchError:
+        return False
+    except Exception:
+        return False
+
+
+@instrumented("argon2id.hash")
+def hash(secret: str, profile: Optional[Argon2Profile] = None) -> str:
     """
     Hash a secret using Argon2id.
 
     Argon2id is used because it provides the best of both worlds: it is resistant
-    to side-channel timing attacks (inherited from Argon2i) and GPU-based 
+    to side-channel timing attacks (inherited from Argon2i) and GPU-based
     cracking attacks (inherited from Argon2d).
 
-    This implementation uses conservative, modern defaults:
+    By default this uses conservative, modern parameters (PROFILE_INTERACTIVE):
     - Time cost: 3 iterations
     - Memory cost: 64 MiB (65536 KiB)
     - Parallelism: 2 threads
 
     Args:
         secret: The plain-text secret string to hash.
+        profile: The cost parameters to use. Defaults to DEFAULT_PROFILE.
 
     Returns:
         A string containing the encoded hash, including salt and parameters.
@@ -26,23 +143,50 @@ def hash(secret: str) -> str:
     if not isinstance(secret, str):
         raise TypeError("secret must be a string")
 
-    # We instantiate the hasher inside to avoid global mutable state
-    hasher = PasswordHasher(
-        time_cost=3,
-        memory_cost=65536,
-        parallelism=2,
-        hash_len=32,
-        salt_len=16,
-        type=Type.ID,
-    )
+    backend = _backend
+    if backend is not None:
+        return backend.hash(secret, profile)
+    return _hash_local(secret, profile)
+
 
-    return hasher.hash(secret)
+# Reachable from functions whose `hash` parameter shadows the function above
+_hash = hash
 
 
+def hash_many(secrets: Iterable[str], profile: Optional[Argon2Profile] = None) -> list[str]:
+    """
+    Hash many secrets with Argon2id, in batches when the backend supports it.
+
+    Args:
+        secrets: The plain-text secret strings to hash.
+        profile: The cost parameters to use. Defaults to DEFAULT_PROFILE.
+
+    Returns:
+        The encoded hashes, in input order.
+
+    Raises:
+        TypeError: If a secret is not a string.
+    """
+    secrets = list(secrets)
+    if not all(isinstance(secret, str) for secret in secrets):
+        raise TypeError("secret must be a string")
+
+    backend = _backend
+    if backend is not None:
+        if hasattr(backend, "hash_many"):
+            return backend.hash_many(secrets, profile)
+        return [backend.hash(secret, profile) for secret in secrets]
+    return [_hash_local(secret, profile) for secret in secrets]
+
+
+@instrumented("argon2id.verify", failure=operator.not_)
 def verify(secret: str, hash: str) -> bool:
     """
     Verify a secret against an Argon2id hash.
 
+    The cost parameters are read from the encoded hash itself, so hashes
+    created under an older profile keep verifying after the defaults change.
+
     Args:
         secret: The plain-text secret string to verify.
         hash: The encoded hash string to verify against.
@@ -53,18 +197,344 @@ def verify(secret: str, hash: str) -> bool:
     if not isinstance(secret, str) or not isinstance(hash, str):
         raise TypeError("secret and hash must be strings")
 
-    hasher = PasswordHasher(
-        time_cost=3,
-        memory_cost=65536,
-        parallelism=2,
-        hash_len=32,
-        salt_len=16,
-        type=Type.ID,
-    )
+    backend = _backend
+    if backend is not None:
+        return backend.verify(secret, hash)
+    return _verify_local(secret, hash)
+
+
+def needs_rehash(hash: str, profile: Optional[Argon2Profile] = None) -> bool:
+    """
+    Check whether a stored hash was created with parameters other than a profile's.
+
+    Args:
+        hash: The encoded hash string.
+        profile: The profile new hashes should use. Defaults to DEFAULT_PROFILE.
+
+    Returns:
+        True if the hash should be replaced by a hash under `profile`.
+
+    Raises:
+        TypeError: If the hash is not a string.
+    """
+    if not isinstance(hash, str):
+        raise TypeError("hash must be a string")
 
     try:
-        return hasher.verify(hash, secret)
-    except exceptions.VerifyMismatchError:
+        return (profile or DEFAULT_PROFILE).hasher.check_needs_rehash(hash)
+    except exceptions.InvalidHashError:
+        return True
+
+
+def verify_and_update(
+    secret: str,
+    hash: str,
+    profile: Optional[Argon2Profile] = None,
+) -> tuple[bool, Optional[str]]:
+    """
+    Verify a secret and, if it matches an outdated hash, rehash it.
+
+    This lets a fleet migrate to new cost parameters gradually, one
+    successful login at a time, with no bulk job.
+
+    Args:
+        secret: The plain-text secret string to verify.
+        hash: The stored encoded hash.
+        profile: The profile new hashes should use. Defaults to DEFAULT_PROFILE.
+
+    Returns:
+        A tuple (valid, new_hash). new_hash is a fresh hash under `profile`
+        when the secret is valid but the stored hash is outdated; store it in
+        place of the old one. Otherwise it is None.
+    """
+    if not verify(secret, hash):
+        return False, None
+
+    if needs_rehash(hash, profile):
+        return True, _hash(secret, profile)
+    return True, None
+
+
+class Argon2Overloaded(RuntimeError):
+    """
+    Raised when an Argon2Scheduler cannot admit a call: its wait queue is
+    full, or the call waited longer than its timeout.
+    """
+
+
+class _Waiter:
+    __slots__ = ("cost", "granted", "wake")
+
+    def __init__(self, cost: int, wake: Callable[[], None]):
+        self.cost = cost
+        self.granted = False
+        self.wake = wake
+
+
+class Argon2Scheduler:
+    """
+    Admission control for Argon2 calls under a global memory budget.
+
+    Every hash or verify reserves its memory cost before it runs. Calls that
+    do not fit wait in a bounded FIFO queue; when the queue is full, or a
+    call waits longer than its timeout, Argon2Overloaded is raised instead
+    of allocating. Synchronous and asyncio callers share the same budget and
+    queue.
+
+    Example:
+        scheduler = Argon2Scheduler(memory_budget_kib=1024 * 1024)  # 1 GiB
+        scheduler.verify(password, stored_hash)
+        await scheduler.averify(password, stored_hash)
+    """
+
+    def __init__(
+        self,
+        memory_budget_kib: int = 1024 * 1024,
+        max_queue: int = 1024,
+        timeout: Optional[float] = 5.0,
+    ):
+        """
+        Args:
+            memory_budget_kib: Maximum Argon2 memory in flight, in KiB. Defaults to 1 GiB.
+            max_queue: Maximum number of calls waiting for admission.
+            timeout: Default seconds a call may wait for admission. None waits forever.
+
+        Raises:
+            ValueError: If memory_budget_kib or max_queue is not a positive integer.
+        """
+        if not isinstance(memory_budget_kib, int) or memory_budget_kib <= 0:
+            raise ValueError("memory_budget_kib must be a positive integer")
+        if not isinstance(max_queue, int) or max_queue <= 0:
+            raise ValueError("max_queue must be a positive integer")
+
+        self.memory_budget_kib = memory_budget_kib
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._queue: deque[_Waiter] = deque()
+        self._in_use = 0
+
+        self._admitted = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def _grant_locked(self) -> None:
+        # Strict FIFO: a large waiter at the head is never starved by smaller ones behind it
+        while self._queue and self._in_use + self._queue[0].cost <= self.memory_budget_kib:
+            waiter = self._queue.popleft()
+            self._in_use += waiter.cost
+            waiter.granted = True
+            waiter.wake()
+
+    def _enqueue_locked(self, cost: int, wake: Callable[[], None]) -> Optional[_Waiter]:
+        """
+        Admit immediately if possible; otherwise queue a waiter and return it.
+        """
+        if cost > self.memory_budget_kib:
+            raise ValueError("memory cost exceeds the scheduler's memory budget")
+
+        if not self._queue and self._in_use + cost <= self.memory_budget_kib:
+            self._in_use += cost
+            self._admitted += 1
+            return None
+
+        if len(self._queue) >= self.max_queue:
+            self._rejected += 1
+            raise Argon2Overloaded("Argon2 queue is full")
+
+        waiter = _Waiter(cost, wake)
+        self._queue.append(waiter)
+        return waiter
+
+    def _settle_locked(self, waiter: _Waiter, waited: float) -> bool:
+        """
+        Finish waiting: record the wait if granted, otherwise withdraw the waiter.
+        """
+        if waiter.granted:
+            self._admitted += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+            return True
+
+        self._queue.remove(waiter)
+        self._grant_locked()
         return False
+
+    def _release(self, cost: int) -> None:
+        with self._lock:
+            self._in_use -= cost
+            self._grant_locked()
+
+    def _acquire(self, cost: int, timeout: Optional[float]) -> None:
+        event = threading.Event()
+        with self._lock:
+            waiter = self._enqueue_locked(cost, event.set)
+        if waiter is None:
+            return
+
+        started = time.monotonic()
+        event.wait(timeout)
+        with self._lock:
+            if self._settle_locked(waiter, time.monotonic() - started):
+                return
+            self._timed_out += 1
+        raise Argon2Overloaded("timed out waiting for Argon2 memory budget")
+
+    async def _aacquire(self, cost: int, timeout: Optional[float]) -> None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve() -> None:
+            if not future.done():
+                future.set_result(None)
+
+        with self._lock:
+            waiter = self._enqueue_locked(cost, lambda: loop.call_soon_threadsafe(resolve))
+        if waiter is None:
+            return
+
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            pass
+        except BaseException:
+            # Cancelled: give back the budget whether or not it was granted meanwhile
+            with self._lock:
+                granted = self._settle_locked(waiter, time.monotonic() - started)
+            if granted:
+                self._release(cost)
+            raise
+
+        with self._lock:
+            if self._settle_locked(waiter, time.monotonic() - started):
+                return
+            self._timed_out += 1
+        raise Argon2Overloaded("timed out waiting for Argon2 memory budget")
+
+    def _run(self, cost: int, timeout: Optional[float], operation: Callable):
+        self._acquire(cost, self.timeout if timeout is None else timeout)
+        try:
+            return operation()
+        finally:
+            self._release(cost)
+
+    async def _arun(self, cost: int, timeout: Optional[float], operation: Callable, offload: bool = True):
+        await self._aacquire(cost, self.timeout if timeout is None else timeout)
+        if not offload:
+            try:
+                return operation()
+            finally:
+                self._release(cost)
+
+        # Imported here: cryptum.aio itself imports this module
+        from cryptum import aio
+
+        call = functools.partial(contextvars.copy_context().run, operation)
+        future = asyncio.get_running_loop().run_in_executor(aio.executor(), call)
+        # The budget is held until the worker thread really finishes, even if
+        # the awaiting task is cancelled first.
+        future.add_done_callback(lambda _: self._release(cost))
+        return await asyncio.shield(future)
+
+    def hash(self, secret: str, profile: Optional[Argon2Profile] = None, timeout: Optional[float] = None) -> str:
+        """
+        Hash a secret with Argon2id once its memory cost fits the budget.
+
+        Args:
+            secret: The plain-text secret string to hash.
+            profile: The cost parameters to use. Defaults to DEFAULT_PROFILE.
+            timeout: Seconds to wait for admission. Defaults to the scheduler's timeout.
+
+        Returns:
+            The encoded Argon2id hash.
+
+        Raises:
+            TypeError: If the secret is not a string.
+            Argon2Overloaded: If the call cannot be admitted.
+        """
+        profile = profile or DEFAULT_PROFILE
+        return self._run(profile.memory_cost, timeout, lambda: hash(secret, profile))
+
+    def verify(self, secret: str, hash: str, timeout: Optional[float] = None) -> bool:
+        """
+        Verify a secret against an Argon2id hash once its memory cost fits the budget.
+
+        The memory cost is read from the encoded hash. A malformed hash
+        returns False without taking any budget.
+
+        Args:
+            secret: The plain-text secret string to verify.
+            hash: The encoded hash string to verify against.
+            timeout: Seconds to wait for admission. Defaults to the scheduler's timeout.
+
+        Returns:
+            True if the secret matches the hash, False otherwise.
+
+        Raises:
+            Argon2Overloaded: If the call cannot be admitted.
+        """
+        cost = _memory_cost_of(hash)
+        if cost is None:
+            return False
+        return self._run(cost, timeout, lambda: verify(secret, hash))
+
+    async def ahash(self, secret: str, profile: Optional[Argon2Profile] = None, timeout: Optional[float] = None) -> str:
+        """
+        Asyncio variant of `hash`. Waiting does not block the event loop, and
+        the hashing itself runs on the shared `cryptum.aio` executor.
+        """
+        profile = profile or DEFAULT_PROFILE
+        return await self._arun(profile.memory_cost, timeout, lambda: hash(secret, profile))
+
+    async def averify(self, secret: str, hash: str, timeout: Optional[float] = None) -> bool:
+        """
+        Asyncio variant of `verify`. Waiting does not block the event loop, and
+        the verification itself runs on the shared `cryptum.aio` executor.
+        """
+        cost = _memory_cost_of(hash)
+        if cost is None:
+            return False
+        return await self._arun(cost, timeout, lambda: verify(secret, hash))
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Return a snapshot of the scheduler's metrics.
+
+        Returns:
+            A dictionary containing:
+            - 'queue_depth': Calls currently waiting for admission.
+            - 'in_flight_kib': Argon2 memory currently reserved.
+            - 'memory_budget_kib': The configured budget.
+            - 'admitted': Calls admitted so far.
+            - 'rejected': Calls rejected because the queue was full.
+            - 'timed_out': Calls that gave up waiting.
+            - 'wait_seconds_total': Total time admitted calls spent queued.
+            - 'wait_seconds_max': Longest time an admitted call spent queued.
+        """
+        with self._lock:
+            return {
+                "queue_depth": len(self._queue),
+                "in_flight_kib": self._in_use,
+                "memory_budget_kib": self.memory_budget_kib,
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "wait_seconds_total": self._wait_total,
+                "wait_seconds_max": self._wait_max,
+            }
+
+
+def _memory_cost_of(encoded_hash: str) -> Optional[int]:
+    """
+    Read the memory cost (KiB) from an encoded Argon2 hash, or None if malformed.
+    """
+    if not isinstance(encoded_hash, str):
+        return None
+    try:
+        return extract_parameters(encoded_hash).memory_cost
     except Exception:
-        return False
+        return None
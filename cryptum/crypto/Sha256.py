@@ -1,5 +1,6 @@
 import hashlib
 import hmac
+from typing import Iterable
 
 
 def hash(value: str | bytes) -> str:
@@ -25,6 +26,30 @@ def hash(value: str | bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+def hash_many(values: Iterable[str | bytes]) -> list[str]:
+    """
+    Compute the SHA-256 hashes of many values in one tight loop.
+
+    Args:
+        values: The data to hash. Strings are UTF-8 encoded.
+
+    Returns:
+        The lowercase hexadecimal digests, in input order.
+
+    Raises:
+        TypeError: If a value is not a string or bytes object.
+    """
+    sha256 = hashlib.sha256
+    digests = []
+    for value in values:
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+        elif not isinstance(value, bytes):
+            raise TypeError("value must be a string or bytes")
+        digests.append(sha256(value).hexdigest())
+    return digests
+
+
 def verify(value: str | bytes, expected_hash: str) -> bool:
     """
     Verify a value against an expected SHA-256 hash using constant-time comparison.
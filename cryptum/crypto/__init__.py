@@ -0,0 +1,33 @@
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+# Submodules are imported on first access (PEP 562)
+if TYPE_CHECKING:
+    from . import Argon2id
+    from . import Sha256
+    from . import aes
+    from . import argon2_pool
+    from . import hmac
+    from . import keyring
+    from . import stream
+
+__all__ = [
+    "Argon2id",
+    "Sha256",
+    "aes",
+    "argon2_pool",
+    "hmac",
+    "keyring",
+    "stream",
+]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
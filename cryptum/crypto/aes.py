@@ -1,19 +1,44 @@
 import base64
+import hashlib
 import os
-from typing import Optional
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
+from cryptum.instrumentation import instrumented
+
+# Upper bound on the number of derived keys kept by the module-level functions
+KEY_CACHE_SIZE = 64
+
+# Number of items handed to a worker at once by the batch functions
+BATCH_CHUNK_SIZE = 256
+
+# 12 (nonce) + 16 (tag): the size of an encrypted empty payload
+NONCE_SIZE = 12
+OVERHEAD = 28
+
+# Older cryptography releases cannot decrypt straight into a caller buffer
+_HAS_DECRYPT_INTO = hasattr(AESGCM, "decrypt_into")
+
+_key_cache: "OrderedDict[bytes, Cipher]" = OrderedDict()
+_key_cache_lock = threading.Lock()
+
+
 def _derive_key(secret: str | bytes, salt: Optional[bytes] = None) -> bytes:
     """
     Derive a 32-byte key for AES-256 using HKDF (HMAC-based Key Derivation Function).
-    This is significantly more secure than a raw hash as it provides key expansion 
+    This is significantly more secure than a raw hash as it provides key expansion
     and strong cryptographic separation.
     """
     if isinstance(secret, str):
         secret = secret.encode("utf-8")
-    
+
     return HKDF(
         algorithm=hashes.SHA256(),
         length=32,
@@ -21,69 +46,497 @@ def _derive_key(secret: str | bytes, salt: Optional[bytes] = None) -> bytes:
         info=b"cryptum-aes-gcm-key",
     ).derive(secret)
 
+
+def _fingerprint(secret: str | bytes) -> bytes:
+    """
+    Compute the cache key for a master secret.
+
+    The master secret itself is never used as a dictionary key; only a
+    domain-separated SHA-256 digest of it is kept.
+    """
+    if isinstance(secret, str):
+        secret = secret.encode("utf-8")
+
+    return hashlib.sha256(b"cryptum-aes-key-cache\x00" + secret).digest()
+
+
+class Cipher:
+    """
+    A reusable AES-256-GCM cipher bound to a single master secret.
+
+    The HKDF derivation and the AESGCM setup happen once, in the constructor,
+    so repeated encrypt/decrypt calls only pay for the AEAD operation itself.
+    The output format is identical to the module-level `encrypt`/`decrypt`.
+
+    Example:
+        cipher = Cipher(master_secret)
+        blob = cipher.encrypt("sensitive user data")
+        cipher.decrypt(blob)
+    """
+
+    __slots__ = ("_aesgcm",)
+
+    def __init__(self, secret_key: str | bytes):
+        """
+        Args:
+            secret_key: The master key used for encryption.
+
+        Raises:
+            TypeError: If secret_key is not a string or bytes.
+        """
+        if not isinstance(secret_key, (str, bytes)):
+            raise TypeError("secret_key must be a string or bytes")
+
+        self._aesgcm: Optional[AESGCM] = AESGCM(_derive_key(secret_key))
+
+    def _engine(self) -> AESGCM:
+        aesgcm = self._aesgcm
+        if aesgcm is None:
+            raise ValueError("cipher has been cleared")
+        return aesgcm
+
+    @instrumented("aes.encrypt", payload=1)
+    def encrypt(self, plaintext: str | bytes, context: Optional[str] = None) -> str:
+        """
+        Encrypt data and return a Base64 encoded string.
+
+        Args:
+            plaintext: The data to encrypt (string or bytes).
+            context: Optional context (AAD) to bind the ciphertext to a specific scope.
+
+        Returns:
+            The Base64 encoded encrypted blob (nonce + ciphertext + tag).
+
+        Raises:
+            ValueError: If the cipher has been cleared.
+        """
+        if isinstance(plaintext, str):
+            data = plaintext.encode("utf-8")
+        else:
+            data = plaintext
+
+        aad = context.encode("utf-8") if context else None
+
+        # 12 bytes is the standard nonce size for GCM
+        nonce = os.urandom(12)
+
+        # cryptography's AESGCM returns ciphertext + tag
+        encrypted_data = self._engine().encrypt(nonce, data, aad)
+
+        return base64.b64encode(nonce + encrypted_data).decode("utf-8")
+
+    @instrumented("aes.decrypt", payload=1)
+    def decrypt(self, ciphertext_b64: str, context: Optional[str] = None) -> str:
+        """
+        Decrypt a Base64 encoded blob back to plaintext.
+
+        Args:
+            ciphertext_b64: The Base64 encoded encrypted blob (nonce + ciphertext + tag).
+            context: The context (AAD) used during encryption.
+
+        Returns:
+            The decrypted plaintext as a UTF-8 string.
+
+        Raises:
+            ValueError: If decryption fails, data is corrupted or the cipher has been cleared.
+        """
+        aesgcm = self._engine()
+        try:
+            blob = base64.b64decode(ciphertext_b64)
+            if len(blob) < 28: # 12 (nonce) + 16 (min tag)
+                raise ValueError("Invalid ciphertext: too short")
+
+            aad = context.encode("utf-8") if context else None
+
+            nonce = blob[:12]
+            encrypted_payload = blob[12:]
+
+            decrypted_bytes = aesgcm.decrypt(nonce, encrypted_payload, aad)
+            return decrypted_bytes.decode("utf-8")
+        except Exception as e:
+            raise ValueError(f"Decryption failed: {str(e)}")
+
+    @instrumented("aes.encrypt", payload=1)
+    def encrypt_bytes(self, plaintext: bytes | bytearray | memoryview, context: Optional[bytes] = None) -> bytes:
+        """
+        Encrypt binary data and return the raw blob, without Base64 encoding.
+
+        Args:
+            plaintext: The data to encrypt. Any bytes-like object; it is not copied.
+            context: Optional context (AAD), as bytes.
+
+        Returns:
+            The raw encrypted blob: nonce + ciphertext + tag.
+
+        Raises:
+            ValueError: If the cipher has been cleared.
+        """
+        nonce = os.urandom(NONCE_SIZE)
+        return nonce + self._engine().encrypt(nonce, plaintext, context)
+
+    @instrumented("aes.decrypt", payload=1)
+    def decrypt_bytes(self, blob: bytes | bytearray | memoryview, context: Optional[bytes] = None) -> bytes:
+        """
+        Decrypt a raw blob produced by `encrypt_bytes`.
+
+        Args:
+            blob: The raw encrypted blob (nonce + ciphertext + tag).
+            context: The context (AAD) used during encryption, as bytes.
+
+        Returns:
+            The decrypted bytes.
+
+        Raises:
+            ValueError: If decryption fails, data is corrupted or the cipher has been cleared.
+        """
+        aesgcm = self._engine()
+        view = memoryview(blob)
+        if len(view) < OVERHEAD:
+            raise ValueError("Invalid ciphertext: too short")
+        try:
+            return aesgcm.decrypt(view[:NONCE_SIZE], view[NONCE_SIZE:], context)
+        except InvalidTag:
+            raise ValueError("Decryption failed") from None
+
+    @instrumented("aes.decrypt", payload=1)
+    def decrypt_into(
+        self,
+        blob: bytes | bytearray | memoryview,
+        buffer: bytearray | memoryview,
+        context: Optional[bytes] = None,
+    ) -> int:
+        """
+        Decrypt a raw blob into a caller-supplied writable buffer.
+
+        Args:
+            blob: The raw encrypted blob (nonce + ciphertext + tag).
+            buffer: A writable buffer of at least len(blob) - 28 bytes.
+            context: The context (AAD) used during encryption, as bytes.
+
+        Returns:
+            The number of plaintext bytes written to the start of `buffer`.
+
+        Raises:
+            ValueError: If the buffer is too small, decryption fails, data is
+                corrupted or the cipher has been cleared.
+        """
+        aesgcm = self._engine()
+        view = memoryview(blob)
+        size = len(view) - OVERHEAD
+        if size < 0:
+            raise ValueError("Invalid ciphertext: too short")
+
+        target = memoryview(buffer)
+        if len(target) < size:
+            raise ValueError("buffer too small")
+        try:
+            if _HAS_DECRYPT_INTO:
+                return aesgcm.decrypt_into(view[:NONCE_SIZE], view[NONCE_SIZE:], context, target[:size])
+            target[:size] = aesgcm.decrypt(view[:NONCE_SIZE], view[NONCE_SIZE:], context)
+            return size
+        except InvalidTag:
+            raise ValueError("Decryption failed") from None
+
+    def clear(self) -> None:
+        """
+        Drop the derived key held by this cipher.
+
+        Any later encrypt/decrypt call raises ValueError. Python cannot scrub
+        the memory owned by the underlying AESGCM object, so this releases the
+        last reference and leaves reclamation to the allocator.
+        """
+        self._aesgcm = None
+
+
+def _cipher_for(secret_key: str | bytes) -> Cipher:
+    """
+    Return a cached Cipher for the given master secret, deriving it on a miss.
+    """
+    if not isinstance(secret_key, (str, bytes)):
+        raise TypeError("secret_key must be a string or bytes")
+
+    fingerprint = _fingerprint(secret_key)
+    with _key_cache_lock:
+        cipher = _key_cache.get(fingerprint)
+        if cipher is not None:
+            _key_cache.move_to_end(fingerprint)
+            return cipher
+
+    # Derive outside the lock so a slow HKDF run never blocks other secrets
+    cipher = Cipher(secret_key)
+    with _key_cache_lock:
+        existing = _key_cache.get(fingerprint)
+        if existing is not None:
+            return existing
+        _key_cache[fingerprint] = cipher
+        while len(_key_cache) > KEY_CACHE_SIZE:
+            _key_cache.popitem(last=False)
+    return cipher
+
+
+def clear_key_cache(secret_key: Optional[str | bytes] = None) -> None:
+    """
+    Evict derived keys from the module-level cache.
+
+    Call this after rotating a master secret so its derived key no longer
+    lingers in memory. Calls already in flight finish with the key they hold.
+
+    Args:
+        secret_key: The master secret to evict. If omitted, every cached key is evicted.
+    """
+    with _key_cache_lock:
+        if secret_key is None:
+            _key_cache.clear()
+        else:
+            _key_cache.pop(_fingerprint(secret_key), None)
+
+
 def encrypt(plaintext: str | bytes, secret_key: str | bytes, context: Optional[str] = None) -> str:
     """
     Encrypt data using AES-256-GCM and return a Base64 encoded string.
-    
+
     The resulting string contains: base64(nonce + ciphertext + tag)
-    
+
+    Derived keys are cached per master secret (see `clear_key_cache`).
+
     Args:
         plaintext: The data to encrypt (string or bytes).
         secret_key: The master key used for encryption.
         context: Optional context (AAD) to bind the ciphertext to a specific scope.
-        
+
     Returns:
         The Base64 encoded encrypted blob.
     """
-    if isinstance(plaintext, str):
-        data = plaintext.encode("utf-8")
-    else:
-        data = plaintext
-        
-    aad = context.encode("utf-8") if context else None
-    
-    key = _derive_key(secret_key)
-    aesgcm = AESGCM(key)
-    
-    # 12 bytes is the standard nonce size for GCM
-    nonce = os.urandom(12)
-    
-    # cryptography's AESGCM returns ciphertext + tag
-    encrypted_data = aesgcm.encrypt(nonce, data, aad)
-    
-    # Combine nonce + ciphertext + tag
-    blob = nonce + encrypted_data
-    
-    return base64.b64encode(blob).decode("utf-8")
+    return _cipher_for(secret_key).encrypt(plaintext, context)
+
 
 def decrypt(ciphertext_b64: str, secret_key: str | bytes, context: Optional[str] = None) -> str:
     """
     Decrypt an AES-256-GCM encoded Base64 string back to plaintext.
-    
+
+    Derived keys are cached per master secret (see `clear_key_cache`).
+
     Args:
         ciphertext_b64: The Base64 encoded encrypted blob (nonce + ciphertext + tag).
         secret_key: The secret key used for encryption.
         context: The context (AAD) used during encryption.
-        
+
     Returns:
         The decrypted plaintext as a UTF-8 string.
-        
+
     Raises:
         ValueError: If decryption fails or data is corrupted.
     """
     try:
-        blob = base64.b64decode(ciphertext_b64)
-        if len(blob) < 28: # 12 (nonce) + 16 (min tag)
-            raise ValueError("Invalid ciphertext: too short")
-            
-        aad = context.encode("utf-8") if context else None
-        key = _derive_key(secret_key)
-        aesgcm = AESGCM(key)
-        
-        nonce = blob[:12]
-        encrypted_payload = blob[12:]
-        
-        decrypted_bytes = aesgcm.decrypt(nonce, encrypted_payload, aad)
-        return decrypted_bytes.decode("utf-8")
+        cipher = _cipher_for(secret_key)
     except Exception as e:
         raise ValueError(f"Decryption failed: {str(e)}")
+    return cipher.decrypt(ciphertext_b64, context)
+
+
+def encrypt_bytes(
+    plaintext: bytes | bytearray | memoryview,
+    secret_key: str | bytes,
+    context: Optional[bytes] = None,
+) -> bytes:
+    """
+    Encrypt binary data using AES-256-GCM and return the raw blob.
+
+    This skips the Base64 and UTF-8 round-trips of `encrypt`, which makes it
+    suitable for binary payloads and for storing ciphertext in binary columns.
+
+    Args:
+        plaintext: The data to encrypt. Any bytes-like object; it is not copied.
+        secret_key: The master key used for encryption.
+        context: Optional context (AAD), as bytes.
+
+    Returns:
+        The raw encrypted blob: nonce + ciphertext + tag.
+    """
+    return _cipher_for(secret_key).encrypt_bytes(plaintext, context)
+
+
+def decrypt_bytes(
+    blob: bytes | bytearray | memoryview,
+    secret_key: str | bytes,
+    context: Optional[bytes] = None,
+) -> bytes:
+    """
+    Decrypt a raw AES-256-GCM blob produced by `encrypt_bytes`.
+
+    Failures raise a ValueError with a fixed message, so rejecting bad input
+    stays cheap.
+
+    Args:
+        blob: The raw encrypted blob (nonce + ciphertext + tag).
+        secret_key: The secret key used for encryption.
+        context: The context (AAD) used during encryption, as bytes.
+
+    Returns:
+        The decrypted bytes.
+
+    Raises:
+        ValueError: If decryption fails or data is corrupted.
+    """
+    return _cipher_for(secret_key).decrypt_bytes(blob, context)
+
+
+def decrypt_into(
+    blob: bytes | bytearray | memoryview,
+    buffer: bytearray | memoryview,
+    secret_key: str | bytes,
+    context: Optional[bytes] = None,
+) -> int:
+    """
+    Decrypt a raw AES-256-GCM blob into a caller-supplied writable buffer.
+
+    Args:
+        blob: The raw encrypted blob (nonce + ciphertext + tag).
+        buffer: A writable buffer of at least len(blob) - 28 bytes.
+        secret_key: The secret key used for encryption.
+        context: The context (AAD) used during encryption, as bytes.
+
+    Returns:
+        The number of plaintext bytes written to the start of `buffer`.
+
+    Raises:
+        ValueError: If the buffer is too small, or decryption fails or data is corrupted.
+    """
+    return _cipher_for(secret_key).decrypt_into(blob, buffer, context)
+
+
+def _run_chunk(operation: Callable, items: list, context: Optional[str]) -> list:
+    """
+    Apply a Cipher method to every item, capturing failures as values.
+    """
+    results = []
+    for item in items:
+        try:
+            results.append(operation(item, context))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+def _run_batch(
+    operation: Callable,
+    items: Iterable,
+    context: Optional[str],
+    max_workers: Optional[int],
+    chunk_size: int,
+    executor: Optional[Executor],
+) -> Iterator:
+    """
+    Stream results of `operation` over `items` in input order.
+
+    Items are grouped into chunks and, when more than one worker is allowed,
+    dispatched to a thread pool. AES-GCM releases the GIL, so chunks run in
+    parallel. At most two chunks per worker are in flight, which keeps memory
+    flat regardless of the input size.
+
+    Arguments are checked here, when the batch is created, rather than on
+    the first `next()` of the returned iterator.
+    """
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    return _stream_batch(operation, iter(items), context, max_workers, chunk_size, executor)
+
+
+def _stream_batch(
+    operation: Callable,
+    iterator: Iterator,
+    context: Optional[str],
+    max_workers: Optional[int],
+    chunk_size: int,
+    executor: Optional[Executor],
+) -> Iterator:
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+
+    if executor is None and workers <= 1:
+        while chunk := list(islice(iterator, chunk_size)):
+            yield from _run_chunk(operation, chunk, context)
+        return
+
+    owned = executor is None
+    pool = ThreadPoolExecutor(max_workers=workers) if owned else executor
+    pending: deque = deque()
+    try:
+        while True:
+            while len(pending) < workers * 2:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                pending.append(pool.submit(_run_chunk, operation, chunk, context))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owned:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def encrypt_many(
+    plaintexts: Iterable[str | bytes],
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> Iterator[str | Exception]:
+    """
+    Encrypt many values with one derived key, yielding results in input order.
+
+    The key is derived once for the whole batch. Work is spread over a thread
+    pool and results are streamed, so million-row batches run in bounded memory.
+
+    Args:
+        plaintexts: The values to encrypt (strings or bytes).
+        secret_key: The master key used for encryption.
+        context: Optional context (AAD) applied to every value.
+        max_workers: Size of the thread pool. Defaults to the CPU count; 1 runs inline.
+        chunk_size: Number of values handed to a worker at once.
+        executor: An existing executor to use instead of creating a pool.
+
+    Returns:
+        An iterator yielding, for each input, the Base64 encoded blob or the
+        exception raised while encrypting that value.
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer.
+    """
+    cipher = _cipher_for(secret_key)
+    return _run_batch(cipher.encrypt, plaintexts, context, max_workers, chunk_size, executor)
+
+
+def decrypt_many(
+    ciphertexts: Iterable[str],
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = BATCH_CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> Iterator[str | ValueError]:
+    """
+    Decrypt many Base64 blobs with one derived key, yielding results in input order.
+
+    A corrupted or tampered value does not abort the batch: its position in
+    the output holds the ValueError that `decrypt` would have raised.
+
+    Args:
+        ciphertexts: The Base64 encoded encrypted blobs.
+        secret_key: The secret key used for encryption.
+        context: The context (AAD) used during encryption.
+        max_workers: Size of the thread pool. Defaults to the CPU count; 1 runs inline.
+        chunk_size: Number of values handed to a worker at once.
+        executor: An existing executor to use instead of creating a pool.
+
+    Returns:
+        An iterator yielding, for each input, the plaintext string or a ValueError.
+
+    Raises:
+        ValueError: If chunk_size is not a positive integer.
+    """
+    cipher = _cipher_for(secret_key)
+    return _run_batch(cipher.decrypt, ciphertexts, context, max_workers, chunk_size, executor)
@@ -0,0 +1,234 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Iterable, Optional
+
+from . import Argon2id
+from .Argon2id import Argon2Profile
+
+
+def _warm(profiles: tuple[Argon2Profile, ...]) -> None:
+    """
+    Worker initializer: build the hashers up front so the first call is not slower.
+    """
+    # A forked worker inherits the parent's backend; it must always hash locally
+    Argon2id.set_backend(None)
+    for profile in profiles:
+        profile.hasher
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def _hash_batch(secrets: list[str], profile: Argon2Profile) -> list[str]:
+    return [Argon2id._hash_local(secret, profile) for secret in secrets]
+
+
+def _verify_batch(pairs: list[tuple[str, str]]) -> list[bool]:
+    return [Argon2id._verify_local(secret, hash) for secret, hash in pairs]
+
+
+class Argon2Pool:
+    """
+    A pool of warm worker processes for Argon2 hashing and verification.
+
+    Argon2 is CPU-bound, so a process per core lets verification throughput
+    scale with the core count. Workers are started eagerly and build their
+    hashers before the first request. If a worker dies, the pool is rebuilt
+    and the affected call is retried once.
+
+    To make `Argon2id.hash`, `Argon2id.verify` and `passwords.verify` use the
+    pool, pass it to `Argon2id.set_backend`. Under gunicorn/uvicorn, create
+    the pool after the server forks (e.g. in a post-fork or startup hook)
+    and call `shutdown` from the matching exit hook.
+
+    Example:
+        pool = Argon2Pool(processes=4)
+        Argon2id.set_backend(pool)
+        ...
+        Argon2id.set_backend(None)
+        pool.shutdown()
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        profiles: Iterable[Argon2Profile] = (Argon2id.DEFAULT_PROFILE,),
+        batch_size: int = 8,
+        mp_context=None,
+    ):
+        """
+        Args:
+            processes: Number of worker processes. Defaults to the CPU count.
+            profiles: Profiles whose hashers are pre-built in every worker.
+            batch_size: Number of items sent to a worker at once by the batch methods.
+            mp_context: Optional multiprocessing context, e.g.
+                `multiprocessing.get_context("spawn")`.
+
+        Raises:
+            ValueError: If processes or batch_size is not a positive integer.
+        """
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if not isinstance(processes, int) or processes <= 0:
+            raise ValueError("processes must be a positive integer")
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
+
+        self.processes = processes
+        self.batch_size = batch_size
+        self._profiles = tuple(profiles)
+        self._mp_context = mp_context
+        self._lock = threading.Lock()
+        self._closed = False
+        self._restarts = 0
+        self._executor = self._start()
+
+    def _start(self) -> ProcessPoolExecutor:
+        executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=self._mp_context,
+            initializer=_warm,
+            initargs=(self._profiles,),
+        )
+        # Spawn and initialize every worker now rather than on first use
+        for future in [executor.submit(_ping) for _ in range(self.processes)]:
+            future.result()
+        return executor
+
+    def _restart(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Argon2Pool has been shut down")
+            # Another thread may already have replaced the broken executor
+            if self._executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._start()
+                self._restarts += 1
+            return self._executor
+
+    def _call(self, fn, *args):
+        executor = self._executor
+        if self._closed:
+            raise RuntimeError("Argon2Pool has been shut down")
+        try:
+            return executor.submit(fn, *args).result()
+        except BrokenProcessPool:
+            return self._restart(executor).submit(fn, *args).result()
+
+    def _map(self, fn, batches: list, *args) -> list:
+        executor = self._executor
+        if self._closed:
+            raise RuntimeError("Argon2Pool has been shut down")
+        try:
+            futures = [executor.submit(fn, batch, *args) for batch in batches]
+            return [result for future in futures for result in future.result()]
+        except BrokenProcessPool:
+            executor = self._restart(executor)
+            futures = [executor.submit(fn, batch, *args) for batch in batches]
+            return [result for future in futures for result in future.result()]
+
+    def _batches(self, items: Iterable) -> list[list]:
+        iterator = iter(items)
+        return list(iter(lambda: list(islice(iterator, self.batch_size)), []))
+
+    def hash(self, secret: str, profile: Optional[Argon2Profile] = None) -> str:
+        """
+        Hash a secret with Argon2id in a worker process.
+
+        Args:
+            secret: The plain-text secret string to hash.
+            profile: The cost parameters to use. Defaults to Argon2id.DEFAULT_PROFILE.
+
+        Returns:
+            The encoded Argon2id hash.
+
+        Raises:
+            TypeError: If the secret is not a string.
+            RuntimeError: If the pool has been shut down.
+        """
+        if not isinstance(secret, str):
+            raise TypeError("secret must be a string")
+        # Resolved here: under spawn, or after a change made since the fork,
+        # a worker's own DEFAULT_PROFILE may differ from the parent's
+        return self._call(_hash_batch, [secret], profile or Argon2id.DEFAULT_PROFILE)[0]
+
+    def verify(self, secret: str, hash: str) -> bool:
+        """
+        Verify a secret against an Argon2id hash in a worker process.
+
+        Args:
+            secret: The plain-text secret string to verify.
+            hash: The encoded hash string to verify against.
+
+        Returns:
+            True if the secret matches the hash, False otherwise.
+
+        Raises:
+            RuntimeError: If the pool has been shut down.
+        """
+        if not isinstance(secret, str) or not isinstance(hash, str):
+            raise TypeError("secret and hash must be strings")
+        return self._call(_verify_batch, [(secret, hash)])[0]
+
+    def hash_many(self, secrets: Iterable[str], profile: Optional[Argon2Profile] = None) -> list[str]:
+        """
+        Hash many secrets, sending them to workers in batches.
+
+        Args:
+            secrets: The plain-text secret strings to hash.
+            profile: The cost parameters to use. Defaults to Argon2id.DEFAULT_PROFILE.
+
+        Returns:
+            The encoded hashes, in input order.
+        """
+        secrets = list(secrets)
+        if not all(isinstance(secret, str) for secret in secrets):
+            raise TypeError("secret must be a string")
+        return self._map(_hash_batch, self._batches(secrets), profile or Argon2id.DEFAULT_PROFILE)
+
+    def verify_many(self, pairs: Iterable[tuple[str, str]]) -> list[bool]:
+        """
+        Verify many (secret, hash) pairs, sending them to workers in batches.
+
+        Args:
+            pairs: The (plain-text secret, encoded hash) pairs to verify.
+
+        Returns:
+            One boolean per pair, in input order.
+        """
+        pairs = list(pairs)
+        if not all(isinstance(secret, str) and isinstance(hash, str) for secret, hash in pairs):
+            raise TypeError("secret and hash must be strings")
+        return self._map(_verify_batch, self._batches(pairs))
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the pool size and the number of times it was rebuilt after a crash.
+        """
+        return {"processes": self.processes, "restarts": self._restarts}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes. Later calls raise RuntimeError.
+
+        If this pool is the active Argon2id backend, in-process hashing is restored.
+
+        Args:
+            wait: Whether to wait for in-flight calls to finish.
+        """
+        with self._lock:
+            self._closed = True
+            executor = self._executor
+        if Argon2id._backend is self:
+            Argon2id.set_backend(None)
+        executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self) -> "Argon2Pool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
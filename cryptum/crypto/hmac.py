@@ -1,7 +1,12 @@
-import hmac
 import hashlib
+import hmac
+import operator
+from typing import Iterable
 
+from cryptum.instrumentation import instrumented
 
+
+@instrumented("hmac.sign", payload=0)
 def sign(message: str | bytes, secret: str | bytes) -> str:
     """
     Generate an HMAC-SHA256 signature for a message using a secret key.
@@ -16,6 +21,10 @@ def sign(message: str | bytes, secret: str | bytes) -> str:
     Raises:
         TypeError: If message or secret are not strings or bytes.
     """
+    return _hexdigest(message, secret)
+
+
+def _hexdigest(message: str | bytes, secret: str | bytes) -> str:
     if isinstance(message, str):
         msg_bytes = message.encode("utf-8")
     elif isinstance(message, bytes):
@@ -33,6 +42,7 @@ def sign(message: str | bytes, secret: str | bytes) -> str:
     return hmac.new(sec_bytes, msg_bytes, hashlib.sha256).hexdigest()
 
 
+@instrumented("hmac.verify", payload=0, failure=operator.not_)
 def verify(message: str | bytes, secret: str | bytes, signature: str) -> bool:
     """
     Verify an HMAC-SHA256 signature using constant-time comparison.
@@ -52,9 +62,110 @@ def verify(message: str | bytes, secret: str | bytes, signature: str) -> bool:
         if not isinstance(signature, str):
             return False
 
-        computed = sign(message, secret)
+        computed = _hexdigest(message, secret)
         return hmac.compare_digest(computed, signature.lower())
     except (TypeError, ValueError, AttributeError):
         # Catch all potential input or processing errors during verification to prevent timing leaks
         # and ensure a reliable boolean response.
         return False
+
+
+_HEX_SIGNATURE_LENGTH = 2 * hashlib.sha256().digest_size
+
+
+def _to_bytes(value: str | bytes, name: str) -> bytes:
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, bytes):
+        return value
+    raise TypeError(f"{name} must be a string or bytes")
+
+
+class Signer:
+    """
+    A reusable HMAC-SHA256 signer bound to a single secret.
+
+    The keyed state (the hash of the inner and outer pads) is computed once,
+    in the constructor. Each message then only clones that state with
+    `.copy()` and hashes the message itself. Signatures are identical to
+    `sign`/`verify`.
+
+    Example:
+        signer = Signer(secret_key)
+        signature = signer.sign(plaintext)
+        signer.verify(plaintext, signature)
+    """
+
+    __slots__ = ("_base",)
+
+    def __init__(self, secret: str | bytes):
+        """
+        Args:
+            secret: The secret key used for signatures.
+
+        Raises:
+            TypeError: If secret is not a string or bytes.
+        """
+        self._base = hmac.new(_to_bytes(secret, "secret"), digestmod=hashlib.sha256)
+
+    def digest(self, message: str | bytes) -> bytes:
+        """
+        Compute the raw 32-byte HMAC-SHA256 digest of a message.
+
+        Raises:
+            TypeError: If message is not a string or bytes.
+        """
+        mac = self._base.copy()
+        mac.update(_to_bytes(message, "message"))
+        return mac.digest()
+
+    @instrumented("hmac.sign", payload=1)
+    def sign(self, message: str | bytes) -> str:
+        """
+        Generate the lowercase hexadecimal HMAC-SHA256 signature of a message.
+
+        Raises:
+            TypeError: If message is not a string or bytes.
+        """
+        return self.digest(message).hex()
+
+    @instrumented("hmac.verify", payload=1, failure=operator.not_)
+    def verify(self, message: str | bytes, signature: str) -> bool:
+        """
+        Verify a hexadecimal signature using constant-time comparison of raw digests.
+
+        Like `verify`, this never raises and returns False on any invalid input.
+        """
+        # bytes.fromhex skips whitespace, so check the shape first: only exactly
+        # 64 hex characters (either case) match, as with the module-level verify
+        if not isinstance(signature, str) or len(signature) != _HEX_SIGNATURE_LENGTH or not signature.isalnum():
+            return False
+        try:
+            expected = bytes.fromhex(signature)
+            return hmac.compare_digest(self.digest(message), expected)
+        except (TypeError, ValueError, AttributeError):
+            return False
+
+    def sign_many(self, messages: Iterable[str | bytes]) -> list[str]:
+        """
+        Sign many messages with the same keyed state.
+
+        Returns:
+            The hexadecimal signatures, in input order.
+        """
+        base = self._base
+        signatures = []
+        for message in messages:
+            mac = base.copy()
+            mac.update(_to_bytes(message, "message"))
+            signatures.append(mac.hexdigest())
+        return signatures
+
+    def verify_many(self, pairs: Iterable[tuple[str | bytes, str]]) -> list[bool]:
+        """
+        Verify many (message, signature) pairs.
+
+        Returns:
+            One boolean per pair, in input order.
+        """
+        return [self.verify(message, signature) for message, signature in pairs]
@@ -0,0 +1,202 @@
+import re
+import threading
+from typing import Iterable, Mapping, Optional
+
+from .hmac import Signer, _to_bytes
+
+# Key IDs are embedded in API keys and token headers, so keep them short and unambiguous
+_KEY_ID_PATTERN = re.compile(r"[A-Za-z0-9-]{1,32}")
+
+
+class _KeyEntry:
+    __slots__ = ("secret", "signer", "retired")
+
+    def __init__(self, secret: bytes, signer: Signer, retired: bool):
+        self.secret = secret
+        self.signer = signer
+        self.retired = retired
+
+
+class _RingState:
+    __slots__ = ("entries", "active")
+
+    def __init__(self, entries: dict[str, _KeyEntry], active: Optional[str]):
+        self.entries = entries
+        self.active = active
+
+
+def _check_key_id(key_id: str) -> None:
+    if not isinstance(key_id, str) or not _KEY_ID_PATTERN.fullmatch(key_id):
+        raise ValueError("key_id must be 1-32 characters of letters, digits or '-'")
+
+
+class KeyRing:
+    """
+    A set of signing secrets addressed by key ID, with one active key.
+
+    New tokens are signed with the active key and carry its ID, so
+    verification picks the right secret in O(1) instead of trying every
+    historical secret. Retired keys stay known but are refused before any
+    HMAC work is done.
+
+    Reads never take a lock: every change builds a new internal snapshot
+    and swaps it in with a single assignment, so a reader always sees a
+    consistent ring.
+
+    Example:
+        ring = KeyRing({"2024-01": old_secret, "2024-07": new_secret}, active="2024-07")
+        ring.retire("2024-01")
+    """
+
+    def __init__(
+        self,
+        keys: Optional[Mapping[str, str | bytes]] = None,
+        active: Optional[str] = None,
+        retired: Iterable[str] = (),
+    ):
+        """
+        Args:
+            keys: Mapping of key ID to secret.
+            active: The key ID used for signing. Defaults to the only key, if there is one.
+            retired: Key IDs that must no longer verify.
+
+        Raises:
+            ValueError: If a key ID is invalid or `active`/`retired` names an unknown key.
+            TypeError: If a secret is not a string or bytes.
+        """
+        self._write_lock = threading.Lock()
+        self._state = self._build(dict(keys or {}), active, set(retired))
+
+    @staticmethod
+    def _build(keys: dict[str, str | bytes], active: Optional[str], retired: set[str]) -> _RingState:
+        entries = {}
+        for key_id, secret in keys.items():
+            _check_key_id(key_id)
+            secret = _to_bytes(secret, "secret")
+            entries[key_id] = _KeyEntry(secret, Signer(secret), key_id in retired)
+
+        unknown = retired - entries.keys()
+        if unknown:
+            raise ValueError(f"unknown key_id: {sorted(unknown)[0]}")
+
+        if active is None and len(entries) == 1:
+            active = next(iter(entries))
+        if active is not None:
+            if active not in entries:
+                raise ValueError(f"unknown key_id: {active}")
+            if entries[active].retired:
+                raise ValueError("the active key cannot be retired")
+        return _RingState(entries, active)
+
+    def add(self, key_id: str, secret: str | bytes, activate: bool = False) -> None:
+        """
+        Add a new secret, optionally making it the active signing key.
+
+        Raises:
+            ValueError: If the key ID is invalid or already present.
+            TypeError: If the secret is not a string or bytes.
+        """
+        _check_key_id(key_id)
+        secret = _to_bytes(secret, "secret")
+        entry = _KeyEntry(secret, Signer(secret), False)
+
+        with self._write_lock:
+            state = self._state
+            if key_id in state.entries:
+                raise ValueError(f"key_id already exists: {key_id}")
+            self._state = _RingState({**state.entries, key_id: entry}, key_id if activate else state.active)
+
+    def activate(self, key_id: str) -> None:
+        """
+        Make an existing, non-retired key the active signing key.
+
+        Raises:
+            ValueError: If the key is unknown or retired.
+        """
+        with self._write_lock:
+            state = self._state
+            entry = state.entries.get(key_id)
+            if entry is None or entry.retired:
+                raise ValueError(f"key_id cannot be activated: {key_id}")
+            self._state = _RingState(state.entries, key_id)
+
+    def retire(self, key_id: str) -> None:
+        """
+        Mark a key as retired: tokens signed with it fail fast without an HMAC.
+
+        Raises:
+            ValueError: If the key is unknown or currently active.
+        """
+        with self._write_lock:
+            state = self._state
+            entry = state.entries.get(key_id)
+            if entry is None:
+                raise ValueError(f"unknown key_id: {key_id}")
+            if key_id == state.active:
+                raise ValueError("the active key cannot be retired")
+            retired = _KeyEntry(entry.secret, entry.signer, True)
+            self._state = _RingState({**state.entries, key_id: retired}, state.active)
+
+    def replace(
+        self,
+        keys: Mapping[str, str | bytes],
+        active: Optional[str] = None,
+        retired: Iterable[str] = (),
+    ) -> None:
+        """
+        Atomically swap in a whole new set of keys, e.g. one reloaded from a secret store.
+
+        Readers see either the old ring or the new one, never a mix.
+
+        Raises:
+            ValueError: If a key ID is invalid or `active`/`retired` names an unknown key.
+            TypeError: If a secret is not a string or bytes.
+        """
+        state = self._build(dict(keys), active, set(retired))
+        with self._write_lock:
+            self._state = state
+
+    @property
+    def active_key_id(self) -> Optional[str]:
+        """
+        The key ID used to sign new tokens, or None if no key is active.
+        """
+        return self._state.active
+
+    def key_ids(self) -> list[str]:
+        """
+        Return every known key ID, including retired ones.
+        """
+        return list(self._state.entries)
+
+    def is_retired(self, key_id: str) -> bool:
+        """
+        Return True if the key is known and retired.
+        """
+        entry = self._state.entries.get(key_id)
+        return entry is not None and entry.retired
+
+    def _active_entry(self) -> tuple[str, _KeyEntry]:
+        state = self._state
+        if state.active is None:
+            raise ValueError("key ring has no active key")
+        return state.active, state.entries[state.active]
+
+    def _usable_entry(self, key_id: str) -> Optional[_KeyEntry]:
+        entry = self._state.entries.get(key_id)
+        if entry is None or entry.retired:
+            return None
+        return entry
+
+    def signer(self, key_id: str) -> Optional[Signer]:
+        """
+        Return the Signer for a key, or None if the key is unknown or retired.
+        """
+        entry = self._usable_entry(key_id)
+        return entry.signer if entry is not None else None
+
+    def __contains__(self, key_id: object) -> bool:
+        return key_id in self._state.entries
+
+    def __len__(self) -> int:
+        return len(self._state.entries)
@@ -0,0 +1,363 @@
+import mmap
+import os
+import struct
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from cryptum.instrumentation import instrumented
+
+from .aes import _derive_key
+
+# Stream layout:
+#   header  = magic (4) + chunk size (4, big-endian) + salt (16) + nonce prefix (7)
+#   chunk i = AES-256-GCM(plaintext chunk i) + tag (16)
+# Every chunk holds exactly `chunk size` plaintext bytes except the final one,
+# which may be shorter (or empty). The nonce of chunk i is
+# prefix || i (4, big-endian) || final flag (1), so chunks can neither be
+# reordered nor dropped from the end without failing authentication.
+MAGIC = b"CRS1"
+HEADER_SIZE = 31
+TAG_SIZE = 16
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Bounds the memory a single (possibly hostile) header can make us allocate
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+
+_MAX_CHUNKS = 2**32
+
+_HEADER = struct.Struct(">4sI16s7s")
+_COUNTER = struct.Struct(">IB")
+
+Source = BinaryIO | bytes | bytearray | memoryview | mmap.mmap | Iterable[bytes]
+
+
+def _reader(source: Source) -> Callable[[int], bytes]:
+    """
+    Normalize a file object, buffer or iterator of bytes into a `read(n)` callable.
+
+    The callable returns exactly `n` bytes, or fewer only at end of input.
+    Buffers (including memory-mapped files) are sliced through a memoryview,
+    so no intermediate copy is made.
+    """
+    if hasattr(source, "read"):
+        raw_read = source.read
+
+        def read_file(n: int) -> bytes:
+            data = raw_read(n)
+            if not data or len(data) == n:
+                return data
+            parts = [data]
+            missing = n - len(data)
+            while missing:
+                more = raw_read(missing)
+                if not more:
+                    break
+                parts.append(more)
+                missing -= len(more)
+            return b"".join(parts)
+
+        return read_file
+
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(source)
+        position = 0
+
+        def read_buffer(n: int) -> memoryview:
+            nonlocal position
+            chunk = view[position:position + n]
+            position += len(chunk)
+            return chunk
+
+        return read_buffer
+
+    iterator = iter(source)
+    pending = bytearray()
+
+    def read_iterable(n: int) -> bytes:
+        while len(pending) < n:
+            piece = next(iterator, None)
+            if piece is None:
+                break
+            pending.extend(piece)
+        data = bytes(pending[:n])
+        del pending[:n]
+        return data
+
+    return read_iterable
+
+
+def _nonce(prefix: bytes, counter: int, final: bool) -> bytes:
+    if counter >= _MAX_CHUNKS:
+        raise ValueError("stream exceeds the maximum number of chunks")
+    return prefix + _COUNTER.pack(counter, 1 if final else 0)
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    if not isinstance(chunk_size, int) or not 0 < chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}")
+
+
+def _open(header: bytes, secret_key: str | bytes, context: Optional[str]) -> tuple[AESGCM, int, bytes, bytes]:
+    """
+    Parse a stream header and return (cipher, chunk size, nonce prefix, AAD).
+    """
+    if len(header) < HEADER_SIZE:
+        raise ValueError("Invalid stream: header too short")
+
+    magic, chunk_size, salt, prefix = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("Invalid stream: unknown format")
+    _check_chunk_size(chunk_size)
+
+    aad = bytes(header) + (context.encode("utf-8") if context else b"")
+    return AESGCM(_derive_key(secret_key, salt)), chunk_size, prefix, aad
+
+
+def encrypt_stream(
+    source: Source,
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """
+    Encrypt a stream with chunked AES-256-GCM, yielding the output piece by piece.
+
+    Each stream gets a fresh random salt, so the HKDF-derived key is unique
+    per stream. Memory use is bounded by two chunks, whatever the input size.
+
+    Args:
+        source: A binary file object, a bytes-like object or memory-mapped
+            file, or an iterable of bytes.
+        secret_key: The master key used for encryption.
+        context: Optional context (AAD) to bind the stream to a specific scope.
+        chunk_size: Plaintext bytes per chunk. Defaults to 64 KiB.
+
+    Returns:
+        An iterator yielding the header followed by each encrypted chunk.
+
+    Raises:
+        ValueError: If chunk_size is out of range.
+        TypeError: If source is not a file object, bytes-like object or iterable.
+
+    Arguments are checked when this is called, not on the first `next()`.
+    """
+    _check_chunk_size(chunk_size)
+    read = _reader(source)
+
+    header = _HEADER.pack(MAGIC, chunk_size, os.urandom(16), os.urandom(7))
+    aesgcm, _, prefix, aad = _open(header, secret_key, context)
+    return _encrypt_chunks(read, header, aesgcm, chunk_size, prefix, aad)
+
+
+def _encrypt_chunks(
+    read: Callable[[int], bytes],
+    header: bytes,
+    aesgcm: AESGCM,
+    chunk_size: int,
+    prefix: bytes,
+    aad: bytes,
+) -> Iterator[bytes]:
+    yield header
+
+    counter = 0
+    current = read(chunk_size)
+    while True:
+        following = read(chunk_size)
+        final = len(following) == 0
+        yield aesgcm.encrypt(_nonce(prefix, counter, final), current, aad)
+        if final:
+            return
+        current = following
+        counter += 1
+
+
+def decrypt_stream(
+    source: Source,
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+) -> Iterator[bytes]:
+    """
+    Verify and decrypt a chunked stream, yielding plaintext chunk by chunk.
+
+    Every yielded chunk has been authenticated. A stream that was cut short
+    is only detected at its end, so treat the output as incomplete until the
+    iterator finishes without raising.
+
+    Args:
+        source: The encrypted stream, in any form accepted by `encrypt_stream`.
+        secret_key: The secret key used for encryption.
+        context: The context (AAD) used during encryption.
+
+    Returns:
+        An iterator yielding the plaintext chunks.
+
+    Raises:
+        ValueError: If the stream is malformed, truncated or fails authentication.
+        TypeError: If source is not a file object, bytes-like object or iterable.
+
+    The header is read and checked when this is called; chunk errors are
+    raised as the iterator reaches them.
+    """
+    read = _reader(source)
+    aesgcm, chunk_size, prefix, aad = _open(read(HEADER_SIZE), secret_key, context)
+    return _decrypt_chunks(read, aesgcm, chunk_size + TAG_SIZE, prefix, aad)
+
+
+def _decrypt_chunks(
+    read: Callable[[int], bytes],
+    aesgcm: AESGCM,
+    segment: int,
+    prefix: bytes,
+    aad: bytes,
+) -> Iterator[bytes]:
+    counter = 0
+    current = read(segment)
+    if len(current) < TAG_SIZE:
+        raise ValueError("Invalid stream: truncated")
+
+    while True:
+        following = read(segment)
+        final = len(following) == 0
+        try:
+            yield aesgcm.decrypt(_nonce(prefix, counter, final), current, aad)
+        except InvalidTag:
+            raise ValueError(f"Decryption failed: chunk {counter} did not authenticate") from None
+        if final:
+            return
+        current = following
+        counter += 1
+
+
+@instrumented("stream.encrypt_file", payload=0)
+def encrypt_file(
+    source: Source,
+    destination: BinaryIO,
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Encrypt a stream into a writable binary file object.
+
+    Args:
+        source: The plaintext, in any form accepted by `encrypt_stream`.
+        destination: A binary file object opened for writing.
+        secret_key: The master key used for encryption.
+        context: Optional context (AAD) to bind the stream to a specific scope.
+        chunk_size: Plaintext bytes per chunk. Defaults to 64 KiB.
+
+    Returns:
+        The number of bytes written.
+    """
+    written = 0
+    for piece in encrypt_stream(source, secret_key, context, chunk_size):
+        destination.write(piece)
+        written += len(piece)
+    return written
+
+
+@instrumented("stream.decrypt_file", payload=0)
+def decrypt_file(
+    source: Source,
+    destination: BinaryIO,
+    secret_key: str | bytes,
+    context: Optional[str] = None,
+) -> int:
+    """
+    Decrypt a stream into a writable binary file object.
+
+    Plaintext is written as each chunk authenticates. If this raises, the
+    destination holds a partial result and must be discarded.
+
+    Args:
+        source: The encrypted stream, in any form accepted by `decrypt_stream`.
+        destination: A binary file object opened for writing.
+        secret_key: The secret key used for encryption.
+        context: The context (AAD) used during encryption.
+
+    Returns:
+        The number of plaintext bytes written.
+    """
+    written = 0
+    for piece in decrypt_stream(source, secret_key, context):
+        destination.write(piece)
+        written += len(piece)
+    return written
+
+
+@instrumented("stream.decrypt_range", payload=0)
+def decrypt_range(
+    source: BinaryIO | bytes | bytearray | memoryview | mmap.mmap,
+    secret_key: str | bytes,
+    offset: int,
+    length: int,
+    context: Optional[str] = None,
+) -> bytes:
+    """
+    Decrypt a byte range of a stream without processing the chunks around it.
+
+    Only the chunks covering the range are read and authenticated. The total
+    size of the stream is used to locate the final chunk, so truncation is
+    still detected when the range reaches the end.
+
+    Args:
+        source: A seekable binary file object positioned at the start of the
+            stream, or a bytes-like object or memory-mapped file.
+        secret_key: The secret key used for encryption.
+        offset: Plaintext offset of the first byte to return.
+        length: Maximum number of plaintext bytes to return.
+        context: The context (AAD) used during encryption.
+
+    Returns:
+        The decrypted bytes; shorter than `length` if the range passes the end.
+
+    Raises:
+        ValueError: If the range is invalid, or the stream is malformed or
+            fails authentication.
+    """
+    if not isinstance(offset, int) or offset < 0:
+        raise ValueError("offset must be a non-negative integer")
+    if not isinstance(length, int) or length < 0:
+        raise ValueError("length must be a non-negative integer")
+
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        view = memoryview(source)
+        start, total = 0, len(view)
+
+        def read_at(position: int, n: int) -> memoryview:
+            return view[position:position + n]
+    else:
+        start = source.tell()
+        total = source.seek(0, os.SEEK_END)
+        read = _reader(source)
+
+        def read_at(position: int, n: int) -> bytes:
+            source.seek(position)
+            return read(n)
+
+    aesgcm, chunk_size, prefix, aad = _open(read_at(start, HEADER_SIZE), secret_key, context)
+    segment = chunk_size + TAG_SIZE
+
+    body = total - start - HEADER_SIZE
+    if body < TAG_SIZE:
+        raise ValueError("Invalid stream: truncated")
+    chunks = -(-body // segment)
+    size = body - chunks * TAG_SIZE
+
+    end = min(offset + length, size)
+    if offset >= end:
+        return b""
+
+    parts = []
+    for index in range(offset // chunk_size, (end - 1) // chunk_size + 1):
+        position = start + HEADER_SIZE + index * segment
+        final = index == chunks - 1
+        try:
+            parts.append(aesgcm.decrypt(_nonce(prefix, index, final), read_at(position, segment), aad))
+        except InvalidTag:
+            raise ValueError(f"Decryption failed: chunk {index} did not authenticate") from None
+
+    first = offset - (offset // chunk_size) * chunk_size
+    return b"".join(parts)[first:first + end - offset]
@@ -0,0 +1,314 @@
+"""
+Optional timing, counting and byte accounting for cryptum's hot paths.
+
+Nothing is recorded until a sink is registered. With no sinks, an
+instrumented call costs one extra attribute check.
+
+Example:
+    from cryptum import instrumentation
+
+    registry = instrumentation.MetricsRegistry()
+    instrumentation.add_sink(registry)
+    ...
+    print(registry.to_prometheus())
+"""
+import bisect
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Optional, Protocol
+
+# Upper bounds of the latency histogram buckets, in seconds (Prometheus style)
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class Measurement:
+    """
+    One instrumented call, as delivered to sinks.
+
+    Attributes:
+        operation: Stable operation name, e.g. "aes.decrypt" or "argon2id.verify".
+        seconds: Wall-clock duration of the call.
+        nbytes: Payload size in bytes (or characters for strings), or None if not applicable.
+        failed: True if the call raised or reported a failure (e.g. a verify returning False).
+        error: The exception type name when the call raised, else None.
+    """
+
+    __slots__ = ("operation", "seconds", "nbytes", "failed", "error")
+
+    def __init__(self, operation: str, seconds: float, nbytes: Optional[int], failed: bool, error: Optional[str]):
+        self.operation = operation
+        self.seconds = seconds
+        self.nbytes = nbytes
+        self.failed = failed
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            f"Measurement({self.operation!r}, seconds={self.seconds:.6f}, "
+            f"nbytes={self.nbytes}, failed={self.failed}, error={self.error!r})"
+        )
+
+
+class Sink(Protocol):
+    def record(self, measurement: Measurement) -> None: ...
+
+
+class _Hub:
+    __slots__ = ("sinks",)
+
+    def __init__(self):
+        # An immutable tuple, replaced on change, so the hot path never locks
+        self.sinks: tuple[Sink, ...] = ()
+
+
+_hub = _Hub()
+_hub_lock = threading.Lock()
+
+
+def add_sink(sink: Sink) -> None:
+    """
+    Start delivering measurements to `sink`.
+
+    Sinks are called synchronously on the calling thread, so they must be
+    fast and thread-safe. An exception raised by a sink is logged to the
+    "cryptum.instrumentation" logger and otherwise ignored: the instrumented
+    call still returns its result (or raises its own exception), and the
+    remaining sinks still receive the measurement.
+
+    Raises:
+        TypeError: If the sink has no `record` method.
+    """
+    if not callable(getattr(sink, "record", None)):
+        raise TypeError("sink must have a record(measurement) method")
+    with _hub_lock:
+        _hub.sinks = (*_hub.sinks, sink)
+
+
+def remove_sink(sink: Sink) -> None:
+    """
+    Stop delivering measurements to `sink`. Unknown sinks are ignored.
+    """
+    with _hub_lock:
+        _hub.sinks = tuple(existing for existing in _hub.sinks if existing is not sink)
+
+
+def clear_sinks() -> None:
+    """
+    Remove every sink, returning instrumented calls to their zero-cost path.
+    """
+    with _hub_lock:
+        _hub.sinks = ()
+
+
+def _size(value: Any) -> Optional[int]:
+    if isinstance(value, (str, bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    return None
+
+
+def _emit(sinks: tuple[Sink, ...], measurement: Measurement) -> None:
+    for sink in sinks:
+        try:
+            sink.record(measurement)
+        except Exception:
+            _logger.exception("instrumentation sink %r failed on %s", sink, measurement.operation)
+
+
+def instrumented(
+    operation: str,
+    payload: Optional[int] = None,
+    failure: Optional[Callable[[Any], bool]] = None,
+):
+    """
+    Decorator recording every call of a function as `operation`.
+
+    Args:
+        operation: The name reported to sinks.
+        payload: Index of the positional argument whose size is reported as
+            `nbytes` (for methods, `self` is argument 0).
+        failure: Given the return value, returns True if the call should be
+            counted as failed (e.g. `lambda ok: not ok` for verifiers).
+
+    Example:
+        @instrumented("hmac.verify", payload=0, failure=lambda ok: not ok)
+        def verify(message, secret, signature): ...
+    """
+    def decorate(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            sinks = _hub.sinks
+            if not sinks:
+                return fn(*args, **kwargs)
+
+            nbytes = _size(args[payload]) if payload is not None and len(args) > payload else None
+            started = time.perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as exc:
+                _emit(sinks, Measurement(operation, time.perf_counter() - started, nbytes, True, type(exc).__name__))
+                raise
+            failed = failure is not None and failure(result)
+            _emit(sinks, Measurement(operation, time.perf_counter() - started, nbytes, failed, None))
+            return result
+
+        return wrapper
+    return decorate
+
+
+class _Series:
+    __slots__ = ("buckets", "count", "failures", "total_seconds", "total_bytes", "errors")
+
+    def __init__(self, size: int):
+        self.buckets = [0] * size
+        self.count = 0
+        self.failures = 0
+        self.total_seconds = 0.0
+        self.total_bytes = 0
+        self.errors: dict[str, int] = {}
+
+
+class MetricsRegistry:
+    """
+    An in-memory sink that aggregates measurements per operation.
+
+    Keeps call counts, failure counts (with exception types), bytes
+    processed and a cumulative latency histogram. Read it with `snapshot`
+    or export it with `to_prometheus`.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets: Ascending upper bounds of the latency histogram, in seconds.
+
+        Raises:
+            ValueError: If buckets is empty or not strictly ascending.
+        """
+        if not buckets or any(lower >= upper for lower, upper in zip(buckets, buckets[1:])):
+            raise ValueError("buckets must be a non-empty, strictly ascending sequence")
+
+        self.buckets = tuple(buckets)
+        self._series: dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    def record(self, measurement: Measurement) -> None:
+        slot = bisect.bisect_left(self.buckets, measurement.seconds)
+        with self._lock:
+            series = self._series.get(measurement.operation)
+            if series is None:
+                series = self._series[measurement.operation] = _Series(len(self.buckets) + 1)
+            series.buckets[slot] += 1
+            series.count += 1
+            series.total_seconds += measurement.seconds
+            if measurement.nbytes is not None:
+                series.total_bytes += measurement.nbytes
+            if measurement.failed:
+                series.failures += 1
+            if measurement.error is not None:
+                series.errors[measurement.error] = series.errors.get(measurement.error, 0) + 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Return a copy of the aggregated metrics.
+
+        Returns:
+            A dictionary mapping each operation to its 'count', 'failures',
+            'errors' (by exception type), 'seconds' (total), 'bytes' and
+            'buckets' (cumulative counts keyed by upper bound, plus "+Inf").
+        """
+        with self._lock:
+            series = {name: (list(s.buckets), s.count, s.failures, s.total_seconds, s.total_bytes, dict(s.errors))
+                      for name, s in self._series.items()}
+
+        result = {}
+        for name, (buckets, count, failures, seconds, nbytes, errors) in sorted(series.items()):
+            cumulative, running = {}, 0
+            for bound, hits in zip((*map(str, self.buckets), "+Inf"), buckets):
+                running += hits
+                cumulative[bound] = running
+            result[name] = {
+                "count": count,
+                "failures": failures,
+                "errors": errors,
+                "seconds": seconds,
+                "bytes": nbytes,
+                "buckets": cumulative,
+            }
+        return result
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def to_prometheus(self, prefix: str = "cryptum") -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix.
+
+        Returns:
+            The exposition text, ending with a newline.
+        """
+        lines = [
+            f"# HELP {prefix}_operation_duration_seconds Latency of cryptum operations.",
+            f"# TYPE {prefix}_operation_duration_seconds histogram",
+        ]
+        snapshot = self.snapshot()
+        for name, series in snapshot.items():
+            label = f'operation="{name}"'
+            for bound, count in series["buckets"].items():
+                lines.append(f'{prefix}_operation_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+            lines.append(f"{prefix}_operation_duration_seconds_sum{{{label}}} {series['seconds']!r}")
+            lines.append(f"{prefix}_operation_duration_seconds_count{{{label}}} {series['count']}")
+
+        lines += [
+            f"# HELP {prefix}_operation_failures_total Failed cryptum operations.",
+            f"# TYPE {prefix}_operation_failures_total counter",
+        ]
+        for name, series in snapshot.items():
+            lines.append(f'{prefix}_operation_failures_total{{operation="{name}"}} {series["failures"]}')
+
+        lines += [
+            f"# HELP {prefix}_operation_bytes_total Payload bytes processed by cryptum operations.",
+            f"# TYPE {prefix}_operation_bytes_total counter",
+        ]
+        for name, series in snapshot.items():
+            lines.append(f'{prefix}_operation_bytes_total{{operation="{name}"}} {series["bytes"]}')
+        return "\n".join(lines) + "\n"
+
+
+class CallbackSink:
+    """
+    A sink that forwards every measurement to a callable.
+
+    Use it to bridge to OpenTelemetry or another metrics library, e.g. by
+    recording `measurement.seconds` on a histogram with the operation as
+    an attribute.
+    """
+
+    __slots__ = ("callback",)
+
+    def __init__(self, callback: Callable[[Measurement], None]):
+        """
+        Args:
+            callback: Called with each Measurement on the calling thread.
+
+        Raises:
+            TypeError: If callback is not callable.
+        """
+        if not callable(callback):
+            raise TypeError("callback must be callable")
+        self.callback = callback
+
+    def record(self, measurement: Measurement) -> None:
+        self.callback(measurement)
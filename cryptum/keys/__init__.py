@@ -1,12 +1,18 @@
-from . import classification_keys
-from . import confirmation_keys
-from . import deduplication_keys
-from . import failure_keys
-from . import fingerprint_keys
-from . import idempotency_keys
-from . import session_keys
-from . import time_keys
-from . import trace_keys
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+# Submodules are imported on first access (PEP 562)
+if TYPE_CHECKING:
+    from . import classification_keys
+    from . import confirmation_keys
+    from . import deduplication_keys
+    from . import failure_keys
+    from . import fingerprint_keys
+    from . import idempotency_keys
+    from . import session_keys
+    from . import time_keys
+    from . import trace_keys
 
 __all__ = [
     "classification_keys",
@@ -19,3 +25,13 @@ __all__ = [
     "time_keys",
     "trace_keys",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
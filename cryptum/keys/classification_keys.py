@@ -1,5 +1,6 @@
+from typing import Iterator
 import secrets
-from cryptum.core import hex_entropy, with_prefix
+from cryptum.core import ITER_CHUNK_SIZE, hex_entropy, hex_entropy_many, iter_chunks, random_strings, with_prefix, with_prefix_many
 from cryptum.core._constants import PREFIX_CLASSIFICATION_KEY
 
 
@@ -17,3 +18,41 @@ def generate() -> str:
     
     value = f"{starter}{random_suffix}"
     return with_prefix(PREFIX_CLASSIFICATION_KEY, value)
+
+
+def generate_many(count: int) -> list[str]:
+    """
+    Generate many classification keys with one bulk entropy read per part.
+
+    Args:
+        count: The number of classification keys to generate.
+
+    Returns:
+        A list of plaintext classification keys.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    levels = random_strings(count, 1, "123")
+    suffixes = hex_entropy_many(count, 7)
+    return with_prefix_many(
+        PREFIX_CLASSIFICATION_KEY,
+        [f"0{level}{suffix}" for level, suffix in zip(levels, suffixes)],
+    )
+
+
+def iter_many(count: int, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[list[str]]:
+    """
+    Generate classification keys chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of classification keys to generate.
+        chunk_size: The maximum number of classification keys per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size)
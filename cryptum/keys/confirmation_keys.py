@@ -1,20 +1,58 @@
-from cryptum.core import hex_entropy, with_prefix
+from typing import Iterator
+from cryptum.core import ITER_CHUNK_SIZE, hex_entropy, hex_entropy_many, iter_chunks, with_prefix, with_prefix_many
 from cryptum.core._constants import PREFIX_CONFIRMATION_KEY
+from cryptum.core._records import HashedToken
 from cryptum.crypto import Sha256
 
 
-def generate() -> dict[str, str]:
+def generate() -> HashedToken:
     """
     Generate a 16-character random confirmation key.
 
     Returns:
-        A dictionary containing:
+        A HashedToken, also readable as a mapping, containing:
         - 'plaintext': The confirmation key (e.g., 'ck_...').
-        - 'hash': The SHA-256 hash for storage/auditing.
+        - 'hash': The SHA-256 hash for storage/auditing, computed on first access.
     """
     plaintext = with_prefix(PREFIX_CONFIRMATION_KEY, hex_entropy(8))
     
+    return HashedToken(plaintext, hash_fn=Sha256.hash)
+
+
+def generate_many(count: int) -> dict[str, list[str]]:
+    """
+    Generate many confirmation keys with one bulk entropy read.
+
+    Args:
+        count: The number of confirmation keys to generate.
+
+    Returns:
+        A dictionary of parallel lists:
+        - 'plaintext': The confirmation keys.
+        - 'hash': Their SHA-256 hashes, in the same order.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    plaintexts = with_prefix_many(PREFIX_CONFIRMATION_KEY, hex_entropy_many(count, 8))
     return {
-        "plaintext": plaintext,
-        "hash": Sha256.hash(plaintext)
+        "plaintext": plaintexts,
+        "hash": Sha256.hash_many(plaintexts),
     }
+
+
+def iter_many(count: int, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[dict[str, list[str]]]:
+    """
+    Generate confirmation keys chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of confirmation keys to generate.
+        chunk_size: The maximum number of confirmation keys per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size)
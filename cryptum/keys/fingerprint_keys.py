@@ -1,4 +1,5 @@
-from cryptum.core import hex_entropy, with_prefix
+from typing import Iterator
+from cryptum.core import ITER_CHUNK_SIZE, hex_entropy, hex_entropy_many, iter_chunks, with_prefix, with_prefix_many
 from cryptum.core._constants import PREFIX_FINGERPRINT_KEY
 
 
@@ -10,3 +11,36 @@ def generate() -> str:
         The plaintext fingerprint key (e.g., 'fk_...').
     """
     return with_prefix(PREFIX_FINGERPRINT_KEY, hex_entropy(8))
+
+
+def generate_many(count: int) -> list[str]:
+    """
+    Generate many fingerprint keys with one bulk entropy read.
+
+    Args:
+        count: The number of fingerprint keys to generate.
+
+    Returns:
+        A list of plaintext fingerprint keys.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    return with_prefix_many(PREFIX_FINGERPRINT_KEY, hex_entropy_many(count, 8))
+
+
+def iter_many(count: int, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[list[str]]:
+    """
+    Generate fingerprint keys chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of fingerprint keys to generate.
+        chunk_size: The maximum number of fingerprint keys per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size)
@@ -1,5 +1,6 @@
+from typing import Iterator
 import datetime
-from cryptum.core import random_string, with_prefix
+from cryptum.core import ITER_CHUNK_SIZE, iter_chunks, random_string, random_strings, with_prefix, with_prefix_many
 from cryptum.core._constants import PREFIX_TIME_KEY
 
 
@@ -16,3 +17,41 @@ def generate() -> str:
     
     value = f"{timestamp}_{random_suffix}"
     return with_prefix(PREFIX_TIME_KEY, value)
+
+
+def generate_many(count: int) -> list[str]:
+    """
+    Generate many time-based keys with one bulk entropy read.
+
+    All keys in a batch share the timestamp taken when the call starts.
+
+    Args:
+        count: The number of time keys to generate.
+
+    Returns:
+        A list of plaintext time keys.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    head = now.strftime("%Y%m%d%H%M%S") + "_"
+    suffixes = random_strings(count, 4, "0123456789")
+    return with_prefix_many(PREFIX_TIME_KEY, [head + suffix for suffix in suffixes])
+
+
+def iter_many(count: int, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[list[str]]:
+    """
+    Generate time-based keys chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of time-based keys to generate.
+        chunk_size: The maximum number of time-based keys per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size)
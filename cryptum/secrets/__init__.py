@@ -0,0 +1,27 @@
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+# Submodules are imported on first access (PEP 562)
+if TYPE_CHECKING:
+    from . import backup_codes
+    from . import encryption_keys
+    from . import otps
+    from . import passwords
+
+__all__ = [
+    "backup_codes",
+    "encryption_keys",
+    "otps",
+    "passwords",
+]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,10 @@
-from cryptum.core import hex_entropy
+from typing import Iterator
+from cryptum.core import ITER_CHUNK_SIZE, hex_entropy, hex_entropy_many, iter_chunks
+from cryptum.core._records import HashedToken
 from cryptum.crypto import Sha256
 
 
-def generate(count: int = 10) -> list[dict[str, str]]:
+def generate(count: int = 10) -> list[HashedToken]:
     """
     Generate a list of cryptographically secure backup codes.
 
@@ -13,16 +15,52 @@ def generate(count: int = 10) -> list[dict[str, str]]:
         count: The number of backup codes to generate. Defaults to 10.
 
     Returns:
-        A list of dictionaries, each containing:
+        A list of HashedTokens, each also readable as a mapping, containing:
         - 'plaintext': The 16-character backup code.
-        - 'hash': The SHA-256 hash to store.
+        - 'hash': The SHA-256 hash to store, computed on first access.
     """
     codes = []
     for _ in range(count):
         # 8 bytes results in exactly 16 hex characters
         plaintext = hex_entropy(8)
-        codes.append({
-            "plaintext": plaintext,
-            "hash": Sha256.hash(plaintext)
-        })
+        codes.append(HashedToken(plaintext, hash_fn=Sha256.hash))
     return codes
+
+
+def generate_many(count: int) -> dict[str, list[str]]:
+    """
+    Generate backup codes as parallel lists, with one bulk entropy read.
+
+    Args:
+        count: The number of backup codes to generate.
+
+    Returns:
+        A dictionary of parallel lists:
+        - 'plaintext': The 16-character backup codes.
+        - 'hash': Their SHA-256 hashes, in the same order.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    plaintexts = hex_entropy_many(count, 8)
+    return {
+        "plaintext": plaintexts,
+        "hash": Sha256.hash_many(plaintexts),
+    }
+
+
+def iter_many(count: int, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[dict[str, list[str]]]:
+    """
+    Generate backup codes chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of backup codes to generate.
+        chunk_size: The maximum number of backup codes per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size)
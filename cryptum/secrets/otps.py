@@ -1,19 +1,57 @@
-from cryptum.core import random_string
+from typing import Iterator
+from cryptum.core import ITER_CHUNK_SIZE, iter_chunks, random_string, random_strings
+from cryptum.core._records import HashedToken
 from cryptum.crypto import Sha256
 
 
-def generate() -> dict[str, str]:
+def generate() -> HashedToken:
     """
     Generate a cryptographically secure 6-digit numeric OTP.
 
     Returns:
-        A dictionary containing:
+        A HashedToken, also readable as a mapping, containing:
         - 'plaintext': The 6-digit OTP as a string (e.g., '123456').
-        - 'hash': The SHA-256 hash to store and verify against.
+        - 'hash': The SHA-256 hash to store and verify against, computed on first access.
     """
     digits = random_string(6, "0123456789")
     
+    return HashedToken(digits, hash_fn=Sha256.hash)
+
+
+def generate_many(count: int) -> dict[str, list[str]]:
+    """
+    Generate many 6-digit OTPs with one bulk entropy read.
+
+    Args:
+        count: The number of OTPs to generate.
+
+    Returns:
+        A dictionary of parallel lists:
+        - 'plaintext': The 6-digit OTPs.
+        - 'hash': Their SHA-256 hashes, in the same order.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    plaintexts = random_strings(count, 6, "0123456789")
     return {
-        "plaintext": digits,
-        "hash": Sha256.hash(digits)
+        "plaintext": plaintexts,
+        "hash": Sha256.hash_many(plaintexts),
     }
+
+
+def iter_many(count: int, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[dict[str, list[str]]]:
+    """
+    Generate 6-digit OTPs chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of 6-digit OTPs to generate.
+        chunk_size: The maximum number of 6-digit OTPs per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size)
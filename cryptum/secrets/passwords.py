@@ -1,9 +1,12 @@
 import string
-from cryptum.core import random_string
+from typing import Iterator, Optional
+from cryptum.core import ITER_CHUNK_SIZE, iter_chunks, random_string, random_strings
+from cryptum.core._records import HashedToken
 from cryptum.crypto import Argon2id
+from cryptum.crypto.Argon2id import Argon2Profile
 
 
-def generate() -> dict[str, str]:
+def generate(profile: Optional[Argon2Profile] = None) -> HashedToken:
     """
     Generate a strong, cryptographically secure password.
 
@@ -11,8 +14,11 @@ def generate() -> dict[str, str]:
     letters, lowercase letters, digits, and symbols. It is returned 
     along with its Argon2id hash.
 
+    Args:
+        profile: The Argon2id cost parameters. Defaults to Argon2id.DEFAULT_PROFILE.
+
     Returns:
-        A dictionary containing:
+        A HashedToken, also readable as a mapping, containing:
         - 'plaintext': The generated 16-character password.
         - 'hash': The Argon2id hash for secure storage.
     """
@@ -21,10 +27,7 @@ def generate() -> dict[str, str]:
     
     password = random_string(16, alphabet)
     
-    return {
-        "plaintext": password,
-        "hash": Argon2id.hash(password)
-    }
+    return HashedToken(password, hash=Argon2id.hash(password, profile))
 
 
 def verify(password: str, hash: str) -> bool:
@@ -39,3 +42,68 @@ def verify(password: str, hash: str) -> bool:
         True if the password is correct, False otherwise.
     """
     return Argon2id.verify(password, hash)
+
+
+def verify_and_update(
+    password: str,
+    hash: str,
+    profile: Optional[Argon2Profile] = None,
+) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if the stored hash uses outdated parameters.
+
+    Args:
+        password: The plain-text password provided by the user.
+        hash: The stored Argon2id hash.
+        profile: The profile new hashes should use. Defaults to Argon2id.DEFAULT_PROFILE.
+
+    Returns:
+        A tuple (valid, new_hash). When new_hash is not None, replace the
+        stored hash with it.
+    """
+    return Argon2id.verify_and_update(password, hash, profile)
+
+
+def generate_many(count: int, profile: Optional[Argon2Profile] = None) -> dict[str, list[str]]:
+    """
+    Generate many strong passwords with one bulk entropy read.
+
+    Hashing dominates the cost; it is batched through `Argon2id.hash_many`,
+    so an `Argon2Pool` backend spreads it across processes.
+
+    Args:
+        count: The number of passwords to generate.
+        profile: The Argon2id cost parameters. Defaults to Argon2id.DEFAULT_PROFILE.
+
+    Returns:
+        A dictionary of parallel lists:
+        - 'plaintext': The 16-character passwords.
+        - 'hash': Their Argon2id hashes, in the same order.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    alphabet = string.ascii_letters + string.digits + string.punctuation
+    passwords = random_strings(count, 16, alphabet)
+    return {
+        "plaintext": passwords,
+        "hash": Argon2id.hash_many(passwords, profile),
+    }
+
+
+def iter_many(count: int, profile: Optional[Argon2Profile] = None, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[dict[str, list[str]]]:
+    """
+    Generate strong passwords chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of strong passwords to generate.
+        profile: The Argon2id cost parameters. Defaults to Argon2id.DEFAULT_PROFILE.
+        chunk_size: The maximum number of strong passwords per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size, profile)
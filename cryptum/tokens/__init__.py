@@ -1,16 +1,23 @@
-from . import api_keys
-from . import csrf_tokens
-from . import email_verification
-from . import jwt_tokens
-from . import magic_links
-from . import nonce
-from . import password_reset
-from . import reauth_tokens
-from . import refresh_tokens
-from . import session_tokens
-from . import sudo_session
-from . import twofa_session
-from . import webhook_secrets
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+# Submodules are imported on first access (PEP 562)
+if TYPE_CHECKING:
+    from . import api_keys
+    from . import csrf_tokens
+    from . import email_verification
+    from . import jwt_tokens
+    from . import magic_links
+    from . import nonce
+    from . import password_reset
+    from . import reauth_tokens
+    from . import refresh_tokens
+    from . import session_tokens
+    from . import store
+    from . import sudo_session
+    from . import twofa_session
+    from . import webhook_secrets
 
 __all__ = [
     "api_keys",
@@ -23,7 +30,18 @@ __all__ = [
     "reauth_tokens",
     "refresh_tokens",
     "session_tokens",
+    "store",
     "sudo_session",
     "twofa_session",
     "webhook_secrets",
 ]
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(f".{name}", __name__)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,24 +1,267 @@
-from cryptum.core import urlsafe_entropy, with_prefix
-from cryptum.core._constants import ENTROPY_LONG_LIVED, PREFIX_ACCESS_KEY
+import hashlib
+import hmac as hmac_module
+import operator
+import time
+from typing import Iterator, Optional
+from cryptum.core import ITER_CHUNK_SIZE, iter_chunks, urlsafe_entropy, urlsafe_entropy_many, with_prefix, with_prefix_many
+from cryptum.core._cache import ShardedTTLCache
+from cryptum.core._constants import API_KEY_VERSION, ENTROPY_LONG_LIVED, PREFIX_ACCESS_KEY
+from cryptum.core._records import SignedToken
 from cryptum.crypto import hmac
+from cryptum.crypto.keyring import KeyRing
+from cryptum.instrumentation import instrumented
 
 
-def generate(secret_key: str) -> dict[str, str]:
+@instrumented("api_keys.generate")
+def generate(secret_key: str | KeyRing) -> SignedToken:
     """
     Generate a cryptographically secure API key signed with HMAC-SHA256.
 
+    When given a KeyRing, the key is signed with the ring's active secret and
+    uses the versioned format 'ak_v2.<key_id>.<random>', so verification can
+    go straight to the right secret after a rotation.
+
     Args:
-        secret_key: The master server-side key used to sign the API key.
+        secret_key: The master server-side key used to sign the API key,
+            or a KeyRing.
 
     Returns:
-        A dictionary containing:
+        A SignedToken, also readable as a mapping, containing:
         - 'plaintext': The key to show the user (e.g., 'ak_...')
         - 'signature': The HMAC-SHA256 signature for verification.
+        - 'key_id': The signing key ID (only when a KeyRing is given).
+
+    Raises:
+        ValueError: If the KeyRing has no active key.
     """
+    if isinstance(secret_key, KeyRing):
+        key_id, entry = secret_key._active_entry()
+        value = f"{API_KEY_VERSION}.{key_id}.{urlsafe_entropy(ENTROPY_LONG_LIVED)}"
+        plaintext = with_prefix(PREFIX_ACCESS_KEY, value)
+        return SignedToken(plaintext, entry.signer.sign(plaintext), key_id)
+
     plaintext = with_prefix(PREFIX_ACCESS_KEY, urlsafe_entropy(ENTROPY_LONG_LIVED))
     signature = hmac.sign(plaintext, secret_key)
 
+    return SignedToken(plaintext, signature)
+
+
+def generate_many(count: int, secret_key: str | KeyRing) -> dict[str, list[str] | str]:
+    """
+    Generate many signed API keys with one bulk entropy read and one HMAC key schedule.
+
+    Args:
+        count: The number of API keys to generate.
+        secret_key: The master server-side key used to sign the API keys,
+            or a KeyRing.
+
+    Returns:
+        A dictionary containing:
+        - 'plaintext': The keys to show the users.
+        - 'signature': Their HMAC-SHA256 signatures, in the same order.
+        - 'key_id': The signing key ID shared by the whole batch (only when a KeyRing is given).
+
+    Raises:
+        ValueError: If count is not a positive integer or the KeyRing has no active key.
+    """
+    entropy = urlsafe_entropy_many(count, ENTROPY_LONG_LIVED)
+
+    if isinstance(secret_key, KeyRing):
+        key_id, entry = secret_key._active_entry()
+        head = f"{API_KEY_VERSION}.{key_id}."
+        plaintexts = with_prefix_many(PREFIX_ACCESS_KEY, [head + value for value in entropy])
+        return {
+            "plaintext": plaintexts,
+            "signature": entry.signer.sign_many(plaintexts),
+            "key_id": key_id,
+        }
+
+    plaintexts = with_prefix_many(PREFIX_ACCESS_KEY, entropy)
     return {
-        "plaintext": plaintext,
-        "signature": signature,
+        "plaintext": plaintexts,
+        "signature": hmac.Signer(secret_key).sign_many(plaintexts),
     }
+
+
+def iter_many(count: int, secret_key: str | KeyRing, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[dict[str, list[str] | str]]:
+    """
+    Generate signed API keys chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of signed API keys to generate.
+        secret_key: The master server-side key used to sign the API keys,
+            or a KeyRing.
+        chunk_size: The maximum number of signed API keys per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer, or the KeyRing
+            has no active key.
+    """
+    return iter_chunks(generate_many, count, chunk_size, secret_key)
+
+
+def key_id_of(plaintext: str) -> Optional[str]:
+    """
+    Extract the embedded key ID from a versioned API key.
+
+    Args:
+        plaintext: The API key presented by the client.
+
+    Returns:
+        The key ID, or None for legacy or malformed keys.
+    """
+    if not isinstance(plaintext, str):
+        return None
+
+    head = f"{PREFIX_ACCESS_KEY}_{API_KEY_VERSION}."
+    if not plaintext.startswith(head):
+        return None
+
+    key_id, dot, _ = plaintext[len(head):].partition(".")
+    return key_id if dot else None
+
+
+@instrumented("api_keys.verify", failure=operator.not_)
+def verify(plaintext: str, signature: str, secret_key: str | KeyRing) -> bool:
+    """
+    Verify an API key against its stored HMAC-SHA256 signature.
+
+    With a KeyRing, the secret is picked in O(1) from the key ID embedded in
+    the key. Keys with an unknown or retired key ID, or in the legacy
+    format, are rejected before any HMAC is computed.
+
+    This function never raises and returns False on any invalid input.
+
+    Args:
+        plaintext: The API key presented by the client.
+        signature: The stored hexadecimal signature.
+        secret_key: The master key used at generation time, or a KeyRing.
+
+    Returns:
+        True if the signature is valid, False otherwise.
+    """
+    if isinstance(secret_key, KeyRing):
+        key_id = key_id_of(plaintext)
+        signer = secret_key.signer(key_id) if key_id is not None else None
+        if signer is None:
+            return False
+        return signer.verify(plaintext, signature)
+
+    return hmac.verify(plaintext, secret_key, signature)
+
+
+class VerificationCache:
+    """
+    A TTL-bounded cache in front of `verify` for hot API keys.
+
+    Successful verifications are remembered for `ttl` seconds and failures
+    for the shorter `negative_ttl`, so repeated valid keys and repeated
+    scanner garbage both skip the HMAC. Entries are keyed by the SHA-256
+    of the presented key; plaintext keys are never stored. The caches are
+    sharded, so concurrent lookups rarely contend on the same lock.
+
+    With a KeyRing, a cached success is still refused once its key ID is
+    retired. Call `invalidate` when revoking an individual key.
+
+    Example:
+        cache = VerificationCache(ring, ttl=300)
+        cache.verify(presented_key, stored_signature)
+    """
+
+    def __init__(
+        self,
+        secret_key: str | KeyRing,
+        ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+        maxsize: int = 65536,
+        negative_maxsize: int = 16384,
+        shards: int = 16,
+    ):
+        """
+        Args:
+            secret_key: The master key used at generation time, or a KeyRing.
+            ttl: Seconds a successful verification is cached.
+            negative_ttl: Seconds a failed verification is cached.
+            maxsize: Maximum number of cached successes.
+            negative_maxsize: Maximum number of cached failures.
+            shards: Number of independently locked shards per cache.
+
+        Raises:
+            ValueError: If a TTL is negative or a size is out of range.
+        """
+        if ttl < 0 or negative_ttl < 0:
+            raise ValueError("ttl and negative_ttl must not be negative")
+
+        self.secret_key = secret_key
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._positive = ShardedTTLCache(maxsize, shards)
+        self._negative = ShardedTTLCache(negative_maxsize, shards)
+
+    @instrumented("api_keys.cached_verify", failure=operator.not_)
+    def verify(self, plaintext: str, signature: str) -> bool:
+        """
+        Verify an API key, consulting the caches first.
+
+        Like `verify`, this never raises and returns False on any invalid input.
+
+        Args:
+            plaintext: The API key presented by the client.
+            signature: The stored hexadecimal signature.
+
+        Returns:
+            True if the signature is valid, False otherwise.
+        """
+        if not isinstance(plaintext, str) or not isinstance(signature, str):
+            return False
+
+        key = hashlib.sha256(plaintext.encode("utf-8")).digest()
+        normalized = signature.lower()
+
+        cached = self._positive.get(key)
+        if cached is not None and hmac_module.compare_digest(cached, normalized):
+            if isinstance(self.secret_key, KeyRing):
+                return self.secret_key.signer(key_id_of(plaintext)) is not None
+            return True
+
+        negative_key = hashlib.sha256(key + normalized.encode("utf-8")).digest()
+        if self._negative.get(negative_key) is not None:
+            return False
+
+        valid = verify(plaintext, signature, self.secret_key)
+        now = time.monotonic()
+        if valid:
+            self._positive.set(key, normalized, now + self.ttl)
+        else:
+            self._negative.set(negative_key, True, now + self.negative_ttl)
+        return valid
+
+    def invalidate(self, plaintext: str) -> None:
+        """
+        Drop the cached success for an API key, e.g. when it is revoked.
+        """
+        self._positive.pop(hashlib.sha256(plaintext.encode("utf-8")).digest())
+
+    def clear(self) -> None:
+        """
+        Drop every cached success and failure.
+        """
+        self._positive.clear()
+        self._negative.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return cache counters.
+
+        Returns:
+            A dictionary containing 'hits', 'misses', 'evictions' and 'size'
+            for successes, and the same counters prefixed with 'negative_'
+            for failures.
+        """
+        stats = self._positive.stats()
+        for name, value in self._negative.stats().items():
+            stats[f"negative_{name}"] = value
+        return stats
@@ -1,10 +1,24 @@
+import base64
 import datetime
-from typing import Any
+import functools
+import hashlib
+import hmac as hmac_module
+import json
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 import jwt
+from jwt.algorithms import HMACAlgorithm
+from cryptum.crypto import hmac
+from cryptum.crypto.keyring import KeyRing
+from cryptum.instrumentation import instrumented
 
+@instrumented("jwt.encode")
 def encode(
     payload: dict[str, Any],
-    secret: str | bytes,
+    secret: str | bytes | KeyRing,
     expiry_seconds: int = 900, # 15 minutes
 ) -> str:
     """
@@ -14,7 +28,8 @@ def encode(
 
     Args:
         payload: Custom claims to include in the token.
-        secret: The secret key used for signing.
+        secret: The secret key used for signing, or a KeyRing. With a KeyRing the
+            token is signed with the active key and carries its ID in the 'kid' header.
         expiry_seconds: Number of seconds until the token expires. Defaults to 15 minutes.
 
     Returns:
@@ -22,8 +37,8 @@ def encode(
 
     Raises:
         TypeError: If payload is not a dictionary.
-        ValueError: If reserved claims ('exp', 'iat') are present in the payload or
-                    if expiry_seconds is non-positive.
+        ValueError: If reserved claims ('exp', 'iat') are present in the payload,
+                    if expiry_seconds is non-positive, or if the key ring has no active key.
     """
     if not isinstance(payload, dict):
         raise TypeError("payload must be a dict")
@@ -45,31 +60,481 @@ def encode(
         "exp": int(exp.timestamp()),
     }
 
+    if isinstance(secret, KeyRing):
+        key_id, entry = secret._active_entry()
+        return _sign_claims(claims, _header_segment(key_id) + b".", entry.signer, entry.secret, key_id)
+
     # Algorithm is hardcoded to HS256 to eliminate choice and prevent confusion bugs.
     return jwt.encode(claims, secret, algorithm="HS256")
 
 
+@instrumented("jwt.decode", payload=0)
 def decode(
     token: str,
-    secret: str | bytes,
+    secret: str | bytes | KeyRing,
+    cache: Optional["DecodeCache"] = None,
 ) -> dict[str, Any]:
     """
     Verify and decode a JWT with safe defaults.
 
     Args:
         token: The JWT string to decode.
-        secret: The secret key used for verification.
+        secret: The secret key used for verification, or a KeyRing. With a
+            KeyRing the key is chosen by the token's 'kid' header.
+        cache: Optional DecodeCache. When given, verified claims are reused
+            until the token expires and are returned as a read-only mapping.
 
     Returns:
         The decoded payload dictionary.
 
+    Raises:
+        jwt.InvalidTokenError: If a KeyRing is given and the token's 'kid' is
+            missing, unknown or retired. No HMAC is computed in that case.
+
     Note:
         This function enforces that 'exp' and 'iat' claims are present and
         that the token is signed with HS256.
     """
+    if isinstance(secret, KeyRing):
+        key_id = _key_id_of(token)
+        entry = secret._usable_entry(key_id) if key_id is not None else None
+        if entry is None:
+            raise jwt.InvalidTokenError("Unknown or retired key ID")
+        return _verify(token, _header_segment(key_id) + b".", entry.signer, entry.secret, cache)
+
+    if cache is not None:
+        key = cache.key(token, secret)
+        claims = cache.get(key)
+        if claims is not None:
+            return claims
+        return cache.put(key, _pyjwt_decode(token, secret))
+
+    return _pyjwt_decode(token, secret)
+
+
+def _pyjwt_decode(token: str | bytes, secret: str | bytes) -> dict[str, Any]:
     return jwt.decode(
         token,
         secret,
         algorithms=["HS256"],
         options={"require": ["exp", "iat"]},
     )
+
+
+@functools.lru_cache(maxsize=64)
+def _header_segment(key_id: Optional[str] = None) -> bytes:
+    """
+    Return the base64url header segment for HS256, exactly as PyJWT encodes it.
+    """
+    header = {"typ": "JWT", "alg": "HS256"}
+    if key_id is not None:
+        header["kid"] = key_id
+    encoded = json.dumps(header, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(encoded).rstrip(b"=")
+
+
+def _key_id_of(token: str | bytes) -> Optional[str]:
+    """
+    Return the 'kid' header of an unverified token, or None if it has none.
+    """
+    if isinstance(token, str):
+        if not token.isascii():
+            return None
+        token = token.encode("ascii")
+    elif not isinstance(token, bytes):
+        return None
+
+    header = _b64decode(token.partition(b".")[0])
+    if header is None:
+        return None
+    try:
+        header = json.loads(header)
+    except ValueError:
+        return None
+    key_id = header.get("kid") if isinstance(header, dict) else None
+    return key_id if isinstance(key_id, str) else None
+
+
+def _b64decode(segment: bytes) -> Optional[bytes]:
+    """
+    Decode a canonical, unpadded base64url segment, or return None.
+    """
+    try:
+        decoded = base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+    except ValueError:
+        return None
+    if base64.urlsafe_b64encode(decoded).rstrip(b"=") != segment:
+        return None
+    return decoded
+
+
+class JWTCodec:
+    """
+    A fast HS256 encoder/decoder bound to a single secret.
+
+    Because cryptum only issues HS256 tokens, the header segment is constant
+    and is encoded once, and the HMAC key schedule is computed once (see
+    `hmac.Signer`). Claims use integer `time.time()` arithmetic instead of
+    datetime objects.
+
+    Tokens are byte-for-byte identical to `encode`, and `decode` enforces
+    the same rules as PyJWT with `require: exp, iat`, raising the same
+    `jwt` exceptions. Well-formed tokens are handled entirely on the fast
+    path. Anything unusual (a foreign header, non-canonical encoding, or
+    claims such as 'aud') is handed to PyJWT, so edge cases behave exactly
+    as they do with `decode`.
+
+    Example:
+        codec = JWTCodec(secret)
+        token = codec.encode({"sub": "user-123"})
+        claims = codec.decode(token)
+    """
+
+    __slots__ = ("_secret", "_signer", "_header", "_prefix", "_cache", "expiry_seconds")
+
+    def __init__(self, secret: str | bytes, expiry_seconds: int = 900, cache: Optional["DecodeCache"] = None):
+        """
+        Args:
+            secret: The secret key used for signing and verification.
+            expiry_seconds: Default lifetime of encoded tokens. Defaults to 15 minutes.
+            cache: Optional DecodeCache consulted by `decode`.
+
+        Raises:
+            TypeError: If secret is not a string or bytes.
+            ValueError: If expiry_seconds is non-positive.
+            jwt.InvalidKeyError: If the secret looks like an asymmetric key.
+        """
+        if expiry_seconds <= 0:
+            raise ValueError("expiry_seconds must be a positive integer")
+
+        # Rejects PEM/SSH keys used as HMAC secrets, exactly like PyJWT
+        HMACAlgorithm(HMACAlgorithm.SHA256).prepare_key(secret)
+
+        self._secret = secret
+        self._signer = hmac.Signer(secret)
+        self._header = _header_segment()
+        self._prefix = self._header + b"."
+        self._cache = cache
+        self.expiry_seconds = expiry_seconds
+
+    @instrumented("jwt.encode")
+    def encode(self, payload: dict[str, Any], expiry_seconds: Optional[int] = None) -> str:
+        """
+        Generate a signed JWT with mandatory expiration and issuance timestamps.
+
+        Args:
+            payload: Custom claims to include in the token.
+            expiry_seconds: Seconds until the token expires. Defaults to the codec's setting.
+
+        Returns:
+            The encoded and signed JWT string.
+
+        Raises:
+            TypeError: If payload is not a dictionary.
+            ValueError: If reserved claims ('exp', 'iat') are present in the payload or
+                        if expiry_seconds is non-positive.
+        """
+        if not isinstance(payload, dict):
+            raise TypeError("payload must be a dict")
+
+        if expiry_seconds is None:
+            expiry_seconds = self.expiry_seconds
+        elif expiry_seconds <= 0:
+            raise ValueError("expiry_seconds must be a positive integer")
+
+        if "exp" in payload or "iat" in payload:
+            raise ValueError("Payload must not contain reserved 'exp' or 'iat' claims.")
+
+        now = time.time()
+        claims = {
+            **payload,
+            "iat": int(now),
+            "exp": int(now + expiry_seconds),
+        }
+
+        return _sign_claims(claims, self._prefix, self._signer, self._secret)
+
+    @instrumented("jwt.decode", payload=1)
+    def decode(self, token: str | bytes) -> dict[str, Any]:
+        """
+        Verify and decode a JWT with safe defaults.
+
+        Args:
+            token: The JWT string to decode.
+
+        Returns:
+            The decoded payload dictionary (a read-only mapping when the codec has a cache).
+
+        Raises:
+            jwt.InvalidTokenError: Or a subclass, exactly as `decode` would raise.
+        """
+        return _verify(token, self._prefix, self._signer, self._secret, self._cache)
+
+
+def _sign_claims(
+    claims: dict[str, Any],
+    prefix: bytes,
+    signer: hmac.Signer,
+    secret: str | bytes,
+    key_id: Optional[str] = None,
+) -> str:
+    """
+    Serialize and sign claims behind a precomputed header segment, as PyJWT would.
+    """
+    # PyJWT rewrites or rejects these; let it handle the rare case
+    if isinstance(claims.get("nbf"), datetime.datetime) or (
+        "iss" in claims and not isinstance(claims["iss"], str)
+    ):
+        headers = {"kid": key_id} if key_id is not None else None
+        return jwt.encode(claims, secret, algorithm="HS256", headers=headers)
+
+    encoded = json.dumps(claims, separators=(",", ":")).encode("utf-8")
+    signing_input = prefix + base64.urlsafe_b64encode(encoded).rstrip(b"=")
+    signature = base64.urlsafe_b64encode(signer.digest(signing_input)).rstrip(b"=")
+    return (signing_input + b"." + signature).decode("ascii")
+
+
+def _verify(
+    token: str | bytes,
+    prefix: bytes,
+    signer: hmac.Signer,
+    secret: str | bytes,
+    cache: Optional["DecodeCache"],
+) -> dict[str, Any]:
+    """
+    Decode through the cache and the fast path, deferring to PyJWT when needed.
+    """
+    if cache is not None:
+        key = cache.key(token, secret)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    claims = _decode_fast(token, prefix, signer)
+    if claims is None:
+        claims = _pyjwt_decode(token, secret)
+    return claims if cache is None else cache.put(key, claims)
+
+
+def _decode_fast(token: str | bytes, prefix: bytes, signer: hmac.Signer) -> Optional[dict[str, Any]]:
+    """
+    Decode a well-formed token whose header segment is `prefix`, or return None to defer to PyJWT.
+    """
+    if isinstance(token, str):
+        if not token.isascii():
+            return None
+        token = token.encode("ascii")
+    elif not isinstance(token, bytes):
+        return None
+
+    if not token.startswith(prefix):
+        return None
+
+    signing_input, _, crypto_segment = token.rpartition(b".")
+    payload_segment = signing_input[len(prefix):]
+    if b"." in payload_segment:
+        return None
+
+    payload = _b64decode(payload_segment)
+    signature = _b64decode(crypto_segment)
+    if payload is None or signature is None:
+        return None
+
+    if not hmac_module.compare_digest(signer.digest(signing_input), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    try:
+        claims = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(claims, dict):
+        return None
+
+    return claims if _claims_ok(claims, time.time()) else None
+
+
+def _claims_ok(claims: dict[str, Any], now: float) -> bool:
+    """
+    Apply the claim checks of `decode` in PyJWT's order.
+
+    Returns False (defer to PyJWT) for anything other than a clean pass or
+    a plain expiry, which is raised here directly.
+    """
+    if claims.get("exp") is None or claims.get("iat") is None:
+        return False
+    try:
+        iat = int(claims["iat"])
+        exp = int(claims["exp"])
+        nbf = int(claims["nbf"]) if "nbf" in claims else None
+    except (ValueError, TypeError, OverflowError):
+        return False
+
+    if iat > now or (nbf is not None and nbf > now):
+        return False
+    if exp <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    if claims.get("aud"):
+        return False
+    for name in ("sub", "jti"):
+        if name in claims and not isinstance(claims[name], str):
+            return False
+    return True
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Return a deeply read-only view of decoded JSON: dicts become mappings, lists tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class DecodeCache:
+    """
+    An opt-in cache of verified JWT claims, keyed by a digest of the token.
+
+    Each entry lives until its token's own 'exp', and the cache as a whole
+    is capped with LRU eviction. Claims are returned as deeply read-only
+    mappings, so a caller cannot corrupt what another caller will read.
+    The key binds the token to the verification secret, so a token is
+    never served from the cache for a secret it was not verified with.
+
+    Revoking by 'jti' or subject evicts matching entries immediately. It
+    does not deny the token: decoding it again succeeds if its signature
+    and claims are still valid, so enforce revocation in your own store too.
+
+    Example:
+        cache = DecodeCache(maxsize=50_000)
+        claims = cryptum.decode_jwt(token, secret, cache=cache)
+        cache.revoke_subject("user-123")
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """
+        Args:
+            maxsize: Maximum number of cached tokens.
+
+        Raises:
+            ValueError: If maxsize is not a positive integer.
+        """
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[float, Mapping[str, Any]]] = OrderedDict()
+        self._by_jti: dict[str, set[bytes]] = {}
+        self._by_subject: dict[str, set[bytes]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def key(token: str | bytes, secret: str | bytes) -> bytes:
+        """
+        Compute the cache key for a token verified with a given secret.
+        """
+        if isinstance(token, str):
+            token = token.encode("utf-8")
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        return hashlib.sha256(len(secret).to_bytes(4, "big") + secret + token).digest()
+
+    def get(self, key: bytes) -> Optional[Mapping[str, Any]]:
+        """
+        Return the cached claims for a key, or None if absent or expired.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry[0] <= now:
+                self._remove_locked(key)
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: bytes, claims: dict[str, Any]) -> Mapping[str, Any]:
+        """
+        Cache verified claims until their 'exp' and return the read-only view.
+        """
+        frozen = _freeze(claims)
+        try:
+            expires_at = float(claims["exp"])
+        except (KeyError, TypeError, ValueError):
+            return frozen
+
+        jti, subject = claims.get("jti"), claims.get("sub")
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+            self._entries[key] = (expires_at, frozen)
+            if isinstance(jti, str):
+                self._by_jti.setdefault(jti, set()).add(key)
+            if isinstance(subject, str):
+                self._by_subject.setdefault(subject, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                self._remove_locked(next(iter(self._entries)))
+                self._evictions += 1
+        return frozen
+
+    def _remove_locked(self, key: bytes) -> None:
+        _, claims = self._entries.pop(key)
+        for index, name in ((self._by_jti, "jti"), (self._by_subject, "sub")):
+            value = claims.get(name)
+            keys = index.get(value) if isinstance(value, str) else None
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del index[value]
+
+    def _revoke(self, index: dict[str, set[bytes]], value: str) -> int:
+        with self._lock:
+            keys = list(index.get(value, ()))
+            for key in keys:
+                self._remove_locked(key)
+        return len(keys)
+
+    def revoke_jti(self, jti: str) -> int:
+        """
+        Evict every cached token with the given 'jti'.
+
+        Returns:
+            The number of entries evicted.
+        """
+        return self._revoke(self._by_jti, jti)
+
+    def revoke_subject(self, subject: str) -> int:
+        """
+        Evict every cached token for the given subject ('sub').
+
+        Returns:
+            The number of entries evicted.
+        """
+        return self._revoke(self._by_subject, subject)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_jti.clear()
+            self._by_subject.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return the hit, miss and eviction counts and the current size.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
@@ -1,19 +1,271 @@
-from cryptum.core import urlsafe_entropy, with_prefix
+import math
+import threading
+import time
+from typing import Callable, Iterator, Optional
+from cryptum.core import ITER_CHUNK_SIZE, iter_chunks, urlsafe_entropy, urlsafe_entropy_many, with_prefix, with_prefix_many
 from cryptum.core._constants import ENTROPY_IDENTIFIER, PREFIX_NONCE
+from cryptum.core._filters import _BLOCK_BYTES, BloomFilter, _digest, _locate, _sizing
+from cryptum.core._records import HashedToken
 from cryptum.crypto import Sha256
 
 
-def generate() -> dict[str, str]:
+def generate() -> HashedToken:
     """
     Generate a cryptographically secure one-time cryptographic nonce.
 
     Returns:
-        A dictionary containing:
+        A HashedToken, also readable as a mapping, containing:
         - 'plaintext': The nonce (e.g., 'n_...')
-        - 'hash': The SHA-256 hash if tracking or auditing is required.
+        - 'hash': The SHA-256 hash if tracking or auditing is required, computed on first access.
     """
     plaintext = with_prefix(PREFIX_NONCE, urlsafe_entropy(ENTROPY_IDENTIFIER))
+    return HashedToken(plaintext, hash_fn=Sha256.hash)
+
+
+def generate_many(count: int) -> dict[str, list[str]]:
+    """
+    Generate many nonces with one bulk entropy read.
+
+    Args:
+        count: The number of nonces to generate.
+
+    Returns:
+        A dictionary of parallel lists:
+        - 'plaintext': The nonces.
+        - 'hash': Their SHA-256 hashes, in the same order.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    plaintexts = with_prefix_many(PREFIX_NONCE, urlsafe_entropy_many(count, ENTROPY_IDENTIFIER))
     return {
-        "plaintext": plaintext,
-        "hash": Sha256.hash(plaintext),
+        "plaintext": plaintexts,
+        "hash": Sha256.hash_many(plaintexts),
     }
+
+
+def iter_many(count: int, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[dict[str, list[str]]]:
+    """
+    Generate nonces chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of nonces to generate.
+        chunk_size: The maximum number of nonces per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size)
+
+
+class _GuardState:
+    __slots__ = ("filters", "oldest", "arrays")
+
+    def __init__(self, filters: dict[int, tuple[BloomFilter, ...]], oldest: int):
+        # slice index -> chain of filters, a new one appended whenever the last fills up
+        self.filters = filters
+        self.oldest = oldest
+        # The raw bit arrays, newest first: the probe loop runs on every check
+        self.arrays = tuple(
+            bloom._bits
+            for index in sorted(filters, reverse=True)
+            for bloom in reversed(filters[index])
+        )
+
+
+class ReplayGuard:
+    """
+    Detects replayed nonces over a sliding time window, in bounded memory.
+
+    Each nonce is filed in a Bloom filter for the time slice of its
+    timestamp. Slices older than the window are dropped whole, and a slice
+    never holds more than `capacity` nonces' worth of filters, so memory
+    stays bounded no matter how much traffic arrives; there is no
+    per-nonce expiry. Messages whose timestamp is more than `window` seconds away
+    from now are refused outright, since their nonce may already have
+    been forgotten.
+
+    A fresh nonce is wrongly reported as a replay with probability about
+    `error_rate`, as long as no more than `capacity` nonces arrive per
+    window, however they are spread over it: a slice that fills up chains
+    a fresh filter rather than overloading its first one. A real replay
+    is always caught.
+
+    Lookups with `seen` take no lock. `is_replay` checks and records under
+    one short lock, so two concurrent deliveries of the same nonce cannot
+    both pass.
+
+    Example:
+        guard = ReplayGuard(window=300, capacity=1_000_000)
+        if guard.is_replay(request_nonce, request_timestamp):
+            reject()
+    """
+
+    def __init__(
+        self,
+        window: float = 300.0,
+        capacity: int = 100_000,
+        error_rate: float = 1e-6,
+        slices: int = 4,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            window: Seconds a nonce is remembered, and the accepted clock skew
+                of message timestamps in either direction.
+            capacity: Expected maximum number of nonces per window. Filters
+                are sized for `capacity / slices` nonces and chained within a
+                slice as needed (up to `slices` of them), so memory follows
+                the actual traffic. Beyond `capacity`, the false-positive rate
+                rises above `error_rate` but memory does not.
+            error_rate: Target probability that a fresh nonce is refused.
+            slices: Number of filters per window. More slices free memory in
+                smaller steps, at the cost of probing more filters.
+            clock: Wall-clock time, in the same unit as message timestamps.
+
+        Raises:
+            ValueError: If window, capacity, error_rate or slices is out of range.
+        """
+        if not window > 0:
+            raise ValueError("window must be positive")
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        if not isinstance(slices, int) or slices <= 0:
+            raise ValueError("slices must be a positive integer")
+
+        self.window = window
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.clock = clock
+        self._slice = window / slices
+        # Timestamps span [now - window, now + window]: up to 2 * slices + 1 live
+        # slices, each with one partly filled filter, plus at most `slices` full
+        # filters when `capacity` nonces are live. Probing all of them must stay
+        # within error_rate.
+        self._slice_capacity = math.ceil(capacity / slices)
+        self._slice_error_rate = error_rate / (3 * slices + 1)
+        self._max_chain = slices
+        self._state = _GuardState({}, 0)
+        self._lock = threading.Lock()
+
+        # Every slice has the same size, so a nonce's block and mask are computed once
+        self._num_blocks, self._num_hashes = _sizing(self._slice_capacity, self._slice_error_rate)
+        self._checked = 0
+        self._replays = 0
+        self._stale = 0
+
+    def _rotate_locked(self, now: float) -> _GuardState:
+        """
+        Drop slices that fell out of the window and return the current state.
+        """
+        state = self._state
+        oldest = int((now - self.window) // self._slice)
+        if oldest > state.oldest:
+            filters = {index: chain for index, chain in state.filters.items() if index >= oldest}
+            state = self._state = _GuardState(filters, oldest)
+        return state
+
+    def _live(self, now: float) -> _GuardState:
+        """
+        Return the current state without locking, unless slices must be dropped first.
+        """
+        state = self._state
+        if int((now - self.window) // self._slice) <= state.oldest:
+            return state
+        with self._lock:
+            return self._rotate_locked(now)
+
+    def _locate(self, nonce: str | bytes) -> tuple[int, int]:
+        return _locate(_digest(nonce, 8 + self._num_hashes), self._num_blocks)
+
+    @staticmethod
+    def _probe(state: _GuardState, offset: int, mask: int) -> bool:
+        end = offset + _BLOCK_BYTES
+        for bits in state.arrays:
+            if int.from_bytes(bits[offset:end], "little") & mask == mask:
+                return True
+        return False
+
+    def seen(self, nonce: str | bytes) -> bool:
+        """
+        Return True if the nonce was probably recorded within the window. Records nothing.
+
+        Raises:
+            TypeError: If nonce is not a string or bytes.
+        """
+        return self._probe(self._live(self.clock()), *self._locate(nonce))
+
+    def is_replay(self, nonce: str | bytes, timestamp: Optional[float] = None) -> bool:
+        """
+        Record a nonce and return whether it must be refused.
+
+        Args:
+            nonce: The nonce presented with the message.
+            timestamp: The time the sender stamped on the message. It must be
+                covered by the message's signature. Defaults to now, in which
+                case the nonce is remembered for `window` seconds from now.
+
+        Returns:
+            True if the nonce was (probably) seen before or the timestamp is
+            outside the window; False if the nonce is fresh and now recorded.
+
+        Raises:
+            TypeError: If nonce is not a string or bytes.
+        """
+        now = self.clock()
+        if timestamp is None:
+            timestamp = now
+        if abs(now - timestamp) > self.window:
+            with self._lock:
+                self._checked += 1
+                self._stale += 1
+            return True
+
+        offset, mask = self._locate(nonce)
+        index = int(timestamp // self._slice)
+        # Probe and insert under one lock: of two concurrent deliveries of the
+        # same nonce, exactly one is accepted
+        with self._lock:
+            self._checked += 1
+            state = self._rotate_locked(now)
+            if self._probe(state, offset, mask):
+                self._replays += 1
+                return True
+            chain = state.filters.get(index, ())
+            if not chain or (chain[-1].count >= self._slice_capacity and len(chain) < self._max_chain):
+                chain += (BloomFilter(self._slice_capacity, self._slice_error_rate),)
+                self._state = _GuardState({**state.filters, index: chain}, state.oldest)
+            chain[-1]._add(offset, mask)
+        return False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._state = _GuardState({}, self._state.oldest)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return guard counters.
+
+        Returns:
+            A dictionary containing 'checked', 'replays', 'stale' (timestamp
+            outside the window), 'filters' (live Bloom filters, one or more
+            per slice), 'nonces' (recorded in live slices) and 'memory_bytes'
+            (size of the live filters).
+        """
+        with self._lock:
+            state = self._rotate_locked(self.clock())
+            checked, replays, stale = self._checked, self._replays, self._stale
+        filters = [bloom for chain in state.filters.values() for bloom in chain]
+        return {
+            "checked": checked,
+            "replays": replays,
+            "stale": stale,
+            "filters": len(filters),
+            "nonces": sum(bloom.count for bloom in filters),
+            "memory_bytes": sum(bloom.nbytes for bloom in filters),
+        }
@@ -1,19 +1,57 @@
-from cryptum.core import urlsafe_entropy, with_prefix
+from typing import Iterator
+from cryptum.core import ITER_CHUNK_SIZE, iter_chunks, urlsafe_entropy, urlsafe_entropy_many, with_prefix, with_prefix_many
 from cryptum.core._constants import ENTROPY_LONG_LIVED, PREFIX_REFRESH_TOKEN
+from cryptum.core._records import HashedToken
 from cryptum.crypto import Sha256
 
 
-def generate() -> dict[str, str]:
+def generate() -> HashedToken:
     """
     Generate a cryptographically secure, high-entropy refresh token.
 
     Returns:
-        A dictionary containing:
+        A HashedToken, also readable as a mapping, containing:
         - 'plaintext': The refresh token (e.g., 'rt_...')
-        - 'hash': The SHA-256 hash for storage/verification.
+        - 'hash': The SHA-256 hash for storage/verification, computed on first access.
     """
     plaintext = with_prefix(PREFIX_REFRESH_TOKEN, urlsafe_entropy(ENTROPY_LONG_LIVED))
+    return HashedToken(plaintext, hash_fn=Sha256.hash)
+
+
+def generate_many(count: int) -> dict[str, list[str]]:
+    """
+    Generate many refresh tokens with one bulk entropy read.
+
+    Args:
+        count: The number of refresh tokens to generate.
+
+    Returns:
+        A dictionary of parallel lists:
+        - 'plaintext': The refresh tokens.
+        - 'hash': Their SHA-256 hashes, in the same order.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    plaintexts = with_prefix_many(PREFIX_REFRESH_TOKEN, urlsafe_entropy_many(count, ENTROPY_LONG_LIVED))
     return {
-        "plaintext": plaintext,
-        "hash": Sha256.hash(plaintext),
+        "plaintext": plaintexts,
+        "hash": Sha256.hash_many(plaintexts),
     }
+
+
+def iter_many(count: int, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[dict[str, list[str]]]:
+    """
+    Generate refresh tokens chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of refresh tokens to generate.
+        chunk_size: The maximum number of refresh tokens per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size)
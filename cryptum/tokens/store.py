@@ -0,0 +1,333 @@
+import hashlib
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from cryptum.core._records import HashedToken
+from cryptum.core._wheel import TimingWheel
+
+SNAPSHOT_VERSION = 1
+
+_MISSING = object()
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at")
+
+    def __init__(self, value: Any, expires_at: float):
+        self.value = value
+        self.expires_at = expires_at
+
+
+def _key_of(token_hash: str | bytes | HashedToken) -> bytes:
+    """
+    Normalize a stored hash (hex digest, raw digest or HashedToken) to the 32-byte digest.
+    """
+    if isinstance(token_hash, HashedToken):
+        token_hash = token_hash.hash
+    if isinstance(token_hash, str):
+        if len(token_hash) != 64:
+            raise ValueError("token_hash must be a 64-character hex SHA-256 digest")
+        return bytes.fromhex(token_hash)
+    if isinstance(token_hash, bytes):
+        if len(token_hash) != 32:
+            raise ValueError("token_hash must be a 32-byte SHA-256 digest")
+        return token_hash
+    raise TypeError("token_hash must be a hex string, bytes or a HashedToken")
+
+
+def _digest(plaintext: str | bytes) -> bytes:
+    if isinstance(plaintext, str):
+        plaintext = plaintext.encode("utf-8")
+    elif not isinstance(plaintext, bytes):
+        raise TypeError("plaintext must be a string or bytes")
+    return hashlib.sha256(plaintext).digest()
+
+
+class TokenStore:
+    """
+    An in-process store for short-lived tokens, keyed by their SHA-256 digest.
+
+    Use it in place of a database lookup for sessions, CSRF tokens, magic
+    links and password resets. Records are filed under the 32-byte digest
+    of the token, never the plaintext, so a memory dump does not reveal
+    usable tokens. Lookups take the plaintext the client presented.
+
+    Expiry runs on a hierarchical timing wheel: inserting, consuming and
+    expiring a record are O(1), with no timer per record. An expired record
+    is never returned, even between wheel ticks. When `max_entries` is
+    reached, the least recently used record is evicted.
+
+    Example:
+        store = TokenStore(max_entries=100_000)
+        token = magic_links.generate()
+        store.put(token.hash, {"user_id": 42}, ttl=900)
+        ...
+        record = store.consume(presented_token)  # single use: None the second time
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        resolution: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of records held.
+            resolution: Granularity of the expiry wheel, in seconds. Memory of
+                expired records is reclaimed at most this late.
+            clock: The clock TTLs are measured against.
+
+        Raises:
+            ValueError: If max_entries is not a positive integer or resolution is not positive.
+        """
+        if not isinstance(max_entries, int) or max_entries <= 0:
+            raise ValueError("max_entries must be a positive integer")
+
+        self.max_entries = max_entries
+        self.clock = clock
+        self._wheel = TimingWheel(resolution, clock())
+        self._entries: OrderedDict[bytes, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._consumed = 0
+        self._expired = 0
+        self._evictions = 0
+
+    def _expire_locked(self, now: float) -> None:
+        expired = self._wheel.advance(now)
+        for key in expired:
+            del self._entries[key]
+        self._expired += len(expired)
+
+    def _insert_locked(self, key: bytes, value: Any, expires_at: float) -> None:
+        entries = self._entries
+        entries[key] = _Entry(value, expires_at)
+        entries.move_to_end(key)
+        self._wheel.schedule(key, expires_at)
+        while len(entries) > self.max_entries:
+            evicted, _ = entries.popitem(last=False)
+            self._wheel.cancel(evicted)
+            self._evictions += 1
+
+    def put(self, token_hash: str | bytes | HashedToken, value: Any, ttl: float) -> None:
+        """
+        Store a record under a token's hash, replacing any existing record.
+
+        Args:
+            token_hash: The token's SHA-256 hash, as returned by the generators
+                (hex), as a raw 32-byte digest, or the HashedToken itself.
+            value: The record to return on lookup, e.g. a user ID or a small dict.
+                It must be JSON-serializable to survive `save`/`load`.
+            ttl: Seconds until the record expires.
+
+        Raises:
+            TypeError: If token_hash is not a hex string, bytes or a HashedToken.
+            ValueError: If token_hash is not a SHA-256 digest or ttl is not a
+                positive, finite number.
+        """
+        key = _key_of(token_hash)
+        if not ttl > 0 or not math.isfinite(ttl):
+            raise ValueError("ttl must be a positive, finite number")
+
+        now = self.clock()
+        with self._lock:
+            self._expire_locked(now)
+            self._insert_locked(key, value, now + ttl)
+
+    def _lookup_locked(self, key: bytes, now: float) -> Any:
+        self._expire_locked(now)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return _MISSING
+        if entry.expires_at <= now:
+            # Due within the current wheel tick
+            del self._entries[key]
+            self._wheel.cancel(key)
+            self._expired += 1
+            self._misses += 1
+            return _MISSING
+        self._hits += 1
+        return entry
+
+    def get(self, plaintext: str | bytes, default: Any = None) -> Any:
+        """
+        Return the live record for a presented token, or `default`.
+
+        Raises:
+            TypeError: If plaintext is not a string or bytes.
+        """
+        key = _digest(plaintext)
+        now = self.clock()
+        with self._lock:
+            entry = self._lookup_locked(key, now)
+            if entry is _MISSING:
+                return default
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def consume(self, plaintext: str | bytes, default: Any = None) -> Any:
+        """
+        Atomically remove and return the live record for a presented token.
+
+        For single-use tokens such as magic links and password resets: of
+        any number of concurrent calls with the same token, exactly one
+        gets the record and the others get `default`.
+
+        Raises:
+            TypeError: If plaintext is not a string or bytes.
+        """
+        key = _digest(plaintext)
+        now = self.clock()
+        with self._lock:
+            entry = self._lookup_locked(key, now)
+            if entry is _MISSING:
+                return default
+            del self._entries[key]
+            self._wheel.cancel(key)
+            self._consumed += 1
+            return entry.value
+
+    def revoke(self, token_hash: str | bytes | HashedToken) -> bool:
+        """
+        Remove a record by its stored hash, e.g. when logging a session out elsewhere.
+
+        Returns:
+            True if a record was removed.
+
+        Raises:
+            TypeError: If token_hash is not a hex string, bytes or a HashedToken.
+            ValueError: If token_hash is not a SHA-256 digest.
+        """
+        key = _key_of(token_hash)
+        with self._lock:
+            if self._entries.pop(key, None) is None:
+                return False
+            self._wheel.cancel(key)
+            return True
+
+    def purge(self) -> int:
+        """
+        Drop every expired record now instead of on the next access.
+
+        Returns:
+            The number of records dropped.
+        """
+        now = self.clock()
+        with self._lock:
+            before = self._expired
+            self._expire_locked(now)
+            stale = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+            for key in stale:
+                del self._entries[key]
+                self._wheel.cancel(key)
+            self._expired += len(stale)
+            return self._expired - before
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._wheel.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return store counters.
+
+        Returns:
+            A dictionary containing 'size', 'max_entries', 'hits', 'misses',
+            'consumed', 'expired' and 'evictions' (live records dropped
+            because the store was full).
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "consumed": self._consumed,
+                "expired": self._expired,
+                "evictions": self._evictions,
+            }
+
+    def save(self, path: str | os.PathLike) -> int:
+        """
+        Write the live records to a JSON file, atomically, for a warm restart.
+
+        Expiry times are stored as wall-clock time, so records keep their
+        remaining lifetime across a restart. The file holds token hashes,
+        not tokens, and is created readable by the owner only.
+
+        Returns:
+            The number of records written.
+
+        Raises:
+            TypeError: If a record value is not JSON-serializable.
+        """
+        now = self.clock()
+        offset = time.time() - now
+        with self._lock:
+            self._expire_locked(now)
+            entries = [
+                [key.hex(), entry.expires_at + offset, entry.value]
+                for key, entry in self._entries.items()
+                if entry.expires_at > now
+            ]
+
+        snapshot = json.dumps({"version": SNAPSHOT_VERSION, "entries": entries}, separators=(",", ":"))
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".tokenstore-")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                handle.write(snapshot)
+                handle.flush()
+                os.fsync(handle.fileno())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        return len(entries)
+
+    def load(self, path: str | os.PathLike) -> int:
+        """
+        Add the records from a file written by `save`, skipping expired ones.
+
+        Records are added in their saved order (least recently used first),
+        so the usual eviction applies if the file holds more than `max_entries`.
+
+        Returns:
+            The number of records loaded.
+
+        Raises:
+            ValueError: If the file is not a TokenStore snapshot.
+        """
+        with open(path, encoding="utf-8") as handle:
+            snapshot = json.load(handle)
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError("not a TokenStore snapshot")
+
+        now = self.clock()
+        offset = now - time.time()
+        loaded = 0
+        with self._lock:
+            self._expire_locked(now)
+            for token_hash, expires_at, value in snapshot["entries"]:
+                expires_at += offset
+                if expires_at > now:
+                    self._insert_locked(_key_of(token_hash), value, expires_at)
+                    loaded += 1
+        return loaded
+
+    def __len__(self) -> int:
+        now = self.clock()
+        with self._lock:
+            self._expire_locked(now)
+            return len(self._entries)
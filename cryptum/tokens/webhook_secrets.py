@@ -1,9 +1,11 @@
-from cryptum.core import urlsafe_entropy, with_prefix
+from typing import Iterator
+from cryptum.core import ITER_CHUNK_SIZE, iter_chunks, urlsafe_entropy, urlsafe_entropy_many, with_prefix, with_prefix_many
 from cryptum.core._constants import ENTROPY_SECRET, PREFIX_WEBHOOK_SECRET
+from cryptum.core._records import EncryptedSecret
 from cryptum.crypto import aes
 
 
-def generate(encryption_secret: str) -> dict[str, str]:
+def generate(encryption_secret: str) -> EncryptedSecret:
     """
     Generate a cryptographically secure webhook secret and encrypt it using AES-256-GCM.
 
@@ -11,14 +13,62 @@ def generate(encryption_secret: str) -> dict[str, str]:
         encryption_secret: The master server-side key used to encrypt the secret.
 
     Returns:
-        A dictionary containing:
+        An EncryptedSecret, also readable as a mapping, containing:
         - 'plaintext': The webhook secret (whs_...)
         - 'encrypted': The AES-256-GCM encrypted Base64 blob.
     """
     plaintext = with_prefix(PREFIX_WEBHOOK_SECRET, urlsafe_entropy(ENTROPY_SECRET))
     encrypted = aes.encrypt(plaintext, encryption_secret)
 
+    return EncryptedSecret(plaintext, encrypted)
+
+
+def generate_many(count: int, encryption_secret: str) -> dict[str, list[str]]:
+    """
+    Generate many webhook secrets, encrypting them with a single derived key.
+
+    Encryption runs through `aes.encrypt_many`, so the key is derived once
+    for the batch and the work is spread over a thread pool.
+
+    Args:
+        count: The number of webhook secrets to generate.
+        encryption_secret: The master server-side key used to encrypt the secrets.
+
+    Returns:
+        A dictionary of parallel lists:
+        - 'plaintext': The webhook secrets (whs_...)
+        - 'encrypted': The AES-256-GCM encrypted Base64 blobs, in the same order.
+
+    Raises:
+        ValueError: If count is not a positive integer.
+    """
+    plaintexts = with_prefix_many(PREFIX_WEBHOOK_SECRET, urlsafe_entropy_many(count, ENTROPY_SECRET))
+
+    encrypted = []
+    for blob in aes.encrypt_many(plaintexts, encryption_secret):
+        if isinstance(blob, Exception):
+            raise blob
+        encrypted.append(blob)
+
     return {
-        "plaintext": plaintext,
+        "plaintext": plaintexts,
         "encrypted": encrypted,
     }
+
+
+def iter_many(count: int, encryption_secret: str, chunk_size: int = ITER_CHUNK_SIZE) -> Iterator[dict[str, list[str]]]:
+    """
+    Generate webhook secrets chunk by chunk; see `iter_chunks`.
+
+    Args:
+        count: The total number of webhook secrets to generate.
+        encryption_secret: The master server-side key used to encrypt the secrets.
+        chunk_size: The maximum number of webhook secrets per chunk.
+
+    Returns:
+        An iterator of `generate_many` results.
+
+    Raises:
+        ValueError: If count or chunk_size is not a positive integer.
+    """
+    return iter_chunks(generate_many, count, chunk_size, encryption_secret)
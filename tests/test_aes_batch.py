@@ -0,0 +1,24 @@
+import pytest
+
+from cryptum.crypto import aes
+
+SECRET = "aes-batch-secret"
+
+
+@pytest.mark.parametrize("batch", [aes.encrypt_many, aes.decrypt_many])
+@pytest.mark.parametrize("chunk_size", [0, -1, 1.5, None])
+def test_invalid_chunk_size_raises_when_called(batch, chunk_size):
+    # Before iteration starts: the call itself must raise
+    with pytest.raises(ValueError):
+        batch(["x"], SECRET, chunk_size=chunk_size)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_round_trip_in_order_with_failures_in_place(max_workers):
+    values = [f"value-{index}" for index in range(100)]
+    blobs = list(aes.encrypt_many(values, SECRET, max_workers=max_workers, chunk_size=7))
+    blobs[10] = blobs[11][:-4] + "AAAA"
+
+    results = list(aes.decrypt_many(blobs, SECRET, max_workers=max_workers, chunk_size=7))
+    assert isinstance(results[10], ValueError)
+    assert results[:10] + results[11:] == values[:10] + values[11:]
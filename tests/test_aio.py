@@ -0,0 +1,59 @@
+import asyncio
+import threading
+
+import pytest
+
+from cryptum import aio
+from cryptum.crypto import Argon2id
+from cryptum.crypto.Argon2id import Argon2Overloaded, Argon2Scheduler
+
+PROFILE = Argon2id.PROFILE_LOW_MEMORY
+
+
+@pytest.fixture
+def scheduler():
+    previous = aio.argon2_scheduler()
+    scheduler = Argon2Scheduler(memory_budget_kib=PROFILE.memory_cost, max_queue=1, timeout=30)
+    aio.configure(scheduler=scheduler)
+    yield scheduler
+    aio.configure(scheduler=previous)
+
+
+def test_argon2_calls_are_admitted_by_the_configured_scheduler(scheduler):
+    async def main():
+        stored = await aio.argon2id_hash("secret", PROFILE)
+        assert await aio.argon2id_verify("secret", stored)
+        assert not await aio.verify_password("wrong", stored)
+        assert await aio.argon2id_verify("secret", "not-a-hash") is False
+
+    asyncio.run(main())
+    stats = scheduler.stats()
+    assert stats["admitted"] == 3
+    assert stats["in_flight_kib"] == 0
+
+
+def test_argon2_calls_beyond_the_queue_are_refused(scheduler):
+    async def main():
+        return await asyncio.gather(
+            *(aio.argon2id_hash("secret", PROFILE) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(main())
+    # One runs, one waits in the single queue slot, the third is refused
+    assert sum(isinstance(result, Argon2Overloaded) for result in results) == 1
+    assert scheduler.stats()["rejected"] == 1
+
+
+def test_scheduler_async_path_runs_on_the_aio_executor(scheduler):
+    async def main():
+        names = []
+        await scheduler._arun(1, None, lambda: names.append(threading.current_thread().name))
+        return names
+
+    assert asyncio.run(main())[0].startswith("cryptum-aio")
+
+
+def test_configure_rejects_a_non_scheduler():
+    with pytest.raises(TypeError):
+        aio.configure(scheduler=object())
@@ -0,0 +1,44 @@
+import multiprocessing
+
+import pytest
+from argon2 import extract_parameters
+
+from cryptum.crypto import Argon2id
+from cryptum.crypto.argon2_pool import Argon2Pool
+
+PROFILE = Argon2id.PROFILE_LOW_MEMORY
+
+
+@pytest.fixture
+def pool():
+    pool = Argon2Pool(processes=2, profiles=(PROFILE,), mp_context=multiprocessing.get_context("spawn"))
+    yield pool
+    pool.shutdown()
+
+
+def test_default_profile_is_resolved_in_the_parent(pool, monkeypatch):
+    # Spawned workers import the module afresh and never see this change
+    monkeypatch.setattr(Argon2id, "DEFAULT_PROFILE", PROFILE)
+
+    for encoded in (pool.hash("secret"), *pool.hash_many(["a", "b"])):
+        assert extract_parameters(encoded).memory_cost == PROFILE.memory_cost
+
+
+def test_verify_many_matches_in_process_verify(pool):
+    pairs = [(secret, Argon2id.hash(secret, PROFILE)) for secret in ("a", "b", "c")]
+    pairs.append(("wrong", pairs[0][1]))
+
+    assert pool.verify_many(pairs) == [Argon2id.verify(secret, encoded) for secret, encoded in pairs]
+
+
+@pytest.mark.parametrize("processes", [0, -1, 1.5])
+def test_non_positive_processes_are_rejected(processes):
+    with pytest.raises(ValueError):
+        Argon2Pool(processes=processes)
+
+
+def test_default_processes_is_the_cpu_count(monkeypatch):
+    monkeypatch.setattr(Argon2Pool, "_start", lambda self: None)
+    monkeypatch.setattr("os.cpu_count", lambda: 3)
+
+    assert Argon2Pool().processes == 3
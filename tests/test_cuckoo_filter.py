@@ -0,0 +1,173 @@
+import hashlib
+import struct
+import sys
+
+import pytest
+
+from cryptum.core import CuckooFilter
+from cryptum.core import _filters
+from cryptum.core._records import HashedToken
+
+
+def _items(count, prefix="item"):
+    return [f"{prefix}-{index}" for index in range(count)]
+
+
+@pytest.fixture
+def saved(tmp_path):
+    cuckoo = CuckooFilter(10_000)
+    for item in _items(5000):
+        cuckoo.add(item)
+    path = tmp_path / "seen.ckf"
+    cuckoo.save(path)
+    return path
+
+
+# --- Membership ---------------------------------------------------------------
+
+@pytest.mark.parametrize("fingerprint_size", [1, 2, 4])
+def test_no_false_negatives(fingerprint_size):
+    cuckoo = CuckooFilter(20_000, fingerprint_size=fingerprint_size)
+    items = _items(20_000)
+    for item in items:
+        cuckoo.add(item)
+
+    assert all(item in cuckoo for item in items)
+    assert len(cuckoo) == 20_000
+
+
+def test_false_positive_rate_is_near_the_estimate():
+    cuckoo = CuckooFilter(20_000, fingerprint_size=2)
+    for item in _items(20_000):
+        cuckoo.add(item)
+
+    false_positives = sum(item in cuckoo for item in _items(100_000, prefix="absent"))
+    assert false_positives / 100_000 < 10 * 2 * 4 / 2**16
+
+
+def test_item_forms_are_interchangeable():
+    digest = hashlib.sha256(b"token").digest()
+    cuckoo = CuckooFilter(100)
+    cuckoo.add(digest.hex())
+
+    assert digest in cuckoo
+    assert HashedToken("token", hash_fn=lambda value: hashlib.sha256(value.encode()).hexdigest()) in cuckoo
+    with pytest.raises(TypeError):
+        cuckoo.add(42)
+
+
+def test_remove():
+    cuckoo = CuckooFilter(1000)
+    items = _items(500)
+    for item in items:
+        cuckoo.add(item)
+
+    assert all(cuckoo.remove(item) for item in items[:250])
+    assert len(cuckoo) == 250
+    assert all(item in cuckoo for item in items[250:])
+    assert sum(item in cuckoo for item in items[:250]) < 5
+
+
+def test_duplicates_are_stored_twice():
+    cuckoo = CuckooFilter(100)
+    cuckoo.add("twice")
+    cuckoo.add("twice")
+
+    assert cuckoo.remove("twice")
+    assert "twice" in cuckoo
+    assert cuckoo.remove("twice")
+    assert "twice" not in cuckoo
+
+
+def test_full_filter_is_left_unchanged():
+    cuckoo = CuckooFilter(8, fingerprint_size=4)
+    for item in _items(10_000):
+        table, count = bytes(cuckoo._table.cast("B")), len(cuckoo)
+        try:
+            cuckoo.add(item)
+        except ValueError as error:
+            assert "full" in str(error)
+            break
+    else:
+        pytest.fail("the filter never filled up")
+
+    assert bytes(cuckoo._table.cast("B")) == table
+    assert len(cuckoo) == count
+    assert all(other in cuckoo for other in _items(count))
+
+
+@pytest.mark.parametrize("capacity, fingerprint_size", [(0, 2), (-1, 2), (1.5, 2), (10, 3), (10, 8)])
+def test_bad_arguments(capacity, fingerprint_size):
+    with pytest.raises(ValueError):
+        CuckooFilter(capacity, fingerprint_size=fingerprint_size)
+
+
+# --- save and load ------------------------------------------------------------
+
+def test_load_read_only(saved):
+    with CuckooFilter.load(saved) as cuckoo:
+        assert cuckoo.readonly
+        assert len(cuckoo) == 5000
+        assert all(item in cuckoo for item in _items(5000))
+        with pytest.raises(ValueError):
+            cuckoo.add("new")
+        with pytest.raises(ValueError):
+            cuckoo.remove("item-0")
+
+
+def test_load_writable_is_a_private_copy(saved):
+    cuckoo = CuckooFilter.load(saved, writable=True)
+    assert not cuckoo.readonly
+    cuckoo.add("new")
+    assert cuckoo.remove("item-0")
+
+    with CuckooFilter.load(saved) as original:
+        assert len(original) == 5000
+        assert "item-0" in original
+
+
+def test_close_releases_the_mapping(saved):
+    cuckoo = CuckooFilter.load(saved)
+    mapping = cuckoo._mapping
+    cuckoo.close()
+    cuckoo.close()
+
+    assert mapping.closed
+    with pytest.raises(ValueError):
+        "item-0" in cuckoo
+
+
+def _corrupt(path, offset, value):
+    data = bytearray(path.read_bytes())
+    data[offset:offset + len(value)] = value
+    path.write_bytes(bytes(data))
+
+
+@pytest.mark.parametrize("offset, value", [
+    (0, b"XXXX"),                            # magic
+    (4, bytes([3])),                         # fingerprint size
+    (5, bytes([8])),                         # slots per bucket
+    (6, bytes([7])),                         # byte order
+    (8, struct.pack("<Q", 3)),               # bucket count not a power of two
+    (8, struct.pack("<Q", 1 << 20)),         # bucket count does not match the table
+])
+@pytest.mark.parametrize("writable", [False, True])
+def test_corrupt_headers_are_rejected(saved, offset, value, writable):
+    _corrupt(saved, offset, value)
+    with pytest.raises(ValueError, match="not a cuckoo filter"):
+        CuckooFilter.load(saved, writable=writable)
+
+
+def test_truncated_files_are_rejected(saved):
+    data = saved.read_bytes()
+    for size in (10, len(data) - 1):
+        saved.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            CuckooFilter.load(saved)
+
+
+def test_other_byte_order_is_rejected(saved):
+    other = _filters._BYTE_ORDERS.index("big" if sys.byteorder == "little" else "little")
+    _corrupt(saved, 6, bytes([other]))
+    with pytest.raises(ValueError, match="byte order"):
+        CuckooFilter.load(saved)
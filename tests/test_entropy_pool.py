@@ -0,0 +1,51 @@
+import threading
+import time
+
+import pytest
+
+import cryptum
+from cryptum.core import _entropy
+
+
+@pytest.fixture(autouse=True)
+def _pool_off():
+    yield
+    cryptum.disable_entropy_pool()
+
+
+def test_pool_serves_distinct_bytes_and_wipes_them():
+    cryptum.enable_entropy_pool(256)
+
+    drawn = [cryptum.bytes_entropy(16) for _ in range(64)]
+    assert len(set(drawn)) == len(drawn)
+    state = _entropy._pool_local.state
+    assert bytes(state.view[:state.offset]) == bytes(state.offset)
+
+
+def test_resizing_the_pool_while_other_threads_draw():
+    # A thread mid-draw with the old, larger block must never be paired
+    # with the new, shorter zero buffer
+    errors = []
+    stop = threading.Event()
+
+    def draw():
+        try:
+            while not stop.is_set():
+                for size in (16, 32, 64, 256):
+                    assert len(cryptum.bytes_entropy(size)) == size
+        except Exception as error:  # noqa: BLE001 - reported by the main thread
+            errors.append(error)
+
+    threads = [threading.Thread(target=draw) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 1.0
+    while time.monotonic() < deadline:
+        cryptum.enable_entropy_pool(4096)
+        cryptum.enable_entropy_pool(256)
+        cryptum.disable_entropy_pool()
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
@@ -0,0 +1,77 @@
+"""
+Statistical uniformity of random_string(s): rejection sampling must leave no
+modulo bias, including for alphabets whose size does not divide 256.
+"""
+import math
+import os
+import string
+from collections import Counter
+
+import pytest
+
+from cryptum.core import random_string, random_strings
+
+# A uniform sampler fails this about once in 10,000 runs per alphabet
+P_THRESHOLD = 1e-4
+
+ALPHABETS = {
+    "digits": string.digits,                                      # 10
+    "base36": string.digits + string.ascii_lowercase,             # 36
+    "base62": string.digits + string.ascii_letters,               # 62
+    "passwords": string.ascii_letters + string.digits + string.punctuation,  # 94
+}
+
+
+def _chi_square_p_value(counts: Counter, expected: dict[str, float]) -> float:
+    """
+    Upper-tail p-value of Pearson's chi-square statistic.
+
+    Uses the Wilson-Hilferty normal approximation, accurate to well under
+    1% relative error at these degrees of freedom.
+    """
+    statistic = sum((counts[key] - value) ** 2 / value for key, value in expected.items())
+    freedom = len(expected) - 1
+    z = ((statistic / freedom) ** (1 / 3) - (1 - 2 / (9 * freedom))) / math.sqrt(2 / (9 * freedom))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _uniform(alphabet: str, total: int) -> dict[str, float]:
+    return {character: total / len(alphabet) for character in alphabet}
+
+
+@pytest.mark.parametrize("alphabet", ALPHABETS.values(), ids=ALPHABETS.keys())
+def test_random_strings_are_uniform(alphabet):
+    drawn = "".join(random_strings(2_000, 100, alphabet))
+
+    assert set(drawn) <= set(alphabet)
+    assert _chi_square_p_value(Counter(drawn), _uniform(alphabet, len(drawn))) > P_THRESHOLD
+
+
+@pytest.mark.parametrize("alphabet", ALPHABETS.values(), ids=ALPHABETS.keys())
+def test_random_string_is_uniform(alphabet):
+    drawn = random_string(200_000, alphabet)
+
+    assert _chi_square_p_value(Counter(drawn), _uniform(alphabet, len(drawn))) > P_THRESHOLD
+
+
+def test_non_ascii_fallback_is_uniform():
+    alphabet = "αβγδεζηθικλμνξοπρστυφχψω€£¥"  # 27 characters, not ASCII
+    drawn = "".join(random_strings(500, 100, alphabet))
+
+    assert set(drawn) <= set(alphabet)
+    assert _chi_square_p_value(Counter(drawn), _uniform(alphabet, len(drawn))) > P_THRESHOLD
+
+
+def test_repeated_characters_are_weighted():
+    drawn = random_string(100_000, "aab")
+
+    expected = {"a": len(drawn) * 2 / 3, "b": len(drawn) / 3}
+    assert _chi_square_p_value(Counter(drawn), expected) > P_THRESHOLD
+
+
+def test_check_detects_modulo_bias():
+    # The naive byte % 10 mapping favours "0"-"5"; the test above must be able to see that
+    alphabet = ALPHABETS["digits"]
+    drawn = "".join(alphabet[byte % len(alphabet)] for byte in os.urandom(200_000))
+
+    assert _chi_square_p_value(Counter(drawn), _uniform(alphabet, len(drawn))) < P_THRESHOLD
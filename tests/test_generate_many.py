@@ -0,0 +1,88 @@
+import string
+
+import pytest
+
+from cryptum.core import _entropy, hex_entropy_many, iter_chunks, random_strings, urlsafe_entropy_many
+from cryptum.keys import trace_keys
+from cryptum.tokens import api_keys, session_tokens
+
+
+@pytest.fixture
+def small_reads(monkeypatch):
+    reads = []
+    token_bytes = _entropy._token_bytes
+
+    def recording(num_bytes):
+        reads.append(num_bytes)
+        return token_bytes(num_bytes)
+
+    monkeypatch.setattr(_entropy, "BULK_READ_BYTES", 100)
+    monkeypatch.setattr(_entropy, "_token_bytes", recording)
+    return reads
+
+
+@pytest.mark.parametrize("count", [1, 6, 7, 50])
+def test_bulk_reads_are_bounded_and_lengths_exact(small_reads, count):
+    hex_strings = hex_entropy_many(count, 16)
+    urlsafe_strings = urlsafe_entropy_many(count, 16)
+
+    assert [len(value) for value in hex_strings] == [32] * count
+    assert [len(value) for value in urlsafe_strings] == [22] * count
+    assert max(small_reads) <= 100
+    assert sum(small_reads) == 2 * count * 16
+
+
+def test_items_larger_than_one_read_are_still_whole(small_reads):
+    assert [len(value) for value in hex_entropy_many(3, 150)] == [300] * 3
+    assert small_reads == [150, 150, 150]
+
+
+@pytest.mark.parametrize("count", [1, 99, 100, 101, 1000])
+def test_random_strings_across_blocks(monkeypatch, count):
+    monkeypatch.setattr(_entropy, "BULK_READ_BYTES", 100)
+    strings = random_strings(count, 12, string.ascii_letters)
+
+    assert [len(value) for value in strings] == [12] * count
+    assert set("".join(strings)) <= set(string.ascii_letters)
+    assert len(set(strings)) == count
+
+
+@pytest.mark.parametrize("count, chunk_size, sizes", [
+    (10, 3, [3, 3, 3, 1]),
+    (9, 3, [3, 3, 3]),
+    (2, 5, [2]),
+])
+def test_iter_many_chunk_sizes(count, chunk_size, sizes):
+    chunks = list(trace_keys.iter_many(count, chunk_size=chunk_size))
+    assert [len(chunk) for chunk in chunks] == sizes
+
+    tokens = list(session_tokens.iter_many(count, chunk_size=chunk_size))
+    assert [len(chunk["plaintext"]) for chunk in tokens] == sizes
+    assert all(len(chunk["hash"]) == len(chunk["plaintext"]) for chunk in tokens)
+
+
+def test_iter_many_passes_extra_arguments():
+    secret = "iter-many-secret-0123456789abcdef"
+    chunks = list(api_keys.iter_many(5, secret, chunk_size=2))
+
+    assert [len(chunk["plaintext"]) for chunk in chunks] == [2, 2, 1]
+    for chunk in chunks:
+        pairs = zip(chunk["plaintext"], chunk["signature"])
+        assert all(api_keys.verify(key, signature, secret) for key, signature in pairs)
+
+
+@pytest.mark.parametrize("count, chunk_size", [(0, 1), (-1, 1), (1.5, 1), (5, 0), (5, -2), (5, None)])
+def test_iter_many_rejects_bad_arguments_when_called(count, chunk_size):
+    # Before iteration starts: the call itself must raise
+    with pytest.raises(ValueError):
+        trace_keys.iter_many(count, chunk_size=chunk_size)
+
+
+def test_iter_chunks_is_lazy():
+    calls = []
+    chunks = iter_chunks(lambda n: calls.append(n) or [None] * n, 25, 10)
+
+    assert calls == []
+    assert len(next(chunks)) == 10
+    assert calls == [10]
+    assert [len(chunk) for chunk in chunks] == [10, 5]
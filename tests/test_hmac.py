@@ -0,0 +1,39 @@
+import pytest
+
+from cryptum.crypto import hmac
+
+SECRET = "hmac-test-secret"
+MESSAGE = "message"
+SIGNATURE = hmac.sign(MESSAGE, SECRET)
+
+
+def _spaced(signature: str) -> str:
+    return " ".join(signature[index:index + 2] for index in range(0, len(signature), 2))
+
+
+@pytest.mark.parametrize("signature", [
+    SIGNATURE,
+    SIGNATURE.upper(),
+    _spaced(SIGNATURE),
+    SIGNATURE[:62] + " " + SIGNATURE[62:],
+    " " + SIGNATURE,
+    SIGNATURE + "\n",
+    "\t".join([SIGNATURE[:32], SIGNATURE[32:]]),
+    SIGNATURE[:-1],
+    SIGNATURE + "00",
+    SIGNATURE[:-1] + "g",
+    SIGNATURE[:-1] + "é",
+    "",
+    None,
+    b"not a string",
+    SIGNATURE.encode("ascii"),
+])
+def test_signer_verify_matches_module_verify(signature):
+    assert hmac.Signer(SECRET).verify(MESSAGE, signature) == hmac.verify(MESSAGE, SECRET, signature)
+
+
+def test_signer_matches_module_sign():
+    signer = hmac.Signer(SECRET)
+    assert signer.sign(MESSAGE) == SIGNATURE
+    assert signer.sign_many([MESSAGE, b"other"]) == [SIGNATURE, hmac.sign(b"other", SECRET)]
+    assert signer.verify_many([(MESSAGE, SIGNATURE), (MESSAGE, _spaced(SIGNATURE))]) == [True, False]
@@ -0,0 +1,69 @@
+"""
+`import cryptum` must stay cheap: the heavy dependencies load only when the
+features that need them are first used (see the lazy exports in cryptum/__init__.py).
+"""
+import os
+import subprocess
+import sys
+
+import cryptum
+
+HEAVY_MODULES = ("cryptography", "argon2", "jwt")
+
+# Cumulative `-X importtime` of cryptum's own modules, in milliseconds; the
+# best of a few runs is compared, so one slow run does not fail the suite.
+# Override for unusually slow machines.
+IMPORT_BUDGET_MS = float(os.environ.get("CRYPTUM_IMPORT_BUDGET_MS", 75))
+RUNS = 3
+
+SCRIPT = f"""
+import sys
+import cryptum
+cryptum.generate_trace_key
+loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+print(",".join(loaded))
+"""
+
+
+def _import_cryptum() -> tuple[list[str], float]:
+    """
+    Import cryptum in a fresh interpreter; return (heavy modules loaded, cumulative import ms).
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(cryptum.__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [root, os.environ.get("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        capture_output=True, text=True, check=True, env=env,
+    )
+
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level entries only: nested imports are already in their parent's cumulative time
+        if cumulative.strip().isdigit() and not name.startswith("  ") and name.strip().split(".")[0] == "cryptum":
+            total_us += int(cumulative)
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return loaded, total_us / 1000
+
+
+def test_import_does_not_load_heavy_dependencies():
+    loaded, _ = _import_cryptum()
+    assert loaded == []
+
+
+def test_import_time_within_budget():
+    best = min(_import_cryptum()[1] for _ in range(RUNS))
+    assert 0 < best < IMPORT_BUDGET_MS, f"import cryptum took {best:.1f} ms (budget {IMPORT_BUDGET_MS} ms)"
+
+
+def test_budget_check_sees_heavy_imports():
+    # Sanity check of the harness: touching an eager feature loads its dependency
+    root = os.path.dirname(os.path.dirname(os.path.abspath(cryptum.__file__)))
+    env = {**os.environ, "PYTHONPATH": root}
+    output = subprocess.run(
+        [sys.executable, "-c", "import sys, cryptum; cryptum.encrypt; print('cryptography' in sys.modules)"],
+        capture_output=True, text=True, check=True, env=env,
+    ).stdout
+    assert output.strip() == "True"
@@ -0,0 +1,79 @@
+import logging
+
+import pytest
+
+from cryptum import instrumentation
+from cryptum.crypto import aes, hmac
+
+SECRET = "instrumentation-secret"
+
+
+class Broken:
+    def record(self, measurement):
+        raise RuntimeError("exporter is down")
+
+
+@pytest.fixture(autouse=True)
+def no_sinks():
+    instrumentation.clear_sinks()
+    yield
+    instrumentation.clear_sinks()
+
+
+def test_measurements_reach_sinks():
+    registry = instrumentation.MetricsRegistry()
+    instrumentation.add_sink(registry)
+
+    hmac.verify("message", SECRET, hmac.sign("message", SECRET))
+    hmac.verify("message", SECRET, "0" * 64)
+
+    snapshot = registry.snapshot()
+    assert snapshot["hmac.sign"]["count"] == 1
+    assert snapshot["hmac.verify"]["count"] == 2
+    assert snapshot["hmac.verify"]["failures"] == 1
+    assert snapshot["hmac.verify"]["bytes"] == 2 * len("message")
+
+
+def test_raising_sink_keeps_the_result(caplog):
+    registry = instrumentation.MetricsRegistry()
+    instrumentation.add_sink(Broken())
+    instrumentation.add_sink(registry)
+    blob = aes.encrypt("payload", SECRET)
+
+    with caplog.at_level(logging.ERROR, logger="cryptum.instrumentation"):
+        assert aes.decrypt(blob, SECRET) == "payload"
+
+    # The later sink still got the measurement, and the failure was logged
+    assert registry.snapshot()["aes.decrypt"]["count"] == 1
+    assert "aes.decrypt" in caplog.text
+    assert "exporter is down" in caplog.text
+
+
+def test_raising_sink_keeps_the_original_exception():
+    registry = instrumentation.MetricsRegistry()
+    instrumentation.add_sink(Broken())
+    instrumentation.add_sink(registry)
+
+    with pytest.raises(ValueError):
+        aes.decrypt("not-a-ciphertext", SECRET)
+
+    assert registry.snapshot()["aes.decrypt"]["errors"] == {"ValueError": 1}
+
+
+def test_raising_callback_sink_is_isolated():
+    def callback(measurement):
+        raise KeyError(measurement.operation)
+
+    instrumentation.add_sink(instrumentation.CallbackSink(callback))
+    assert hmac.verify("message", SECRET, hmac.sign("message", SECRET)) is True
+
+
+def test_remove_sink_and_bad_sinks():
+    registry = instrumentation.MetricsRegistry()
+    instrumentation.add_sink(registry)
+    instrumentation.remove_sink(registry)
+    hmac.sign("message", SECRET)
+
+    assert registry.snapshot() == {}
+    with pytest.raises(TypeError):
+        instrumentation.add_sink(object())
@@ -0,0 +1,315 @@
+"""
+JWTCodec and the KeyRing path must behave exactly like PyJWT: the same
+tokens byte for byte, the same claims, and the same exception types.
+"""
+import base64
+import json
+import time
+
+import jwt
+import pytest
+
+from cryptum.crypto.keyring import KeyRing
+from cryptum.tokens import jwt_tokens
+from cryptum.tokens.jwt_tokens import DecodeCache, JWTCodec
+
+SECRET = "conformance-secret-0123456789abcdef"
+
+
+def _pyjwt_decode(token, secret=SECRET):
+    return jwt.decode(token, secret, algorithms=["HS256"], options={"require": ["exp", "iat"]})
+
+
+def _outcome(decode, token):
+    """
+    Return ("ok", claims) or ("error", exception type) for a decode call.
+    """
+    try:
+        return "ok", dict(decode(token))
+    except jwt.InvalidTokenError as error:
+        return "error", type(error)
+
+
+def _claims(**overrides):
+    now = int(time.time())
+    claims = {"sub": "user-123", "iat": now, "exp": now + 600}
+    claims.update(overrides)
+    return {key: value for key, value in claims.items() if value is not None}
+
+
+def _assert_same(token, codec=None):
+    codec = codec or JWTCodec(SECRET)
+    expected = _outcome(_pyjwt_decode, token)
+    assert _outcome(codec.decode, token) == expected
+    assert _outcome(lambda value: jwt_tokens.decode(value, SECRET), token) == expected
+    return expected
+
+
+def _forge(claims) -> str:
+    # Signs any JSON, including claim types jwt.encode itself refuses
+    return jwt.api_jws.encode(json.dumps(claims).encode("utf-8"), SECRET, algorithm="HS256")
+
+
+def _tamper(segment: str) -> str:
+    # Flip one bit of the first byte, keeping the encoding canonical
+    raw = bytearray(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    raw[0] ^= 1
+    return base64.urlsafe_b64encode(bytes(raw)).rstrip(b"=").decode("ascii")
+
+
+# --- Encoding -----------------------------------------------------------------
+
+@pytest.mark.parametrize("payload", [
+    {},
+    {"sub": "user-123"},
+    {"sub": "user-123", "roles": ["admin", "ops"], "meta": {"n": 1, "f": 1.5, "none": None}},
+    {"name": "Zoë ✓", "aud": "api"},
+    {"nbf": 0, "iss": "cryptum", "jti": "abc"},
+])
+def test_encode_matches_pyjwt_byte_for_byte(payload):
+    token = JWTCodec(SECRET).encode(payload)
+
+    claims = _pyjwt_decode(token, SECRET) if "aud" not in payload else jwt.decode(
+        token, SECRET, algorithms=["HS256"], audience=payload["aud"]
+    )
+    assert token == jwt.encode(claims, SECRET, algorithm="HS256")
+    assert claims["exp"] - claims["iat"] == 900
+
+
+def test_module_encode_matches_codec():
+    payload = {"sub": "user-123"}
+    token = jwt_tokens.encode(payload, SECRET)
+    claims = _pyjwt_decode(token)
+    assert token == jwt.encode(claims, SECRET, algorithm="HS256")
+
+
+def test_encode_rejects_reserved_claims_like_module_encode():
+    for payload in ({"exp": 1}, {"iat": 1}):
+        with pytest.raises(ValueError):
+            JWTCodec(SECRET).encode(payload)
+        with pytest.raises(ValueError):
+            jwt_tokens.encode(payload, SECRET)
+
+
+# --- Decoding: claims ---------------------------------------------------------
+
+def test_valid_token_decodes_identically():
+    outcome = _assert_same(jwt.encode(_claims(), SECRET, algorithm="HS256"))
+    assert outcome[0] == "ok"
+
+
+def test_expired_token():
+    now = int(time.time())
+    token = jwt.encode(_claims(iat=now - 1000, exp=now - 10), SECRET, algorithm="HS256")
+    assert _assert_same(token) == ("error", jwt.ExpiredSignatureError)
+
+
+def test_future_iat():
+    now = int(time.time())
+    token = jwt.encode(_claims(iat=now + 3600, exp=now + 7200), SECRET, algorithm="HS256")
+    assert _assert_same(token)[0] == "error"
+
+
+@pytest.mark.parametrize("offset", [-60, 3600])
+def test_nbf(offset):
+    token = jwt.encode(_claims(nbf=int(time.time()) + offset), SECRET, algorithm="HS256")
+    _assert_same(token)
+
+
+@pytest.mark.parametrize("aud", ["api", ["api", "web"], ""])
+def test_aud_without_expected_audience(aud):
+    token = jwt.encode(_claims(aud=aud), SECRET, algorithm="HS256")
+    _assert_same(token)
+
+
+@pytest.mark.parametrize("exp", ["soon", 1.5e12, True, False, None, [1], {"at": 1}])
+def test_non_int_exp(exp):
+    claims = _claims()
+    claims["exp"] = exp
+    token = jwt.encode(claims, SECRET, algorithm="HS256")
+    _assert_same(token)
+
+
+@pytest.mark.parametrize("iat", ["now", True, None, 1.5])
+def test_non_int_iat(iat):
+    claims = _claims()
+    claims["iat"] = iat
+    token = jwt.encode(claims, SECRET, algorithm="HS256")
+    _assert_same(token)
+
+
+@pytest.mark.parametrize("claims", [{"sub": 123}, {"jti": 5}, {"iss": 7}])
+def test_non_string_registered_claims(claims):
+    _assert_same(_forge({**_claims(), **claims}))
+
+
+def test_encode_rejects_non_string_iss_like_pyjwt():
+    with pytest.raises(TypeError):
+        jwt.encode({"iss": 7}, SECRET, algorithm="HS256")
+    with pytest.raises(TypeError):
+        JWTCodec(SECRET).encode({"iss": 7})
+
+
+@pytest.mark.parametrize("payload", ["[1, 2]", '"text"', "null", "{bad json"])
+def test_non_object_payloads(payload):
+    token = jwt.api_jws.encode(payload.encode("utf-8"), SECRET, algorithm="HS256")
+    _assert_same(token)
+
+
+# --- Decoding: signature and encoding -----------------------------------------
+
+def test_tampered_signature():
+    header, payload, signature = jwt.encode(_claims(), SECRET, algorithm="HS256").split(".")
+    token = ".".join((header, payload, _tamper(signature)))
+    assert _assert_same(token) == ("error", jwt.InvalidSignatureError)
+
+
+def test_tampered_payload():
+    header, payload, signature = jwt.encode(_claims(), SECRET, algorithm="HS256").split(".")
+    token = ".".join((header, _tamper(payload), signature))
+    assert _assert_same(token)[0] == "error"
+
+
+def test_wrong_secret():
+    token = jwt.encode(_claims(), "another-secret-0123456789abcdef01", algorithm="HS256")
+    assert _assert_same(token) == ("error", jwt.InvalidSignatureError)
+
+
+def test_non_canonical_base64():
+    header, payload, signature = jwt.encode(_claims(), SECRET, algorithm="HS256").split(".")
+    # The last character of a 43-character segment carries 2 unused bits
+    alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+    last = alphabet.index(signature[-1])
+    variants = [
+        signature[:-1] + alphabet[last | 1],
+        signature + "=",
+        signature + "==",
+    ]
+    for variant in variants:
+        if variant != signature:
+            _assert_same(".".join((header, payload, variant)))
+
+
+@pytest.mark.parametrize("token", [
+    "",
+    "not-a-token",
+    "a.b",
+    "a.b.c.d",
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9..",
+    "é.é.é",
+])
+def test_malformed_tokens(token):
+    _assert_same(token)
+
+
+def test_foreign_header_is_verified_like_pyjwt():
+    token = jwt.encode(_claims(), SECRET, algorithm="HS256", headers={"cty": "example"})
+    assert _assert_same(token)[0] == "ok"
+
+
+def test_other_algorithm_is_refused():
+    token = jwt.encode(_claims(), SECRET * 2, algorithm="HS512")
+    assert _assert_same(token)[0] == "error"
+
+
+# --- KeyRing ------------------------------------------------------------------
+
+def test_keyring_tokens_carry_kid_and_match_pyjwt():
+    old, new = "old-secret-0123456789abcdef012345", "new-secret-0123456789abcdef012345"
+    ring = KeyRing({"2024-01": old, "2024-07": new}, active="2024-07")
+
+    token = jwt_tokens.encode({"sub": "user-123"}, ring)
+    assert jwt.get_unverified_header(token)["kid"] == "2024-07"
+    claims = _pyjwt_decode(token, new)
+    assert token == jwt.encode(claims, new, algorithm="HS256", headers={"kid": "2024-07"})
+    assert jwt_tokens.decode(token, ring) == claims
+
+    legacy = jwt.encode(_claims(), old, algorithm="HS256", headers={"kid": "2024-01"})
+    assert jwt_tokens.decode(legacy, ring) == _pyjwt_decode(legacy, old)
+
+
+def test_keyring_refuses_unknown_retired_and_missing_kid():
+    secret = "ring-secret-0123456789abcdef01234"
+    ring = KeyRing({"a": secret, "b": secret}, active="a", retired=["b"])
+
+    for headers in ({"kid": "unknown"}, {"kid": "b"}, None):
+        token = jwt.encode(_claims(), secret, algorithm="HS256", headers=headers)
+        with pytest.raises(jwt.InvalidTokenError):
+            jwt_tokens.decode(token, ring)
+
+
+def test_keyring_claim_errors_match_pyjwt():
+    secret = "ring-secret-0123456789abcdef01234"
+    ring = KeyRing({"a": secret})
+    now = int(time.time())
+    for claims in (_claims(exp=now - 10), _claims(aud="api"), _claims(nbf=now + 3600)):
+        token = jwt.encode(claims, secret, algorithm="HS256", headers={"kid": "a"})
+        expected = _outcome(lambda value: _pyjwt_decode(value, secret), token)
+        assert _outcome(lambda value: jwt_tokens.decode(value, ring), token) == expected
+
+
+# --- DecodeCache --------------------------------------------------------------
+
+def test_cache_hits_return_pyjwt_claims_read_only():
+    cache = DecodeCache()
+    codec = JWTCodec(SECRET, cache=cache)
+    token = codec.encode({"sub": "user-123", "roles": ["admin"]})
+
+    first = codec.decode(token)
+    second = codec.decode(token)
+    assert second is first
+    assert cache.stats()["hits"] == 1
+    assert dict(first) == {**_pyjwt_decode(token), "roles": ("admin",)}
+    with pytest.raises(TypeError):
+        first["sub"] = "someone-else"
+
+
+def test_cache_never_serves_a_token_for_another_secret():
+    cache = DecodeCache()
+    token = JWTCodec(SECRET, cache=cache).encode({"sub": "user-123"})
+    other = JWTCodec("another-secret-0123456789abcdef01", cache=cache)
+
+    with pytest.raises(jwt.InvalidSignatureError):
+        other.decode(token)
+
+
+def test_cache_does_not_cache_failures():
+    cache = DecodeCache()
+    codec = JWTCodec(SECRET, cache=cache)
+    header, payload, signature = codec.encode({"sub": "user-123"}).split(".")
+    token = ".".join((header, payload, _tamper(signature)))
+
+    for _ in range(2):
+        with pytest.raises(jwt.InvalidSignatureError):
+            codec.decode(token)
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_revocation_evicts_and_decodes_again_like_pyjwt():
+    cache = DecodeCache()
+    codec = JWTCodec(SECRET, cache=cache)
+    by_jti = codec.encode({"sub": "user-1", "jti": "token-1"})
+    by_subject = codec.encode({"sub": "user-2"})
+    codec.decode(by_jti)
+    codec.decode(by_subject)
+
+    assert cache.revoke_jti("token-1") == 1
+    assert cache.revoke_subject("user-2") == 1
+    assert cache.stats()["size"] == 0
+
+    # Revocation only evicts: decoding verifies again, exactly like PyJWT
+    hits = cache.stats()["hits"]
+    assert dict(codec.decode(by_jti)) == _pyjwt_decode(by_jti)
+    assert dict(codec.decode(by_subject)) == _pyjwt_decode(by_subject)
+    assert cache.stats()["hits"] == hits
+
+
+def test_cached_entries_expire_with_the_token(monkeypatch):
+    cache = DecodeCache()
+    codec = JWTCodec(SECRET, expiry_seconds=60, cache=cache)
+    token = codec.encode({"sub": "user-123"})
+    codec.decode(token)
+
+    later = time.time() + 120
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert _outcome(codec.decode, token) == ("error", jwt.ExpiredSignatureError)
@@ -0,0 +1,52 @@
+import copy
+import json
+import pickle
+
+import cryptum
+from cryptum.core import EncryptedSecret, HashedToken, SignedToken
+
+
+def test_hashed_token_reads_like_the_old_dict():
+    token = cryptum.generate_session_token()
+
+    assert token["plaintext"] == token.plaintext
+    assert token["hash"] == token.hash
+    assert dict(token) == {"plaintext": token.plaintext, "hash": token.hash}
+    assert token == {"plaintext": token.plaintext, "hash": token.hash}
+    assert token.get("missing") is None
+
+
+def test_to_dict_is_a_plain_json_serializable_dict():
+    token = cryptum.generate_session_token()
+
+    as_dict = token.to_dict()
+    assert type(as_dict) is dict
+    assert json.loads(json.dumps(as_dict)) == {"plaintext": token.plaintext, "hash": token.hash}
+
+    as_dict["user_id"] = 42  # a copy: the record itself is unchanged
+    assert "user_id" not in token
+
+
+def test_signed_token_only_lists_key_id_when_set():
+    assert list(SignedToken("p", "s")) == ["plaintext", "signature"]
+    assert SignedToken("p", "s", "k1").to_dict() == {"plaintext": "p", "signature": "s", "key_id": "k1"}
+
+
+def test_records_are_immutable_and_keep_secrets_out_of_repr():
+    token = EncryptedSecret("secret-value", "blob")
+
+    try:
+        token.plaintext = "other"
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("record was mutated")
+    assert "secret-value" not in repr(token)
+
+
+def test_records_pickle_and_copy():
+    token = HashedToken("p", hash_fn=lambda value: value.upper())
+
+    for clone in (pickle.loads(pickle.dumps(token)), copy.copy(token), copy.deepcopy(token)):
+        assert clone == token
+        assert clone.hash == "P"
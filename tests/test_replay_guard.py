@@ -0,0 +1,75 @@
+from cryptum import ReplayGuard
+from cryptum.tokens import nonce
+
+WINDOW = 300.0
+CAPACITY = 20_000
+ERROR_RATE = 1e-3
+
+
+class FixedClock:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _fresh(count: int) -> list[str]:
+    return nonce.generate_many(count)["plaintext"]
+
+
+def _false_positive_rate(guard: ReplayGuard, probes: list[str]) -> float:
+    return sum(map(guard.seen, probes)) / len(probes)
+
+
+def test_burst_of_capacity_in_one_slice_meets_error_rate():
+    clock = FixedClock(1_000_000.0)
+    guard = ReplayGuard(window=WINDOW, capacity=CAPACITY, error_rate=ERROR_RATE, clock=clock)
+
+    # Every nonce stamped with the same time: all land in a single slice
+    refused = sum(guard.is_replay(value, clock.now) for value in _fresh(CAPACITY))
+
+    assert refused <= CAPACITY * ERROR_RATE * 3
+    assert _false_positive_rate(guard, _fresh(50_000)) <= ERROR_RATE * 3
+    assert guard.stats()["filters"] > 1
+
+
+def test_nonces_spread_over_window_meet_error_rate():
+    clock = FixedClock(1_000_000.0)
+    guard = ReplayGuard(window=WINDOW, capacity=CAPACITY, error_rate=ERROR_RATE, clock=clock)
+
+    values = _fresh(CAPACITY)
+    for position, value in enumerate(values):
+        guard.is_replay(value, clock.now - WINDOW * position / CAPACITY)
+
+    assert _false_positive_rate(guard, _fresh(50_000)) <= ERROR_RATE * 3
+
+
+def test_replays_are_always_caught():
+    clock = FixedClock(1_000_000.0)
+    guard = ReplayGuard(window=WINDOW, capacity=CAPACITY, error_rate=ERROR_RATE, clock=clock)
+
+    values = _fresh(CAPACITY)
+    for value in values:
+        guard.is_replay(value, clock.now)
+
+    assert all(guard.is_replay(value, clock.now) for value in values)
+
+
+def test_memory_stays_bounded_beyond_capacity():
+    clock = FixedClock(1_000_000.0)
+    guard = ReplayGuard(window=WINDOW, capacity=1_000, slices=4, clock=clock)
+
+    for value in _fresh(10_000):
+        guard.is_replay(value, clock.now)
+
+    assert guard.stats()["filters"] == 4
+
+
+def test_stale_timestamps_are_refused():
+    clock = FixedClock(1_000_000.0)
+    guard = ReplayGuard(window=WINDOW, clock=clock)
+
+    assert guard.is_replay(nonce.generate().plaintext, clock.now - WINDOW - 1)
+    assert guard.is_replay(nonce.generate().plaintext, clock.now + WINDOW + 1)
+    assert guard.stats()["stale"] == 2
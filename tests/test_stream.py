@@ -0,0 +1,215 @@
+import io
+import mmap
+
+import pytest
+
+from cryptum.crypto import stream
+
+SECRET = "stream-secret-0123456789abcdef"
+CHUNK = 16
+
+
+def _encrypt(data, chunk_size=CHUNK, context=None):
+    return b"".join(stream.encrypt_stream(data, SECRET, context, chunk_size))
+
+
+def _decrypt(blob, context=None):
+    return b"".join(stream.decrypt_stream(blob, SECRET, context))
+
+
+def _segments(blob):
+    # Split an encrypted stream into its header and per-chunk segments
+    body = blob[stream.HEADER_SIZE:]
+    segment = CHUNK + stream.TAG_SIZE
+    return blob[:stream.HEADER_SIZE], [body[start:start + segment] for start in range(0, len(body), segment)]
+
+
+# --- Round trip ---------------------------------------------------------------
+
+@pytest.mark.parametrize("size", [0, 1, CHUNK - 1, CHUNK, CHUNK + 1, 5 * CHUNK, 5 * CHUNK + 3])
+def test_round_trip(size):
+    data = bytes(index % 256 for index in range(size))
+    blob = _encrypt(data)
+
+    assert _decrypt(blob) == data
+    chunks = max(1, -(-size // CHUNK))
+    assert len(blob) == stream.HEADER_SIZE + size + chunks * stream.TAG_SIZE
+
+
+def test_every_stream_gets_a_fresh_header():
+    assert _encrypt(b"same")[:stream.HEADER_SIZE] != _encrypt(b"same")[:stream.HEADER_SIZE]
+
+
+def test_context_is_bound():
+    blob = _encrypt(b"payload", context="tenant-a")
+    assert _decrypt(blob, context="tenant-a") == b"payload"
+    with pytest.raises(ValueError):
+        _decrypt(blob, context="tenant-b")
+
+
+# --- Sources ------------------------------------------------------------------
+
+def _sources(data):
+    yield "bytes", data
+    yield "bytearray", bytearray(data)
+    yield "memoryview", memoryview(data)
+    yield "file", io.BytesIO(data)
+    yield "iterator", iter([data[start:start + 5] for start in range(0, len(data), 5)])
+
+
+@pytest.mark.parametrize("kind", ["bytes", "bytearray", "memoryview", "file", "iterator"])
+def test_sources_encrypt_and_decrypt(kind):
+    data = b"0123456789" * 7
+    plain_source = dict(_sources(data))[kind]
+    blob = _encrypt(plain_source)
+
+    assert _decrypt(blob) == data
+    assert _decrypt(dict(_sources(blob))[kind]) == data
+
+
+def test_mmap_source(tmp_path):
+    data = b"mapped-" * 20
+    path = tmp_path / "data.enc"
+    path.write_bytes(_encrypt(data))
+
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        assert _decrypt(mapped) == data
+        assert stream.decrypt_range(mapped, SECRET, 30, 10) == data[30:40]
+
+
+def test_short_reads_from_file_objects_are_filled():
+    class Trickle(io.RawIOBase):
+        def __init__(self, data):
+            self._data = io.BytesIO(data)
+
+        def readable(self):
+            return True
+
+        def read(self, n=-1):
+            return self._data.read(min(n, 3))
+
+    data = b"trickle" * 10
+    assert _decrypt(Trickle(_encrypt(Trickle(data)))) == data
+
+
+def test_file_helpers_report_bytes_written():
+    data = b"file-helper" * 9
+    encrypted, decrypted = io.BytesIO(), io.BytesIO()
+
+    written = stream.encrypt_file(data, encrypted, SECRET, chunk_size=CHUNK)
+    assert written == len(encrypted.getvalue())
+    assert stream.decrypt_file(encrypted.getvalue(), decrypted, SECRET) == len(data)
+    assert decrypted.getvalue() == data
+
+
+# --- Tampering and truncation -------------------------------------------------
+
+def test_dropping_final_chunks_is_rejected():
+    header, segments = _segments(_encrypt(b"x" * (4 * CHUNK + 2)))
+    for keep in range(1, len(segments)):
+        with pytest.raises(ValueError):
+            _decrypt(header + b"".join(segments[:keep]))
+
+
+def test_reordered_chunks_are_rejected():
+    header, segments = _segments(_encrypt(b"a" * CHUNK + b"b" * CHUNK + b"c"))
+    with pytest.raises(ValueError):
+        _decrypt(header + segments[1] + segments[0] + segments[2])
+
+
+def test_appended_chunk_is_rejected():
+    header, segments = _segments(_encrypt(b"y" * (2 * CHUNK)))
+    with pytest.raises(ValueError):
+        _decrypt(header + b"".join(segments) + segments[-1])
+
+
+def test_flipped_bit_is_rejected():
+    blob = bytearray(_encrypt(b"z" * (3 * CHUNK)))
+    blob[stream.HEADER_SIZE + CHUNK + stream.TAG_SIZE + 2] ^= 1
+    with pytest.raises(ValueError, match="chunk 1"):
+        _decrypt(bytes(blob))
+
+
+def test_verified_chunks_come_out_before_a_late_failure():
+    header, segments = _segments(_encrypt(b"q" * (3 * CHUNK)))
+    chunks = stream.decrypt_stream(header + b"".join(segments[:2]), SECRET)
+
+    assert next(chunks) == b"q" * CHUNK
+    with pytest.raises(ValueError):
+        next(chunks)
+
+
+@pytest.mark.parametrize("blob", [
+    b"",
+    b"CRS1",
+    b"XXXX" + bytes(stream.HEADER_SIZE - 4),
+])
+def test_bad_headers_raise_when_called(blob):
+    with pytest.raises(ValueError):
+        stream.decrypt_stream(blob, SECRET)
+
+
+def test_header_with_hostile_chunk_size_is_rejected():
+    header = bytearray(_encrypt(b"data")[:stream.HEADER_SIZE])
+    header[4:8] = (stream.MAX_CHUNK_SIZE + 1).to_bytes(4, "big")
+    with pytest.raises(ValueError):
+        stream.decrypt_stream(bytes(header), SECRET)
+
+
+def test_header_without_body_is_truncated():
+    header = _encrypt(b"data")[:stream.HEADER_SIZE]
+    with pytest.raises(ValueError, match="truncated"):
+        _decrypt(header)
+
+
+# --- Eager argument checks ----------------------------------------------------
+
+@pytest.mark.parametrize("chunk_size", [0, -1, 1.5, None, stream.MAX_CHUNK_SIZE + 1])
+def test_invalid_chunk_size_raises_when_called(chunk_size):
+    # Before iteration starts: the call itself must raise
+    with pytest.raises(ValueError):
+        stream.encrypt_stream(b"x", SECRET, chunk_size=chunk_size)
+
+
+def test_invalid_source_raises_when_called():
+    with pytest.raises(TypeError):
+        stream.encrypt_stream(42, SECRET)
+    with pytest.raises(TypeError):
+        stream.decrypt_stream(42, SECRET)
+
+
+# --- decrypt_range ------------------------------------------------------------
+
+@pytest.mark.parametrize("offset, length", [
+    (0, 0), (0, 1), (0, CHUNK), (3, 20), (CHUNK, CHUNK), (CHUNK - 1, 2),
+    (5 * CHUNK - 4, 100), (5 * CHUNK + 2, 1), (5 * CHUNK + 3, 5), (1000, 5),
+])
+def test_decrypt_range_matches_slice(offset, length):
+    data = bytes(range(5 * CHUNK + 3))
+    blob = _encrypt(data)
+
+    assert stream.decrypt_range(blob, SECRET, offset, length) == data[offset:offset + length]
+    assert stream.decrypt_range(io.BytesIO(blob), SECRET, offset, length) == data[offset:offset + length]
+
+
+def test_decrypt_range_from_file_positioned_mid_stream():
+    data = b"positioned" * 8
+    handle = io.BytesIO(b"preamble" + _encrypt(data))
+    handle.seek(len(b"preamble"))
+
+    assert stream.decrypt_range(handle, SECRET, 12, 30) == data[12:42]
+
+
+def test_decrypt_range_detects_truncation_at_the_end():
+    header, segments = _segments(_encrypt(b"r" * (3 * CHUNK)))
+    truncated = header + b"".join(segments[:2])
+
+    assert stream.decrypt_range(truncated, SECRET, 0, 4) == b"rrrr"
+    with pytest.raises(ValueError):
+        stream.decrypt_range(truncated, SECRET, CHUNK, CHUNK)
+
+
+@pytest.mark.parametrize("offset, length", [(-1, 1), (0, -1), (0.5, 1), (0, None)])
+def test_decrypt_range_rejects_bad_ranges(offset, length):
+    with pytest.raises(ValueError):
+        stream.decrypt_range(_encrypt(b"data"), SECRET, offset, length)
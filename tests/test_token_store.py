@@ -0,0 +1,305 @@
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+
+import pytest
+
+from cryptum.core._wheel import TimingWheel
+from cryptum.tokens.store import TokenStore
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _hash(plaintext):
+    return hashlib.sha256(plaintext.encode("utf-8")).hexdigest()
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def store(clock):
+    return TokenStore(max_entries=100, clock=clock)
+
+
+# --- TimingWheel --------------------------------------------------------------
+
+@pytest.mark.parametrize("delay", [1, 63, 64, 65, 64**2 - 1, 64**2, 64**2 + 7, 64**3 + 11])
+def test_wheel_expires_on_time_across_levels(delay):
+    wheel = TimingWheel(1.0, 0)
+    wheel.schedule("key", delay)
+
+    # Steps below the rebuild gap, so keys cascade level by level
+    step = 3000
+    now = 0
+    while now + step < delay:
+        now += step
+        assert wheel.advance(now) == []
+    assert wheel.advance(delay - 1) == []
+    assert wheel.advance(delay) == ["key"]
+    assert len(wheel) == 0
+
+
+def test_wheel_overflow_cascades_at_the_top_boundary():
+    top = 64**4
+    wheel = TimingWheel(1.0, top - 10)
+    wheel.schedule("key", top + 5)
+
+    assert wheel.advance(top + 4) == []
+    assert wheel.advance(top + 5) == ["key"]
+
+
+def test_wheel_large_jump_rebuilds():
+    wheel = TimingWheel(1.0, 0)
+    for index, deadline in enumerate((10, 5000, 10**6, 10**8)):
+        wheel.schedule(index, deadline)
+
+    assert sorted(wheel.advance(10**6)) == [0, 1, 2]
+    assert wheel.advance(10**8 - 1) == []
+    assert wheel.advance(10**8) == [3]
+
+
+def test_wheel_rounds_up_and_never_expires_in_the_past():
+    wheel = TimingWheel(0.5, 10.0)
+    wheel.schedule("late", 5.0)
+    wheel.schedule("fraction", 10.6)
+
+    assert wheel.advance(10.4) == []
+    assert wheel.advance(10.5) == ["late"]
+    assert wheel.advance(10.99) == []
+    assert wheel.advance(11.0) == ["fraction"]
+
+
+def test_wheel_matches_a_brute_force_model():
+    rng = random.Random(1234)
+    wheel = TimingWheel(1.0, 0)
+    model = {}
+    tick = 0
+
+    for _ in range(3000):
+        action = rng.random()
+        key = rng.randrange(200)
+        if action < 0.5:
+            deadline = tick + rng.choice((1, 50, 3000, 300_000, 20_000_000)) * rng.random()
+            wheel.schedule(key, deadline)
+            model[key] = max(math.ceil(deadline), tick + 1)
+        elif action < 0.6:
+            wheel.cancel(key)
+            model.pop(key, None)
+        else:
+            tick += rng.choice((1, 7, 64, 4000, 5000, 300_000))
+            expected = {key for key, deadline in model.items() if deadline <= tick}
+            assert set(wheel.advance(tick)) == expected
+            for key in expected:
+                del model[key]
+        assert len(wheel) == len(model)
+
+
+# --- TokenStore: expiry -------------------------------------------------------
+
+def test_get_until_expiry(store, clock):
+    store.put(_hash("token"), {"user_id": 42}, ttl=30)
+
+    clock.now += 29.5
+    assert store.get("token") == {"user_id": 42}
+    clock.now += 0.5
+    assert store.get("token") is None
+    assert store.stats()["expired"] == 1
+
+
+@pytest.mark.parametrize("ttl", [5, 100, 5000, 400_000])
+def test_expiry_within_and_across_wheel_levels(store, clock, ttl):
+    store.put(_hash("token"), "value", ttl=ttl)
+
+    # Walk the clock in steps below the rebuild gap
+    deadline = clock.now + ttl
+    while clock.now + 3000 < deadline:
+        clock.now += 3000
+        assert len(store) == 1
+    clock.now = deadline - 0.01
+    assert store.get("token") == "value"
+    clock.now = deadline
+    assert len(store) == 0
+
+
+def test_large_clock_jump(store, clock):
+    store.put(_hash("short"), 1, ttl=10)
+    store.put(_hash("long"), 2, ttl=10**7)
+
+    clock.now += 10**6
+    assert store.get("short") is None
+    assert store.get("long") == 2
+    assert store.stats()["expired"] == 1
+
+
+def test_expired_between_ticks_is_never_returned(clock):
+    store = TokenStore(resolution=60, clock=clock)
+    store.put(_hash("token"), "value", ttl=1)
+
+    clock.now += 1
+    assert store.get("token") is None
+
+
+def test_purge(store, clock):
+    for index in range(10):
+        store.put(_hash(f"token-{index}"), index, ttl=10 + index)
+    clock.now += 15
+
+    assert store.purge() == 6
+    assert len(store) == 4
+
+
+@pytest.mark.parametrize("ttl", [0, -1, math.inf, -math.inf, math.nan])
+def test_put_rejects_bad_ttl(store, ttl):
+    with pytest.raises(ValueError):
+        store.put(_hash("token"), "value", ttl=ttl)
+    assert len(store) == 0
+
+
+@pytest.mark.parametrize("token_hash, error", [
+    ("abc", ValueError),
+    (b"short", ValueError),
+    (123, TypeError),
+])
+def test_put_rejects_bad_hashes(store, token_hash, error):
+    with pytest.raises(error):
+        store.put(token_hash, "value", ttl=10)
+
+
+# --- TokenStore: consume, revoke, eviction ------------------------------------
+
+def test_consume_is_single_use(store):
+    store.put(_hash("link"), "value", ttl=60)
+
+    assert store.consume("link") == "value"
+    assert store.consume("link", default="gone") == "gone"
+    assert store.get("link") is None
+    assert store.stats()["consumed"] == 1
+
+
+def test_consume_under_contention_has_one_winner(store):
+    store.put(_hash("link"), "value", ttl=60)
+    results = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        results.append(store.consume("link"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results.count("value") == 1
+    assert results.count(None) == 7
+
+
+def test_revoke(store):
+    store.put(_hash("session"), "value", ttl=60)
+
+    assert store.revoke(_hash("session")) is True
+    assert store.revoke(bytes.fromhex(_hash("session"))) is False
+    assert store.get("session") is None
+
+
+def test_eviction_at_max_entries(clock):
+    store = TokenStore(max_entries=3, clock=clock)
+    for name in ("a", "b", "c"):
+        store.put(_hash(name), name, ttl=60)
+    store.get("a")  # now most recently used
+
+    store.put(_hash("d"), "d", ttl=60)
+    assert store.get("b") is None
+    assert [store.get(name) for name in ("a", "c", "d")] == ["a", "c", "d"]
+
+    stats = store.stats()
+    assert stats["size"] == 3
+    assert stats["max_entries"] == 3
+    assert stats["evictions"] == 1
+    assert stats["expired"] == 0
+
+
+def test_evicted_records_do_not_expire_later(clock):
+    store = TokenStore(max_entries=1, clock=clock)
+    store.put(_hash("old"), "old", ttl=5)
+    store.put(_hash("new"), "new", ttl=60)
+
+    clock.now += 10
+    assert store.get("new") == "new"
+    assert store.stats()["expired"] == 0
+
+
+# --- TokenStore: save and load ------------------------------------------------
+
+def test_save_and_load_keep_remaining_lifetimes(tmp_path, clock):
+    path = tmp_path / "tokens.json"
+    store = TokenStore(clock=clock)
+    store.put(_hash("short"), {"n": 1}, ttl=10)
+    store.put(_hash("long"), {"n": 2}, ttl=100)
+    store.put(_hash("gone"), {"n": 3}, ttl=1)
+    clock.now += 5
+
+    assert store.save(path) == 2
+    assert (path.stat().st_mode & 0o777) == 0o600
+
+    # A new process with an unrelated monotonic clock
+    restarted_clock = Clock(now=50.0)
+    restored = TokenStore(clock=restarted_clock)
+    assert restored.load(path) == 2
+    assert restored.get("short") == {"n": 1}
+
+    restarted_clock.now += 4.9
+    assert restored.get("short") == {"n": 1}
+    restarted_clock.now += 0.2
+    assert restored.get("short") is None
+    assert restored.get("long") == {"n": 2}
+
+
+def test_load_skips_records_that_expired_while_down(tmp_path, clock, monkeypatch):
+    path = tmp_path / "tokens.json"
+    store = TokenStore(clock=clock)
+    store.put(_hash("token"), "value", ttl=10)
+    store.save(path)
+
+    wall = time.time() + 60
+    monkeypatch.setattr(time, "time", lambda: wall)
+    assert TokenStore(clock=Clock()).load(path) == 0
+
+
+def test_load_applies_eviction(tmp_path, clock):
+    path = tmp_path / "tokens.json"
+    store = TokenStore(clock=clock)
+    for index in range(5):
+        store.put(_hash(f"token-{index}"), index, ttl=60)
+    store.save(path)
+
+    small = TokenStore(max_entries=2, clock=Clock())
+    small.load(path)
+    assert [small.get(f"token-{index}") for index in range(5)] == [None, None, None, 3, 4]
+
+
+def test_load_rejects_other_files(tmp_path, store):
+    path = tmp_path / "other.json"
+    path.write_text(json.dumps({"version": 99, "entries": []}))
+    with pytest.raises(ValueError):
+        store.load(path)
+
+
+def test_save_rejects_unserializable_values(tmp_path, store):
+    store.put(_hash("token"), object(), ttl=60)
+    with pytest.raises(TypeError):
+        store.save(tmp_path / "tokens.json")
+    assert list(tmp_path.iterdir()) == []